@@ -0,0 +1,39 @@
+import matplotlib.pyplot as plt
+
+# Graphiques des résultats. Ce module est le seul à importer Matplotlib : les
+# solveurs l'importent uniquement quand un graphique est demandé.
+
+
+def tracer_historique(historique, titre, xlabel, ylabel):
+    """Évolution de la meilleure distance d'un solveur (Historique ou liste)."""
+    plt.figure(figsize=(10,6))
+    if hasattr(historique, "abscisses"):
+        plt.plot(historique.abscisses(), historique.valeurs(), linewidth=2)
+    else:
+        plt.plot(historique, linewidth=2)
+    plt.title(titre)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.grid(True, alpha=0.3)
+    plt.show()
+
+
+def tracer_comparaison(resultats, nb_generations=200):
+    """Historiques des AG et du recuit simulé (dernier de resultats), abscisses du recuit normalisées."""
+    hist_rs = resultats[-1][2]
+
+    plt.figure(figsize=(14, 8))
+    for nom, _, hist in resultats[:-1]:  # AG
+        plt.plot(hist, label=nom, linewidth=2)
+
+    # Recuit simulé (normaliser X)
+    x_rs = [i * (nb_generations / len(hist_rs)) for i in range(len(hist_rs))]
+    plt.plot(x_rs, hist_rs, label="Recuit Simulé", linewidth=2, linestyle='--')
+
+    plt.title("Comparaison des Algorithmes - TSP", fontsize=16, fontweight='bold')
+    plt.xlabel("Génération / Itération normalisée", fontsize=12)
+    plt.ylabel("Distance minimale", fontsize=12)
+    plt.legend(fontsize=10)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.show()
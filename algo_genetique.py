@@ -1,41 +1,458 @@
 import random
-import matplotlib.pyplot as plt
-from utils import calculer_distance
-from selection_rang import selection_par_rang
-from selection_roulette import selection_par_roulette
+from time import perf_counter_ns
+from utils import CacheDistances, en_matrice_numpy, est_tableau_numpy, evaluer_population, voisins_proches
+from recherche_locale import ameliorer_chemin
+from initialisation import population_initiale
+from population import (PopulationCompacte, chemins_depuis_octets, octets_chemins,
+                        population_compacte_utile)
+from reprise import EcrivainReprise, charger_reprise
+from historique import Historique
+from selection_rang import selection_par_rang_lot
+from selection_roulette import selection_par_roulette_lot
+from selection_tournoi import selection_par_tournoi
+from selection_sus import selection_sus
+
+# Taille des listes de plus proches voisins (EAX et recherche locale)
+NB_VOISINS = 10
 
 # Croisements
+# Les villes étant numérotées 0..n-1, l'appartenance se teste en O(1) dans un
+# bytearray de marquage : chaque croisement est en O(n).
 def croisement_un_point(parent1, parent2):
     point = random.randint(1, len(parent1) - 2)
     partie1 = parent1[:point]
-    partie2 = [v for v in parent2 if v not in partie1]
+    vues = bytearray(len(parent1))
+    for v in partie1:
+        vues[v] = 1
+    partie2 = [v for v in parent2 if not vues[v]]
     return partie1 + partie2
 
 def croisement_deux_points(parent1, parent2):
     a, b = sorted(random.sample(range(len(parent1)), 2))
     segment = parent1[a:b]
-    base = [v for v in parent2 if v not in segment]
+    dans_segment = bytearray(len(parent1))
+    for v in segment:
+        dans_segment[v] = 1
+    base = [v for v in parent2 if not dans_segment[v]]
     return base[:a] + segment + base[a:]
 
 def croisement_uniforme(parent1, parent2):
     masque = [random.randint(0,1) for _ in range(len(parent1))]
     enfant_temp = [parent1[i] if masque[i] else parent2[i] for i in range(len(parent1))]
-    villes_vues = set()
+    villes_vues = bytearray(len(parent1))
     enfant_final = []
     for v in enfant_temp:
-        if v not in villes_vues:
-            villes_vues.add(v)
+        if not villes_vues[v]:
+            villes_vues[v] = 1
             enfant_final.append(v)
     for v in parent1:
-        if v not in villes_vues:
+        if not villes_vues[v]:
             enfant_final.append(v)
     return enfant_final
 
+def croisement_ox(parent1, parent2):
+    """Order crossover : segment de parent1, le reste dans l'ordre de parent2 à partir de la 2e coupure."""
+    n = len(parent1)
+    a, b = sorted(random.sample(range(n), 2))
+    enfant = parent1[:]
+    dans_segment = bytearray(n)
+    for v in parent1[a:b]:
+        dans_segment[v] = 1
+    position = b % n
+    for k in range(n):
+        v = parent2[(b + k) % n]
+        if not dans_segment[v]:
+            enfant[position] = v
+            position = (position + 1) % n
+    return enfant
+
+def croisement_pmx(parent1, parent2):
+    """Partially mapped crossover : segment de parent1, conflits résolus par la correspondance du segment."""
+    n = len(parent1)
+    a, b = sorted(random.sample(range(n), 2))
+    enfant = parent2[:]
+    dans_segment = bytearray(n)
+    position_parent1 = [0] * n
+    for k in range(a, b):
+        v = parent1[k]
+        enfant[k] = v
+        dans_segment[v] = 1
+        position_parent1[v] = k
+    for k in list(range(a)) + list(range(b, n)):
+        v = parent2[k]
+        while dans_segment[v]:
+            v = parent2[position_parent1[v]]
+        enfant[k] = v
+    return enfant
+
+def _adjacences(parent):
+    n = len(parent)
+    adjacences = [None] * n
+    for k, v in enumerate(parent):
+        adjacences[v] = (parent[k - 1], parent[(k + 1) % n])
+    return adjacences
+
+def croisement_erx(parent1, parent2):
+    """Edge recombination : on suit les arêtes des parents en privilégiant les villes les moins connectées."""
+    n = len(parent1)
+    adj1, adj2 = _adjacences(parent1), _adjacences(parent2)
+    voisins = [set(adj1[v] + adj2[v]) for v in range(n)]
+    # Villes restantes, retrait en O(1) par échange avec la dernière
+    restantes = list(range(n))
+    indice = list(range(n))
+
+    def retirer(v):
+        i, dernier = indice[v], restantes[-1]
+        restantes[i], indice[dernier] = dernier, i
+        restantes.pop()
+        for w in voisins[v]:
+            voisins[w].discard(v)
+
+    ville = parent1[0]
+    enfant = [ville]
+    retirer(ville)
+    while restantes:
+        if voisins[ville]:
+            plus_petit = min(len(voisins[w]) for w in voisins[ville])
+            ville = random.choice([w for w in voisins[ville] if len(voisins[w]) == plus_petit])
+        else:
+            ville = random.choice(restantes)
+        enfant.append(ville)
+        retirer(ville)
+    return enfant
+
+def _cycles_ab(adj1, adj2):
+    """AB-cycles : cycles alternant arêtes de A (parent1) et de B (parent2) hors arêtes communes."""
+    n = len(adj1)
+    reste = ([[w for w in adj1[v] if w not in adj2[v]] for v in range(n)],
+             [[w for w in adj2[v] if w not in adj1[v]] for v in range(n)])
+    cycles = []
+    for depart in range(n):
+        while reste[0][depart]:
+            sommets = [depart]
+            aretes = []
+            # (sommet, type de la prochaine arête) -> indice dans le chemin
+            etapes = {}
+            ville, type_arete = depart, 0
+            while True:
+                if (ville, type_arete) in etapes:
+                    # Retour sur une étape compatible : on détache le cycle alternant
+                    i = etapes[(ville, type_arete)]
+                    cycles.append(aretes[i:])
+                    for k in range(i, len(aretes)):
+                        del etapes[(sommets[k], aretes[k][2])]
+                    aretes, sommets = aretes[:i], sommets[:i + 1]
+                    if not aretes:
+                        break
+                if not reste[type_arete][ville]:
+                    break
+                suivante = random.choice(reste[type_arete][ville])
+                reste[type_arete][ville].remove(suivante)
+                reste[type_arete][suivante].remove(ville)
+                etapes[(ville, type_arete)] = len(aretes)
+                aretes.append((ville, suivante, type_arete))
+                sommets.append(suivante)
+                ville, type_arete = suivante, 1 - type_arete
+    return cycles
+
+def croisement_eax(parent1, parent2, matrice, voisins=None):
+    """Edge assembly crossover (une seule AB-cycle, stratégie aléatoire).
+
+    Les sous-tours créés sont reliés par l'échange d'arêtes le moins coûteux,
+    cherché parmi les plus proches voisins si des listes de candidats sont fournies.
+    """
+    n = len(parent1)
+    adj1, adj2 = _adjacences(parent1), _adjacences(parent2)
+    cycles = _cycles_ab(adj1, adj2)
+    if not cycles:
+        return parent1[:]
+
+    # Intermédiaire : A - (arêtes A du cycle) + (arêtes B du cycle)
+    adjacence = [list(paire) for paire in adj1]
+    cycle = random.choice(cycles)
+    for u, v, type_arete in cycle:
+        if type_arete == 0:
+            adjacence[u].remove(v)
+            adjacence[v].remove(u)
+    for u, v, type_arete in cycle:
+        if type_arete == 1:
+            adjacence[u].append(v)
+            adjacence[v].append(u)
+
+    # Étiquetage des sous-tours
+    composante = [-1] * n
+    membres = []
+    for debut in range(n):
+        if composante[debut] < 0:
+            c = len(membres)
+            liste = []
+            precedente, ville = None, debut
+            while composante[ville] < 0:
+                composante[ville] = c
+                liste.append(ville)
+                a, b = adjacence[ville]
+                precedente, ville = ville, (b if a == precedente else a)
+            membres.append(liste)
+
+    actives = set(range(len(membres)))
+    while len(actives) > 1:
+        c = min(actives, key=lambda k: len(membres[k]))
+        meilleur = None
+        for recherche_complete in (False, True):
+            for u in membres[c]:
+                candidats = range(n) if recherche_complete or voisins is None else voisins[u]
+                for v in candidats:
+                    if composante[v] == c:
+                        continue
+                    for u2 in adjacence[u]:
+                        for v2 in adjacence[v]:
+                            gain = matrice[u][v] + matrice[u2][v2] - matrice[u][u2] - matrice[v][v2]
+                            if meilleur is None or gain < meilleur[0]:
+                                meilleur = (gain, u, u2, v, v2)
+            if meilleur is not None:
+                break
+        _, u, u2, v, v2 = meilleur
+        adjacence[u].remove(u2)
+        adjacence[u2].remove(u)
+        adjacence[v].remove(v2)
+        adjacence[v2].remove(v)
+        adjacence[u].append(v)
+        adjacence[v].append(u)
+        adjacence[u2].append(v2)
+        adjacence[v2].append(u2)
+        cible = composante[v]
+        for w in membres[c]:
+            composante[w] = cible
+        membres[cible].extend(membres[c])
+        actives.discard(c)
+
+    # Lecture du tour à partir des adjacences
+    enfant = [parent1[0]]
+    precedente, ville = None, parent1[0]
+    for _ in range(n - 1):
+        a, b = adjacence[ville]
+        precedente, ville = ville, (b if a == precedente else a)
+        enfant.append(ville)
+    return enfant
+
+# Croisements vectorisés (population compacte)
+# Mêmes tirages et mêmes enfants que les versions listes, écrits directement
+# dans la ligne enfant du tampon de la génération suivante.
+def _marquer(villes, n):
+    import numpy as np
+    marque = np.zeros(n, dtype=bool)
+    marque[villes] = True
+    return marque
+
+def croisement_un_point_tableau(parent1, parent2, enfant):
+    point = random.randint(1, len(parent1) - 2)
+    enfant[:point] = parent1[:point]
+    enfant[point:] = parent2[~_marquer(parent1[:point], len(parent1))[parent2]]
+
+def croisement_deux_points_tableau(parent1, parent2, enfant):
+    a, b = sorted(random.sample(range(len(parent1)), 2))
+    base = parent2[~_marquer(parent1[a:b], len(parent1))[parent2]]
+    enfant[:a] = base[:a]
+    enfant[a:b] = parent1[a:b]
+    enfant[b:] = base[a:]
+
+def croisement_uniforme_tableau(parent1, parent2, enfant):
+    import numpy as np
+    n = len(parent1)
+    masque = np.array([random.randint(0,1) for _ in range(n)], dtype=bool)
+    enfant_temp = np.where(masque, parent1, parent2)
+    # Premières occurrences, dans l'ordre, puis les villes manquantes dans l'ordre de parent1
+    _, premieres = np.unique(enfant_temp, return_index=True)
+    gardees = enfant_temp[np.sort(premieres)]
+    enfant[:len(gardees)] = gardees
+    enfant[len(gardees):] = parent1[~_marquer(gardees, n)[parent1]]
+
+def croisement_ox_tableau(parent1, parent2, enfant):
+    import numpy as np
+    n = len(parent1)
+    a, b = sorted(random.sample(range(n), 2))
+    enfant[a:b] = parent1[a:b]
+    reste = np.roll(parent2, -b)
+    reste = reste[~_marquer(parent1[a:b], n)[reste]]
+    enfant[(b + np.arange(len(reste))) % n] = reste
+
+def croisement_pmx_tableau(parent1, parent2, enfant):
+    import numpy as np
+    n = len(parent1)
+    a, b = sorted(random.sample(range(n), 2))
+    dans_segment = _marquer(parent1[a:b], n)
+    position_parent1 = np.zeros(n, dtype=np.intp)
+    position_parent1[parent1[a:b]] = np.arange(a, b)
+    dehors = np.r_[0:a, b:n]
+    villes = parent2[dehors]
+    # Chaque conflit suit sa chaîne de correspondances, toutes les chaînes à la fois
+    conflits = dans_segment[villes]
+    while conflits.any():
+        villes[conflits] = parent2[position_parent1[villes[conflits]]]
+        conflits = dans_segment[villes]
+    enfant[a:b] = parent1[a:b]
+    enfant[dehors] = villes
+
+CROISEMENTS_TABLEAU = {
+    "1point": croisement_un_point_tableau,
+    "2points": croisement_deux_points_tableau,
+    "uniforme": croisement_uniforme_tableau,
+    "ox": croisement_ox_tableau,
+    "pmx": croisement_pmx_tableau,
+}
+
 #  Mutation
 def mutation(chemin):
     i, j = random.sample(range(len(chemin)), 2)
     chemin[i], chemin[j] = chemin[j], chemin[i]
 
+# Une génération : élitisme, sélection, croisement, mutation
+def generation_suivante(
+    population,
+    distances,
+    proba_croisement=0.8,
+    proba_mutation=0.05,
+    methode_selection="roulette",
+    methode_croisement="2points",
+    taille_tournoi=3,
+    methode_roulette="bisect",
+    matrice=None,
+    voisins=None,
+    recherche_locale=None,
+    proba_recherche_locale=0.1,
+    stats=None
+):
+    taille_population = len(population)
+    aptitudes = [1 / d for d in distances]
+
+    # Population compacte : les enfants sont écrits en place dans le second tampon
+    compacte = isinstance(population, PopulationCompacte)
+
+    # Élitisme : conserver le meilleur
+    indice_meilleur = min(range(taille_population), key=distances.__getitem__)
+    if compacte:
+        population.copier(indice_meilleur, 0)
+    else:
+        nouvelle_population = [population[indice_meilleur][:]]
+
+    # Sélection : tous les parents de la génération en un seul appel
+    if stats is not None:
+        debut = perf_counter_ns()
+    nb_parents = 2 * (taille_population - 1)
+    if methode_selection == "roulette":
+        indices_parents = selection_par_roulette_lot(aptitudes, nb_parents, methode_roulette)
+    elif methode_selection == "tournoi":
+        indices_parents = selection_par_tournoi(aptitudes, nb_parents, taille_tournoi)
+    elif methode_selection == "sus":
+        indices_parents = selection_sus(aptitudes, nb_parents)
+    else:
+        indices_parents = selection_par_rang_lot(aptitudes, nb_parents)
+    if stats is not None:
+        stats.ajouter_temps("selection", debut)
+
+    for k in range(0, nb_parents, 2):
+        parent1 = population[indices_parents[k]]
+        parent2 = population[indices_parents[k + 1]]
+        if stats is not None:
+            debut = perf_counter_ns()
+
+        # Croisement
+        if compacte:
+            enfant = population.emplacement(k // 2 + 1)
+            if random.random() >= proba_croisement:
+                enfant[:] = parent1
+            elif methode_croisement == "erx":
+                enfant[:] = croisement_erx(parent1.tolist(), parent2.tolist())
+            elif methode_croisement == "eax":
+                enfant[:] = croisement_eax(parent1.tolist(), parent2.tolist(), matrice, voisins)
+            else:
+                CROISEMENTS_TABLEAU.get(methode_croisement, croisement_uniforme_tableau)(
+                    parent1, parent2, enfant)
+        elif random.random() < proba_croisement:
+            if methode_croisement == "1point":
+                enfant = croisement_un_point(parent1, parent2)
+            elif methode_croisement == "2points":
+                enfant = croisement_deux_points(parent1, parent2)
+            elif methode_croisement == "ox":
+                enfant = croisement_ox(parent1, parent2)
+            elif methode_croisement == "pmx":
+                enfant = croisement_pmx(parent1, parent2)
+            elif methode_croisement == "erx":
+                enfant = croisement_erx(parent1, parent2)
+            elif methode_croisement == "eax":
+                enfant = croisement_eax(parent1, parent2, matrice, voisins)
+            else:
+                enfant = croisement_uniforme(parent1, parent2)
+        else:
+            enfant = parent1[:]
+        if stats is not None:
+            stats.ajouter_temps("croisement", debut)
+            debut = perf_counter_ns()
+
+        # Mutation
+        if random.random() < proba_mutation:
+            mutation(enfant)
+        if stats is not None:
+            stats.ajouter_temps("mutation", debut)
+
+        # Étape mémétique : optimum local d'une partie des enfants
+        if recherche_locale and random.random() < proba_recherche_locale:
+            if stats is not None:
+                debut = perf_counter_ns()
+            if compacte:
+                enfant[:] = ameliorer_chemin(enfant.tolist(), matrice, recherche_locale, voisins=voisins)[0]
+            else:
+                enfant, _ = ameliorer_chemin(enfant, matrice, recherche_locale, voisins=voisins)
+            if stats is not None:
+                stats.ajouter_temps("recherche_locale", debut)
+
+        if not compacte:
+            nouvelle_population.append(enfant)
+
+    if compacte:
+        population.echanger_tampons()
+        return population
+    return nouvelle_population
+
+def candidats_croisement(matrice, methode_croisement, recherche_locale=None):
+    """Listes de plus proches voisins pour EAX et la recherche locale (calculées une fois)."""
+    if methode_croisement == "eax" or recherche_locale:
+        return voisins_proches(matrice, NB_VOISINS)
+    return None
+
+def evaluer_generation(population, matrice, cache=None, stats=None):
+    """evaluer_population, comptée et chronométrée si stats est fourni."""
+    if isinstance(population, PopulationCompacte) and not est_tableau_numpy(matrice):
+        # Matrice en listes : évaluation en Python sur les chemins convertis
+        population = population.en_listes()
+    if stats is None:
+        return evaluer_population(population, matrice, cache)
+    debut = perf_counter_ns()
+    echecs = cache.echecs if cache else 0
+    distances = evaluer_population(population, matrice, cache)
+    stats.evaluations += cache.echecs - echecs if cache else len(population)
+    stats.ajouter_temps("evaluation", debut)
+    return distances
+
+def evoluer_population(population, matrice, generations, taille_cache=0, stats=None, **parametres):
+    """Fait évoluer une population existante ; renvoie (population, distances, historique).
+
+    Les distances renvoyées sont celles de la population finale (utile pour la migration).
+    """
+    historique = []
+    cache = CacheDistances(matrice, taille_cache) if taille_cache else None
+    voisins = candidats_croisement(matrice, parametres.get("methode_croisement"),
+                                   parametres.get("recherche_locale"))
+    for _ in range(generations):
+        distances = evaluer_generation(population, matrice, cache, stats)
+        historique.append(min(distances))
+        population = generation_suivante(population, distances, matrice=matrice,
+                                         voisins=voisins, stats=stats, **parametres)
+        if stats is not None:
+            stats.iterations += 1
+            stats.point_controle()
+    return population, evaluer_generation(population, matrice, cache, stats), historique
+
 # Algorithme génétique
 def algorithme_genetique_tsp(
     matrice,
@@ -46,66 +463,113 @@ def algorithme_genetique_tsp(
     methode_selection="roulette",
     methode_croisement="2points",
     afficher_graphique=True,
-    callback=None
+    callback=None,
+    taille_cache=0,
+    taille_tournoi=3,
+    methode_roulette="bisect",
+    verbeux=True,
+    recherche_locale=None,
+    proba_recherche_locale=0.1,
+    initialisation="aleatoire",
+    part_heuristique=0.25,
+    sauvegarde=None,
+    intervalle_sauvegarde=10,
+    reprendre_depuis=None,
+    arret=None,
+    historique=None,
+    stats=None,
+    coords=None
 ):
-    nb_villes = len(matrice)
-    population = [random.sample(range(nb_villes), nb_villes) for _ in range(taille_population)]
-    historique = []
+    """historique : enregistreur Historique de la meilleure distance par génération
+    (par défaut, toutes les valeurs sont conservées).
+    methode_roulette : tirage de la sélection par roulette, "bisect" ou "alias"
+    (cf. selection_roulette.selection_par_roulette_lot).
+    coords : coordonnées des villes pour les initialisations heuristiques
+    (cf. initialisation.chemin_initial)."""
+    if arret is not None:
+        arret.demarrer()
+    # Grandes instances et matrices NumPy : population en tableau int32 (cf. population.py)
+    compacte = population_compacte_utile(matrice)
+    if reprendre_depuis is not None:
+        # Reprise à l'identique : population, historique et générateur aléatoire restaurés
+        etat = charger_reprise(reprendre_depuis, "ag")
+        if compacte:
+            population = PopulationCompacte.depuis_octets(etat["population"], etat["taille_population"],
+                                                           etat["nb_villes"])
+        else:
+            population = chemins_depuis_octets(etat["population"], etat["taille_population"],
+                                               etat["nb_villes"])
+        historique = etat["historique"]
+        random.setstate(etat["aleatoire"])
+        premiere_generation = etat["generation"]
+    else:
+        population = population_initiale(matrice, taille_population, initialisation, part_heuristique,
+                                         coords)
+        if compacte:
+            population = PopulationCompacte.depuis_listes(population)
+        historique = historique if historique is not None else Historique()
+        premiere_generation = 0
+    # Mémo LRU optionnel des distances pour ne pas réévaluer les individus dupliqués
+    # Population compacte sur une matrice en listes : évaluation vectorisée sur une copie NumPy
+    matrice_evaluation = en_matrice_numpy(matrice) if compacte and isinstance(matrice, list) else matrice
+    cache = CacheDistances(matrice_evaluation, taille_cache) if taille_cache else None
+    voisins = candidats_croisement(matrice, methode_croisement, recherche_locale)
+    ecrivain = EcrivainReprise(sauvegarde, "ag") if sauvegarde else None
 
-    for gen in range(generations):
-        nouvelle_population = []
+    try:
+        for gen in range(premiere_generation, generations):
+            # Évaluation unique de chaque individu pour toute la génération
+            distances = evaluer_generation(population, matrice_evaluation, cache, stats)
+            indice_meilleur = min(range(len(population)), key=distances.__getitem__)
+            meilleur = population[indice_meilleur].tolist() if compacte else population[indice_meilleur][:]
+            meilleure_distance = distances[indice_meilleur]
+            historique.ajouter(meilleure_distance)
 
-        # Élitisme : conserver le meilleur
-        meilleur = min(population, key=lambda p: calculer_distance(p, matrice))
-        meilleure_distance = calculer_distance(meilleur, matrice)
-        nouvelle_population.append(meilleur[:])
-        historique.append(meilleure_distance)
+            population = generation_suivante(
+                population, distances,
+                proba_croisement=proba_croisement,
+                proba_mutation=proba_mutation,
+                methode_selection=methode_selection,
+                methode_croisement=methode_croisement,
+                taille_tournoi=taille_tournoi,
+                methode_roulette=methode_roulette,
+                matrice=matrice,
+                voisins=voisins,
+                recherche_locale=recherche_locale,
+                proba_recherche_locale=proba_recherche_locale,
+                stats=stats
+            )
+            if stats is not None:
+                stats.iterations += 1
+                stats.point_controle()
 
-        while len(nouvelle_population) < taille_population:
-            # Sélection
-            if methode_selection == "roulette":
-                parent1 = selection_par_roulette(population, matrice)
-                parent2 = selection_par_roulette(population, matrice)
-            else:
-                parent1 = selection_par_rang(population, matrice)
-                parent2 = selection_par_rang(population, matrice)
-
-            # Croisement
-            if random.random() < proba_croisement:
-                if methode_croisement == "1point":
-                    enfant = croisement_un_point(parent1, parent2)
-                elif methode_croisement == "2points":
-                    enfant = croisement_deux_points(parent1, parent2)
-                else:
-                    enfant = croisement_uniforme(parent1, parent2)
-            else:
-                enfant = parent1[:]
-
-            # Mutation
-            if random.random() < proba_mutation:
-                mutation(enfant)
+            # Callback pour simulation interactive
+            if callback:
+                callback(gen, meilleur, meilleure_distance, historique)
 
-            nouvelle_population.append(enfant)
-
-        population = nouvelle_population
+            if verbeux and not callback:
+                print(f"Génération {gen+1}/{generations} | Meilleure distance = {meilleure_distance:.2f}")
 
-        # Callback pour simulation interactive
-        if callback:
-            callback(gen, meilleur, meilleure_distance, historique)
+            if ecrivain and (gen + 1) % intervalle_sauvegarde == 0:
+                ecrivain.soumettre(generation=gen + 1,
+                                   population=population.en_octets() if compacte else octets_chemins(population),
+                                   taille_population=len(population), nb_villes=len(matrice),
+                                   historique=historique.copie(), aleatoire=random.getstate())
 
-        if not callback:
-            print(f"Génération {gen+1}/{generations} | Meilleure distance = {meilleure_distance:.2f}")
+            if arret is not None and arret.verifier(meilleure_distance, len(population)):
+                break
+    finally:
+        if ecrivain:
+            ecrivain.fermer()
 
-    meilleur = min(population, key=lambda p: calculer_distance(p, matrice))
-    meilleure_distance = calculer_distance(meilleur, matrice)
+    distances = evaluer_generation(population, matrice_evaluation, cache, stats)
+    indice_meilleur = min(range(len(population)), key=distances.__getitem__)
+    meilleur = population[indice_meilleur].tolist() if compacte else population[indice_meilleur][:]
+    meilleure_distance = distances[indice_meilleur]
 
     if afficher_graphique and not callback:
-        plt.figure(figsize=(10,6))
-        plt.plot(historique, linewidth=2)
-        plt.title("Algorithme Génétique - Évolution de la meilleure distance")
-        plt.xlabel("Génération")
-        plt.ylabel("Distance minimale")
-        plt.grid(True, alpha=0.3)
-        plt.show()
-
-    return meilleur, meilleure_distance, historique[0], historique
+        from affichage import tracer_historique
+        tracer_historique(historique, "Algorithme Génétique - Évolution de la meilleure distance",
+                          "Génération", "Distance minimale")
+
+    return meilleur, meilleure_distance, historique.premiere, historique
@@ -0,0 +1,55 @@
+from time import perf_counter
+
+
+class CritereArret:
+    """Critères d'arrêt communs aux solveurs, en plus de leur nombre d'étapes.
+
+    duree_max : échéance en secondes depuis le début de la résolution ;
+    evaluations_max : nombre maximal de chemins évalués ;
+    fenetre_stagnation : nombre d'étapes (génération, palier de température ou
+    itération tabou) sans amélioration de plus de tolerance de la meilleure distance ;
+    distance_cible : arrêt dès qu'une distance inférieure ou égale est atteinte.
+
+    Les solveurs appellent demarrer() au début puis verifier() à chaque étape ;
+    raison indique ensuite le critère déclenché ("duree", "evaluations",
+    "stagnation", "cible") ou None.
+    """
+
+    def __init__(self, duree_max=None, evaluations_max=None, fenetre_stagnation=None,
+                 distance_cible=None, tolerance=0.0):
+        self.duree_max = duree_max
+        self.evaluations_max = evaluations_max
+        self.fenetre_stagnation = fenetre_stagnation
+        self.distance_cible = distance_cible
+        self.tolerance = tolerance
+        self.demarrer()
+
+    def demarrer(self):
+        self._echeance = perf_counter() + self.duree_max if self.duree_max is not None else None
+        self.evaluations = 0
+        self.etapes = 0
+        self.meilleure_distance = float("inf")
+        self._derniere_amelioration = 0
+        self.raison = None
+
+    def echeance_depassee(self):
+        return self._echeance is not None and perf_counter() >= self._echeance
+
+    def verifier(self, meilleure_distance, evaluations=0):
+        """Enregistre une étape ; renvoie True si la résolution doit s'arrêter."""
+        self.etapes += 1
+        self.evaluations += evaluations
+        if meilleure_distance < self.meilleure_distance - self.tolerance:
+            self._derniere_amelioration = self.etapes
+        self.meilleure_distance = min(self.meilleure_distance, meilleure_distance)
+
+        if self.distance_cible is not None and self.meilleure_distance <= self.distance_cible:
+            self.raison = "cible"
+        elif self.evaluations_max is not None and self.evaluations >= self.evaluations_max:
+            self.raison = "evaluations"
+        elif (self.fenetre_stagnation is not None
+              and self.etapes - self._derniere_amelioration >= self.fenetre_stagnation):
+            self.raison = "stagnation"
+        elif self.echeance_depassee():
+            self.raison = "duree"
+        return self.raison is not None
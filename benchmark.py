@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai reproductible des solveurs TSP (sans affichage graphique).
+
+Chaque (instance, solveur, graine) est mesuré : temps, évaluations par
+seconde, pic mémoire et écart à l'optimum connu. Le résultat est écrit en
+JSON pour pouvoir comparer deux commits.
+
+    python benchmark.py --suite rapide --sortie bench.json
+    python benchmark.py --tsplib berlin52.tsp --optimum berlin52=7542
+    python benchmark.py --algos recuit --noyau numba
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from instrumentation import Statistiques
+from oracle import OracleDistances
+from parallele import SEUIL_LISTE
+from noyaux import NOYAUX
+from solveurs import ALGORITHMES, lancer_solveur
+from tsplib import charger_tsplib
+from utils import creer_matrice_depuis_coords
+
+SUITES = {
+    "rapide": [10, 50, 200],
+    "complet": [10, 100, 1000, 5000],
+}
+TYPES_INSTANCES = ["uniforme", "grappes", "cercle"]
+SELECTIONS = ["roulette", "rang", "tournoi", "sus"]
+CROISEMENTS = ["1point", "2points", "uniforme", "ox", "pmx", "erx", "eax"]
+
+PARAMETRES_AG = {"generations": 100, "taille_population": 50}
+PARAMETRES_RECUIT = {"temperature_initiale": 1000, "temperature_finale": 1, "alpha": 0.95,
+                     "iterations_par_temperature": 100}
+PARAMETRES_TABOU = {"nombre_iterations": 200, "taille_tabu": 20, "k_voisins": 10}
+
+
+def generer_instance(type_instance, n, graine):
+    """Coordonnées dans [0, 100]² et optimum connu (None si inconnu)."""
+    rng = random.Random(graine)
+    if type_instance == "cercle":
+        # Villes sur un cercle : l'optimum est le périmètre du polygone régulier
+        rayon = 50
+        coords = [(50 + rayon * math.cos(2 * math.pi * k / n), 50 + rayon * math.sin(2 * math.pi * k / n))
+                  for k in range(n)]
+        rng.shuffle(coords)
+        return coords, 2 * n * rayon * math.sin(math.pi / n)
+    if type_instance == "grappes":
+        centres = [(rng.uniform(10, 90), rng.uniform(10, 90)) for _ in range(max(2, n // 50))]
+        coords = []
+        for _ in range(n):
+            cx, cy = rng.choice(centres)
+            coords.append((min(100, max(0, rng.gauss(cx, 4))), min(100, max(0, rng.gauss(cy, 4)))))
+        return coords, None
+    return [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n)], None
+
+
+def preparer_matrice(coords):
+    if len(coords) <= SEUIL_LISTE:
+        return creer_matrice_depuis_coords(coords)
+    return OracleDistances(coords, k_voisins=PARAMETRES_TABOU["k_voisins"])
+
+
+def configurations_solveurs(algos):
+    configurations = []
+    if "ag" in algos:
+        for sel in SELECTIONS:
+            for crois in CROISEMENTS:
+                configurations.append((f"ag-{sel}-{crois}", "ag",
+                                       dict(PARAMETRES_AG, methode_selection=sel, methode_croisement=crois)))
+    if "recuit" in algos:
+        for mouvement in ["swap", "2opt", "oropt"]:
+            configurations.append((f"recuit-{mouvement}", "recuit",
+                                   dict(PARAMETRES_RECUIT, type_mouvement=mouvement)))
+    if "tabou" in algos:
+        configurations.append(("tabou", "tabou", dict(PARAMETRES_TABOU)))
+    return configurations
+
+
+def mesurer(algorithme, parametres, matrice, graine, memoire=True, noyau=None):
+    random.seed(graine)
+    stats = Statistiques()
+    debut = time.perf_counter()
+    distance = lancer_solveur(algorithme, matrice, dict(parametres, stats=stats), noyau=noyau)[1]
+    duree = time.perf_counter() - debut
+    evaluations = stats.evaluations
+
+    pic_memoire = None
+    if memoire:
+        # Seconde exécution identique (même graine) sous tracemalloc, pour ne pas fausser le temps
+        random.seed(graine)
+        tracemalloc.start()
+        lancer_solveur(algorithme, matrice, parametres, noyau=noyau)
+        pic_memoire = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"distance": distance, "duree": duree, "evaluations": evaluations,
+            "evaluations_par_seconde": evaluations / duree if duree else None,
+            "pic_memoire_octets": pic_memoire, "statistiques": stats.en_dict()}
+
+
+def instances_suite(tailles, types_instances, fichiers_tsplib, optimums, graine):
+    for n in tailles:
+        for type_instance in types_instances:
+            coords, optimum = generer_instance(type_instance, n, graine)
+            yield f"{type_instance}-{n}", preparer_matrice(coords), optimum
+    for fichier in fichiers_tsplib:
+        instance = charger_tsplib(fichier, paresseux=instance_paresseuse(fichier))
+        yield instance.nom, instance.matrice, optimums.get(instance.nom)
+
+
+def instance_paresseuse(fichier):
+    with open(fichier) as f:
+        for ligne in f:
+            if ligne.strip().upper().startswith("DIMENSION"):
+                return int(ligne.split(":")[1]) > SEUIL_LISTE
+    return False
+
+
+def lancer_benchmark(tailles, types_instances=TYPES_INSTANCES, algos=ALGORITHMES,
+                     graines=(0,), fichiers_tsplib=(), optimums=None, memoire=True, verbeux=True,
+                     noyau=None):
+    resultats = []
+    configurations = configurations_solveurs(algos)
+    for nom_instance, matrice, optimum in instances_suite(tailles, types_instances, fichiers_tsplib,
+                                                          optimums or {}, graines[0]):
+        for nom, algorithme, parametres in configurations:
+            for graine in graines:
+                mesure = mesurer(algorithme, parametres, matrice, graine, memoire, noyau)
+                mesure.update({
+                    "instance": nom_instance, "n": len(matrice), "solveur": nom, "graine": graine,
+                    "optimum": optimum,
+                    "ecart_optimum_pct": 100 * (mesure["distance"] - optimum) / optimum if optimum else None,
+                })
+                resultats.append(mesure)
+                if verbeux:
+                    print(f"{nom_instance:<16} {nom:<24} graine={graine:<3} "
+                          f"distance={mesure['distance']:<12.2f} temps={mesure['duree']:.3f}s")
+    return resultats
+
+
+def version_code():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai reproductible des solveurs TSP")
+    parser.add_argument("--suite", choices=SUITES, default="rapide")
+    parser.add_argument("--tailles", type=int, nargs="+", help="remplace les tailles de la suite")
+    parser.add_argument("--instances", nargs="+", choices=TYPES_INSTANCES, default=TYPES_INSTANCES)
+    parser.add_argument("--algos", nargs="+", choices=ALGORITHMES, default=list(ALGORITHMES))
+    parser.add_argument("--graines", type=int, nargs="+", default=[0])
+    parser.add_argument("--tsplib", nargs="*", default=[], help="fichiers .tsp à ajouter")
+    parser.add_argument("--optimum", nargs="*", default=[], help="NOM=valeur pour les instances TSPLIB")
+    parser.add_argument("--sans-memoire", action="store_true", help="ne pas mesurer le pic mémoire")
+    parser.add_argument("--noyau", choices=NOYAUX, default=None,
+                        help="noyaux des paliers du recuit (cf. noyaux.py), boucle Python par défaut")
+    parser.add_argument("--sortie", default="bench_output.json")
+    args = parser.parse_args()
+
+    optimums = {nom: float(valeur) for nom, valeur in (o.split("=", 1) for o in args.optimum)}
+    resultats = lancer_benchmark(args.tailles or SUITES[args.suite], args.instances, args.algos,
+                                 args.graines, args.tsplib, optimums, not args.sans_memoire,
+                                 noyau=args.noyau)
+    with open(args.sortie, "w") as fichier:
+        json.dump({
+            "meta": {"commit": version_code(), "python": platform.python_version(),
+                     "date": time.strftime("%Y-%m-%dT%H:%M:%S"), "suite": args.suite,
+                     "noyau": args.noyau},
+            "resultats": resultats,
+        }, fichier, indent=2)
+    print(f"\n{len(resultats)} mesures écrites dans {args.sortie}")
+
+
+if __name__ == "__main__":
+    main()
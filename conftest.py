@@ -0,0 +1,13 @@
+# Permet aux tests (dossier tests/) d'importer les modules de la racine
+import random
+import pytest
+from utils import creer_matrice_depuis_coords
+
+
+@pytest.fixture
+def matrice_aleatoire():
+    """Fabrique matrice_aleatoire(n, graine=0) : n villes tirées uniformément dans [0, 100]²."""
+    def fabriquer(n, graine=0):
+        rng = random.Random(graine)
+        return creer_matrice_depuis_coords([(rng.random() * 100, rng.random() * 100) for _ in range(n)])
+    return fabriquer
@@ -0,0 +1,133 @@
+import copy
+from array import array
+
+# Historique des distances d'un solveur, borné en mémoire : les valeurs sont
+# stockées dans des array('d') (8 octets par valeur, sans objet float) et,
+# selon le mode, seule une partie en est conservée.
+
+MODES_HISTORIQUE = ("complet", "aucun", "echantillon", "anneau", "seaux")
+
+
+class Historique:
+    """Enregistreur de l'évolution de la distance.
+
+    mode :
+      "complet"     toutes les valeurs ;
+      "aucun"       rien n'est conservé (hormis première et dernière valeur) ;
+      "echantillon" une valeur toutes les pas ;
+      "anneau"      les taille dernières valeurs (tampon circulaire) ;
+      "seaux"       minimum et maximum de chaque seau, au plus taille seaux :
+                    quand ils sont tous remplis, les seaux voisins sont
+                    fusionnés deux à deux et leur largeur double.
+
+    L'objet se comporte comme une séquence des valeurs conservées (len, indices,
+    itération, conversion NumPy) ; abscisses() donne leurs numéros d'ajout.
+    """
+
+    def __init__(self, mode="complet", pas=10, taille=1000):
+        if mode not in MODES_HISTORIQUE:
+            raise ValueError(f"Mode d'historique inconnu : {mode}")
+        if mode == "seaux" and taille < 2:
+            raise ValueError("Le mode seaux nécessite au moins 2 seaux")
+        self.mode = mode
+        self.pas = pas
+        self.taille = taille
+        self.nb_valeurs = 0
+        self.premiere = None
+        self.derniere = None
+        self._valeurs = array('d')
+        # Mode seaux : bornes par seau et largeur courante (en nombre de valeurs)
+        self._maximums = array('d')
+        self._largeur = 1
+
+    def ajouter(self, valeur):
+        indice = self.nb_valeurs
+        self.nb_valeurs += 1
+        self.derniere = valeur
+        if indice == 0:
+            self.premiere = valeur
+        mode = self.mode
+        if mode == "complet":
+            self._valeurs.append(valeur)
+        elif mode == "echantillon":
+            if indice % self.pas == 0:
+                self._valeurs.append(valeur)
+        elif mode == "anneau":
+            if len(self._valeurs) < self.taille:
+                self._valeurs.append(valeur)
+            else:
+                self._valeurs[indice % self.taille] = valeur
+        elif mode == "seaux":
+            self._ajouter_seau(indice, valeur)
+
+    def etendre(self, valeurs):
+        for valeur in valeurs:
+            self.ajouter(valeur)
+
+    def _ajouter_seau(self, indice, valeur):
+        seau = indice // self._largeur
+        if seau < len(self._valeurs):
+            if valeur < self._valeurs[seau]:
+                self._valeurs[seau] = valeur
+            if valeur > self._maximums[seau]:
+                self._maximums[seau] = valeur
+            return
+        if seau == self.taille:
+            self._fusionner_seaux()
+            seau = indice // self._largeur
+            if seau < len(self._valeurs):
+                self._ajouter_seau(indice, valeur)
+                return
+        self._valeurs.append(valeur)
+        self._maximums.append(valeur)
+
+    def _fusionner_seaux(self):
+        minimums, maximums = self._valeurs, self._maximums
+        self._valeurs = array('d', (min(minimums[k:k + 2]) for k in range(0, len(minimums), 2)))
+        self._maximums = array('d', (max(maximums[k:k + 2]) for k in range(0, len(maximums), 2)))
+        self._largeur *= 2
+
+    def valeurs(self):
+        """Valeurs conservées, dans l'ordre d'ajout (min puis max de chaque seau)."""
+        if self.mode == "anneau" and self.nb_valeurs > self.taille:
+            debut = self.nb_valeurs % self.taille
+            return self._valeurs[debut:] + self._valeurs[:debut]
+        if self.mode == "seaux":
+            points = array('d', bytes(16 * len(self._valeurs)))
+            points[0::2] = self._valeurs
+            points[1::2] = self._maximums
+            return points
+        return self._valeurs
+
+    def abscisses(self):
+        """Numéro d'ajout de chaque valeur conservée (pour tracer valeurs() en fonction)."""
+        nb = len(self._valeurs)
+        if self.mode == "echantillon":
+            return range(0, nb * self.pas, self.pas)
+        if self.mode == "anneau":
+            return range(self.nb_valeurs - nb, self.nb_valeurs)
+        if self.mode == "seaux":
+            return [seau * self._largeur for seau in range(nb) for _ in (0, 1)]
+        return range(nb)
+
+    def copie(self):
+        return copy.deepcopy(self)
+
+    def __len__(self):
+        return 2 * len(self._valeurs) if self.mode == "seaux" else len(self._valeurs)
+
+    def __getitem__(self, indice):
+        valeurs = self._valeurs if self.mode == "complet" else self.valeurs()
+        if isinstance(indice, slice):
+            return valeurs[indice].tolist()
+        return valeurs[indice]
+
+    def __iter__(self):
+        return iter(self.valeurs())
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy as np
+        return np.array(self.valeurs(), dtype=dtype)
+
+    def __repr__(self):
+        return f"Historique(mode={self.mode!r}, nb_valeurs={self.nb_valeurs}, conservees={len(self)})"
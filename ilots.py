@@ -0,0 +1,80 @@
+import math
+import random
+from algo_genetique import evoluer_population
+from parallele import matrice_worker, pool_matrice_partagee
+from historique import Historique
+
+
+def evoluer_ilot(population, generations, graine, parametres):
+    """Époque d'un îlot dans un worker : quelques générations entre deux migrations."""
+    random.seed(graine)
+    return evoluer_population(population, matrice_worker(), generations, **parametres)
+
+
+def destinations_migration(i, nb_ilots, topologie):
+    """Îlots qui reçoivent les migrants de l'îlot i."""
+    if topologie == "complet":
+        return [j for j in range(nb_ilots) if j != i]
+    return [(i + 1) % nb_ilots]
+
+
+def migrer(populations, distances, nb_migrants, topologie):
+    """Copie les meilleurs individus de chaque îlot à la place des pires de ses voisins."""
+    nb_ilots = len(populations)
+    migrants = []
+    for population, dist in zip(populations, distances):
+        meilleurs = sorted(range(len(population)), key=dist.__getitem__)[:nb_migrants]
+        migrants.append([(population[k][:], dist[k]) for k in meilleurs])
+
+    for i in range(nb_ilots):
+        for j in destinations_migration(i, nb_ilots, topologie):
+            pires = sorted(range(len(populations[j])), key=distances[j].__getitem__, reverse=True)
+            for k, (individu, distance) in zip(pires, migrants[i]):
+                populations[j][k] = individu[:]
+                distances[j][k] = distance
+
+
+def algorithme_genetique_ilots(
+    matrice,
+    nb_ilots=4,
+    generations=200,
+    taille_population=50,
+    intervalle_migration=10,
+    nb_migrants=2,
+    topologie="anneau",
+    nb_processus=None,
+    graine=None,
+    **parametres
+):
+    """Modèle en îlots : une sous-population par processus, migration toutes les
+    intervalle_migration générations selon une topologie "anneau" ou "complet".
+
+    Les autres paramètres sont ceux de generation_suivante (sélection, croisement...).
+    Renvoie (meilleur, meilleure_distance, distance_initiale, historique) comme
+    algorithme_genetique_tsp, l'historique étant le meilleur global par génération.
+    """
+    rng = random.Random(graine)
+    nb_villes = len(matrice)
+    populations = [[rng.sample(range(nb_villes), nb_villes) for _ in range(taille_population)]
+                   for _ in range(nb_ilots)]
+    historique = Historique()
+
+    with pool_matrice_partagee(matrice, nb_processus or nb_ilots) as pool:
+        for epoque in range(math.ceil(generations / intervalle_migration)):
+            nb_generations = min(intervalle_migration, generations - epoque * intervalle_migration)
+            taches = [pool.submit(evoluer_ilot, population, nb_generations,
+                                  rng.getrandbits(64), parametres)
+                      for population in populations]
+            resultats = [tache.result() for tache in taches]
+            populations = [population for population, _, _ in resultats]
+            distances = [dist for _, dist, _ in resultats]
+            historique.etendre(min(valeurs) for valeurs in zip(*(hist for _, _, hist in resultats)))
+
+            if nb_ilots > 1 and nb_migrants:
+                migrer(populations, distances, nb_migrants, topologie)
+
+    i_ilot = min(range(nb_ilots), key=lambda i: min(distances[i]))
+    indice_meilleur = min(range(taille_population), key=distances[i_ilot].__getitem__)
+    meilleur = populations[i_ilot][indice_meilleur]
+    meilleure_distance = distances[i_ilot][indice_meilleur]
+    return meilleur, meilleure_distance, historique.premiere, historique
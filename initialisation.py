@@ -0,0 +1,414 @@
+import random
+from utils import voisins_proches
+from mouvements import appliquer_double_pont
+
+# Chemins initiaux constructifs. Les heuristiques travaillent sur des listes de
+# plus proches voisins (arêtes candidates) plutôt que sur toutes les paires,
+# et l'arbre k-d ou la courbe de Hilbert utilisent les coordonnées des villes
+# quand elles sont fournies (paramètre coords) ou que la matrice les expose
+# (attribut coords, cf. MatriceParesseuse).
+
+K_VOISINS = 10
+ORDRE_HILBERT = 16
+
+
+def coordonnees(matrice, coords=None):
+    """Coordonnées des villes : coords si fournies, sinon celles de la matrice, sinon None."""
+    if coords is None:
+        return getattr(matrice, "coords", None)
+    if len(coords) != len(matrice):
+        raise ValueError("Il faut autant de coordonnées que de villes")
+    return coords
+
+
+class _ArbreKD:
+    """Arbre k-d statique sur des points 2D, avec retrait des points déjà visités.
+
+    Le nœud couvrant ordre[debut:fin] a pour pivot ordre[(debut + fin) // 2] ;
+    chaque position étant le pivot d'un seul nœud, les tableaux par nœud sont
+    indexés par cette position.
+    """
+
+    def __init__(self, points, indices):
+        self.points = points
+        self.ordre = list(indices)
+        taille = len(self.ordre)
+        self.axes = bytearray(taille)
+        # Nombre de points restants dans chaque sous-arbre
+        self.restants = [0] * taille
+        pile = [(0, taille, 0)]
+        while pile:
+            debut, fin, axe = pile.pop()
+            if fin <= debut:
+                continue
+            milieu = (debut + fin) // 2
+            # Tri complet du sous-tableau : O(n log² n) au total
+            self.ordre[debut:fin] = sorted(self.ordre[debut:fin], key=lambda i: self.points[i][axe])
+            self.axes[milieu] = axe
+            self.restants[milieu] = fin - debut
+            pile.append((debut, milieu, 1 - axe))
+            pile.append((milieu + 1, fin, 1 - axe))
+        self.rang = {ville: position for position, ville in enumerate(self.ordre)}
+        self.present = {ville: True for ville in self.ordre}
+
+    def retirer(self, ville):
+        self.present[ville] = False
+        position = self.rang[ville]
+        debut, fin = 0, len(self.ordre)
+        while fin > debut:
+            milieu = (debut + fin) // 2
+            self.restants[milieu] -= 1
+            if position == milieu:
+                return
+            if position < milieu:
+                fin = milieu
+            else:
+                debut = milieu + 1
+
+    def plus_proche(self, point):
+        """Point restant le plus proche (distance euclidienne), ou None si l'arbre est vide."""
+        x, y = point
+        meilleure, meilleur = float("inf"), None
+        # Chaque sous-arbre est empilé avec une borne inférieure de sa distance au point
+        pile = [(0, len(self.ordre), 0.0)]
+        while pile:
+            debut, fin, borne = pile.pop()
+            if fin <= debut or borne >= meilleure:
+                continue
+            milieu = (debut + fin) // 2
+            if not self.restants[milieu]:
+                continue
+            ville = self.ordre[milieu]
+            px, py = self.points[ville]
+            if self.present[ville]:
+                d = (px - x) ** 2 + (py - y) ** 2
+                if d < meilleure:
+                    meilleure, meilleur = d, ville
+            ecart = (x - px) if self.axes[milieu] == 0 else (y - py)
+            if ecart < 0:
+                proche, loin = (debut, milieu, borne), (milieu + 1, fin, ecart * ecart)
+            else:
+                proche, loin = (milieu + 1, fin, borne), (debut, milieu, ecart * ecart)
+            # Le côté lointain est dépilé après le côté proche, et ignoré si sa
+            # borne dépasse alors la meilleure distance trouvée
+            pile.append(loin)
+            pile.append(proche)
+        return meilleur
+
+
+def plus_proche_voisin(matrice, depart=0, coords=None):
+    """Chemin du plus proche voisin depuis la ville depart.
+
+    Avec des coordonnées, la recherche passe par un arbre k-d (O(n log n) en
+    moyenne, au sens de la distance euclidienne) ; sinon, chaque pas parcourt
+    la ligne de la matrice (O(n²)).
+    """
+    n = len(matrice)
+    points = coordonnees(matrice, coords)
+    chemin = [depart]
+    if points is not None:
+        arbre = _ArbreKD(points, range(n))
+        arbre.retirer(depart)
+        for _ in range(n - 1):
+            ville = arbre.plus_proche(points[chemin[-1]])
+            arbre.retirer(ville)
+            chemin.append(ville)
+        return chemin
+
+    visitees = bytearray(n)
+    visitees[depart] = 1
+    for _ in range(n - 1):
+        ligne = matrice[chemin[-1]]
+        ville = min((j for j in range(n) if not visitees[j]), key=ligne.__getitem__)
+        visitees[ville] = 1
+        chemin.append(ville)
+    return chemin
+
+
+class _Ensembles:
+    """Union-find (union par taille, compression de chemin)."""
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.taille = [1] * n
+
+    def trouver(self, x):
+        racine = x
+        while self.parent[racine] != racine:
+            racine = self.parent[racine]
+        while self.parent[x] != racine:
+            self.parent[x], x = racine, self.parent[x]
+        return racine
+
+    def unir(self, x, y):
+        x, y = self.trouver(x), self.trouver(y)
+        if x == y:
+            return False
+        if self.taille[x] < self.taille[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self.taille[x] += self.taille[y]
+        return True
+
+
+def aretes_candidates(matrice, k_voisins=K_VOISINS, voisins=None):
+    """Arêtes (distance, i, j) des listes de plus proches voisins, triées, sans doublon."""
+    if voisins is None:
+        voisins = voisins_proches(matrice, k_voisins)
+    aretes = set()
+    for i, liste in enumerate(voisins):
+        for j in liste:
+            j = int(j)
+            aretes.add((i, j) if i < j else (j, i))
+    return sorted((matrice[i][j], i, j) for i, j in aretes)
+
+
+def _plus_proche_parmi(matrice, ville, candidates, arbre=None):
+    """Ville de candidates la plus proche de ville (arbre k-d si fourni, sinon balayage)."""
+    if arbre is not None:
+        return arbre.plus_proche(arbre.points[ville])
+    ligne = matrice[ville]
+    return min(candidates, key=ligne.__getitem__)
+
+
+def _relier_fragments(matrice, adjacence, coords=None):
+    """Chemin parcourant des chaînes disjointes (degré ≤ 2) reliées par plus proche extrémité."""
+    n = len(matrice)
+    extremites = [v for v in range(n) if len(adjacence[v]) < 2]
+    if not extremites:
+        # Déjà un cycle hamiltonien
+        extremites = [0]
+    points = coordonnees(matrice, coords)
+    arbre = _ArbreKD(points, extremites) if points is not None else None
+    libres = set(extremites)
+
+    visitees = bytearray(n)
+    chemin = []
+    ville = extremites[0]
+    while True:
+        # Parcours de la chaîne qui commence en ville
+        libres.discard(ville)
+        if arbre is not None:
+            arbre.retirer(ville)
+        precedente = None
+        while True:
+            visitees[ville] = 1
+            chemin.append(ville)
+            suivantes = [v for v in adjacence[ville] if v != precedente and not visitees[v]]
+            if not suivantes:
+                break
+            precedente, ville = ville, suivantes[0]
+        if ville in libres:
+            libres.discard(ville)
+            if arbre is not None:
+                arbre.retirer(ville)
+        if not libres:
+            return chemin
+        ville = _plus_proche_parmi(matrice, ville, libres, arbre)
+
+
+def aretes_gloutonnes(matrice, k_voisins=K_VOISINS, voisins=None, coords=None):
+    """Heuristique gloutonne des arêtes : les arêtes candidates les plus courtes sont
+    retenues tant qu'elles ne créent ni degré 3 ni sous-cycle, puis les
+    fragments obtenus sont reliés par plus proche extrémité. O(n k log(n k)).
+    """
+    n = len(matrice)
+    if n < 3:
+        return list(range(n))
+    adjacence = [[] for _ in range(n)]
+    ensembles = _Ensembles(n)
+    nb_aretes = 0
+    for _, i, j in aretes_candidates(matrice, k_voisins, voisins):
+        if len(adjacence[i]) < 2 and len(adjacence[j]) < 2 and ensembles.unir(i, j):
+            adjacence[i].append(j)
+            adjacence[j].append(i)
+            nb_aretes += 1
+            if nb_aretes == n - 1:
+                break
+    return _relier_fragments(matrice, adjacence, coords)
+
+
+def _arbre_couvrant(matrice, aretes):
+    """Arbre couvrant minimal (Kruskal) du graphe des arêtes candidates ; les
+    composantes restantes sont reliées entre représentants les plus proches."""
+    n = len(matrice)
+    ensembles = _Ensembles(n)
+    arbre = []
+    for _, i, j in aretes:
+        if ensembles.unir(i, j):
+            arbre.append((i, j))
+    representants = list({ensembles.trouver(v): v for v in range(n)}.values())
+    relies = [representants[0]]
+    for r in representants[1:]:
+        plus_proche = _plus_proche_parmi(matrice, r, relies)
+        arbre.append((r, plus_proche))
+        relies.append(r)
+    return arbre
+
+
+def christofides(matrice, k_voisins=K_VOISINS, voisins=None):
+    """Construction à la Christofides : arbre couvrant minimal, couplage des
+    sommets de degré impair, circuit eulérien puis raccourcis.
+
+    Le couplage est glouton (et non de poids minimal) et l'arbre est restreint
+    aux arêtes candidates : la garantie 3/2 est perdue, la complexité reste
+    en O(n k log(n k)).
+    """
+    n = len(matrice)
+    if n < 3:
+        return list(range(n))
+    aretes = aretes_candidates(matrice, k_voisins, voisins)
+    multigraphe = _arbre_couvrant(matrice, aretes)
+
+    degre = [0] * n
+    for i, j in multigraphe:
+        degre[i] += 1
+        degre[j] += 1
+    impairs = bytearray(d % 2 for d in degre)
+    for _, i, j in aretes:
+        if impairs[i] and impairs[j]:
+            impairs[i] = impairs[j] = 0
+            multigraphe.append((i, j))
+    restants = [v for v in range(n) if impairs[v]]
+    while restants:
+        i = restants.pop()
+        j = _plus_proche_parmi(matrice, i, restants)
+        restants.remove(j)
+        multigraphe.append((i, j))
+
+    # Circuit eulérien (Hierholzer) sur le multigraphe, chaque arête utilisée une fois
+    incidentes = [[] for _ in range(n)]
+    for numero, (i, j) in enumerate(multigraphe):
+        incidentes[i].append(numero)
+        incidentes[j].append(numero)
+    utilisee = bytearray(len(multigraphe))
+    pile, circuit = [0], []
+    while pile:
+        v = pile[-1]
+        while incidentes[v] and utilisee[incidentes[v][-1]]:
+            incidentes[v].pop()
+        if incidentes[v]:
+            numero = incidentes[v].pop()
+            utilisee[numero] = 1
+            i, j = multigraphe[numero]
+            pile.append(j if i == v else i)
+        else:
+            circuit.append(pile.pop())
+
+    # Raccourcis : chaque ville à sa première apparition
+    visitees = bytearray(n)
+    chemin = []
+    for v in circuit:
+        if not visitees[v]:
+            visitees[v] = 1
+            chemin.append(v)
+    return chemin
+
+
+def _indice_hilbert(x, y, ordre=ORDRE_HILBERT):
+    """Position du point entier (x, y) de la grille 2^ordre le long de la courbe de Hilbert."""
+    d = 0
+    s = 1 << (ordre - 1)
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotation du quadrant
+        if not ry:
+            if rx:
+                x = s - 1 - x
+                y = s - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+
+def courbe_hilbert(matrice, coords=None):
+    """Villes triées le long d'une courbe de Hilbert : O(n log n), coordonnées requises."""
+    points = coordonnees(matrice, coords)
+    if points is None:
+        raise ValueError("La courbe de Hilbert nécessite les coordonnées des villes")
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    x_min, y_min = min(xs), min(ys)
+    etendue = max(max(xs) - x_min, max(ys) - y_min) or 1
+    echelle = ((1 << ORDRE_HILBERT) - 1) / etendue
+    cles = [_indice_hilbert(int((x - x_min) * echelle), int((y - y_min) * echelle))
+            for x, y in zip(xs, ys)]
+    return sorted(range(len(points)), key=cles.__getitem__)
+
+
+HEURISTIQUES = {
+    "plus_proche": plus_proche_voisin,
+    "glouton": aretes_gloutonnes,
+    "christofides": christofides,
+    "hilbert": courbe_hilbert,
+}
+
+
+def _est_chemin(initialisation):
+    return not isinstance(initialisation, str) and len(initialisation) > 0 \
+        and not isinstance(initialisation[0], str)
+
+
+def chemin_initial(matrice, initialisation="aleatoire", coords=None):
+    """Chemin de départ : "aleatoire", nom d'une heuristique de HEURISTIQUES ou chemin fourni.
+
+    coords : coordonnées des villes, nécessaires à "hilbert" et utilisées par
+    "plus_proche" et "glouton" (arbre k-d) ; à défaut, celles de la matrice.
+    """
+    n = len(matrice)
+    if not isinstance(initialisation, str):
+        if not _est_chemin(initialisation):
+            raise ValueError(f"Initialisation inconnue : {initialisation}")
+        chemin = [int(v) for v in initialisation]
+        if sorted(chemin) != list(range(n)):
+            raise ValueError("Le chemin initial doit être une permutation des villes")
+        return chemin
+    if initialisation == "aleatoire":
+        chemin = list(range(n))
+        random.shuffle(chemin)
+        return chemin
+    if initialisation not in HEURISTIQUES:
+        raise ValueError(f"Initialisation inconnue : {initialisation}")
+    if initialisation == "plus_proche":
+        return plus_proche_voisin(matrice, random.randrange(n), coords)
+    if initialisation == "christofides":
+        return christofides(matrice)
+    return HEURISTIQUES[initialisation](matrice, coords=coords)
+
+
+def population_initiale(matrice, taille_population, initialisation="aleatoire", part_heuristique=0.25,
+                        coords=None):
+    """Population de départ de l'algorithme génétique.
+
+    initialisation peut être "aleatoire", un nom d'heuristique, une liste de noms
+    (population mixte) ou un chemin. Une fraction part_heuristique de la
+    population en est issue, le reste est aléatoire. Le plus proche voisin part
+    d'une ville tirée au hasard ; les copies des heuristiques déterministes
+    reçoivent un double pont pour garder de la diversité. coords : cf. chemin_initial.
+    """
+    n = len(matrice)
+    if isinstance(initialisation, str) and initialisation == "aleatoire":
+        return [random.sample(range(n), n) for _ in range(taille_population)]
+    sources = [initialisation] if isinstance(initialisation, str) or _est_chemin(initialisation) \
+        else list(initialisation)
+    nb_heuristiques = max(1, round(part_heuristique * taille_population))
+
+    deja_construits = {}
+    population = []
+    for k in range(min(nb_heuristiques, taille_population)):
+        source = sources[k % len(sources)]
+        cle = tuple(source) if _est_chemin(source) else source
+        if cle == "plus_proche" or cle not in deja_construits:
+            chemin = chemin_initial(matrice, source, coords)
+            deja_construits[cle] = chemin
+            population.append(chemin)
+        else:
+            chemin = deja_construits[cle][:]
+            if n >= 8:
+                appliquer_double_pont(chemin)
+            population.append(chemin)
+    while len(population) < taille_population:
+        population.append(random.sample(range(n), n))
+    return population
@@ -0,0 +1,71 @@
+from collections import defaultdict
+from time import perf_counter_ns
+
+
+class Statistiques:
+    """Compteurs et chronomètres d'un solveur.
+
+    Les solveurs ne mesurent rien si on ne leur passe pas stats=Statistiques().
+    Si un emetteur est fourni, il est appelé avec l'objet au plus une fois par
+    periode secondes, aux points de contrôle du solveur (fin de génération,
+    de palier de température ou d'itération tabou).
+    """
+
+    def __init__(self, emetteur=None, periode=1.0):
+        self.evaluations = 0
+        self.iterations = 0
+        self.propositions = 0
+        self.acceptations = 0
+        self.tabous_rencontres = 0
+        self.aspirations = 0
+        self.echanges_proposes = 0
+        self.echanges_acceptes = 0
+        self.temps_phases_ns = defaultdict(int)
+        self.emetteur = emetteur
+        self.periode_ns = int(periode * 1e9)
+        self._debut_ns = perf_counter_ns()
+        self._prochaine_emission_ns = self._debut_ns + self.periode_ns
+
+    def ajouter_temps(self, phase, debut_ns):
+        """Ajoute à la phase le temps écoulé depuis debut_ns (obtenu par perf_counter_ns())."""
+        self.temps_phases_ns[phase] += perf_counter_ns() - debut_ns
+
+    def point_controle(self):
+        if self.emetteur is not None:
+            maintenant = perf_counter_ns()
+            if maintenant >= self._prochaine_emission_ns:
+                self._prochaine_emission_ns = maintenant + self.periode_ns
+                self.emetteur(self)
+
+    @property
+    def taux_acceptation(self):
+        return self.acceptations / self.propositions if self.propositions else None
+
+    @property
+    def duree(self):
+        return (perf_counter_ns() - self._debut_ns) / 1e9
+
+    def en_dict(self):
+        return {
+            "evaluations": self.evaluations,
+            "iterations": self.iterations,
+            "propositions": self.propositions,
+            "acceptations": self.acceptations,
+            "taux_acceptation": self.taux_acceptation,
+            "tabous_rencontres": self.tabous_rencontres,
+            "aspirations": self.aspirations,
+            "echanges_proposes": self.echanges_proposes,
+            "echanges_acceptes": self.echanges_acceptes,
+            "temps_phases_s": {phase: ns / 1e9 for phase, ns in self.temps_phases_ns.items()},
+            "duree_s": self.duree,
+        }
+
+
+def afficher_statistiques(stats):
+    """Émetteur simple : une ligne par émission."""
+    phases = " ".join(f"{phase}={ns / 1e9:.2f}s" for phase, ns in stats.temps_phases_ns.items())
+    taux = stats.taux_acceptation
+    print(f"[{stats.duree:.1f}s] itérations={stats.iterations} évaluations={stats.evaluations}"
+          + (f" acceptation={taux:.1%}" if taux is not None else "")
+          + (f" tabous={stats.tabous_rencontres}" if stats.tabous_rencontres else "")
+          + (f" {phases}" if phases else ""))
@@ -1,8 +1,6 @@
-import matplotlib.pyplot as plt
-from algo_genetique import algorithme_genetique_tsp
-from recuit_simule import recuit_simule
+from portefeuille import executer_portefeuille, resumer_portefeuille
 
-def comparer_algorithmes(matrice):
+def comparer_algorithmes(matrice, nb_graines=1, nb_processus=None):
 
     print("=" * 80)
     print("COMPARAISON DES ALGORITHMES - TSP")
@@ -12,70 +10,56 @@ def comparer_algorithmes(matrice):
     selections = ["roulette", "rang"]
     croisements = ["1point", "2points", "uniforme"]
 
-    resultats = []
-
+    configurations = []
     for sel in selections:
         for crois in croisements:
-            print(f"\nALGO GENETIQUE - {sel.capitalize()} + {crois.capitalize()}")
-            print("-" * 80)
-            sol, dist, dist_init, hist = algorithme_genetique_tsp(
-                matrice,
-                generations=200,
-                taille_population=50,
-                methode_selection=sel,
-                methode_croisement=crois,
-                proba_croisement=0.8,
-                proba_mutation=0.05,
-                afficher_graphique=False
-            )
-            print(f" Chemin trouvé: {sol}")
-            print(f" Distance initiale: {dist_init:.2f}")
-            print(f" Distance finale: {dist:.2f}")
-            resultats.append((f"AG - {sel.capitalize()} + {crois.capitalize()}", dist, hist))
+            configurations.append((f"AG - {sel.capitalize()} + {crois.capitalize()}", "ag", {
+                "generations": 200,
+                "taille_population": 50,
+                "methode_selection": sel,
+                "methode_croisement": crois,
+                "proba_croisement": 0.8,
+                "proba_mutation": 0.05,
+            }))
 
     # Recuit simulé
-    print("\nRECUIT SIMULÉ")
-    print("-" * 80)
-    sol_rs, dist_rs, init_rs, hist_rs = recuit_simule(
-        matrice,
-        temperature_initiale=1000,
-        temperature_finale=1,
-        alpha=0.95,
-        iterations_par_temperature=100,
-        afficher_graphique=False
-    )
-    print(f" Chemin trouvé: {sol_rs}")
-    print(f" Distance initiale: {init_rs:.2f}")
-    print(f" Distance finale: {dist_rs:.2f}")
-    resultats.append(("Recuit Simulé", dist_rs, hist_rs))
+    configurations.append(("Recuit Simulé", "recuit", {
+        "temperature_initiale": 1000,
+        "temperature_finale": 1,
+        "alpha": 0.95,
+        "iterations_par_temperature": 100,
+    }))
 
-    # 🔹 Graphique comparatif
-    plt.figure(figsize=(14, 8))
-    for nom, _, hist in resultats[:-1]:  # AG
-        plt.plot(hist, label=nom, linewidth=2)
+    # Toutes les (configuration, graine) tournent en parallèle ; affichage au fil de l'eau
+    def afficher_resultat(resultat):
+        print(f"\n{resultat['nom']} (graine {resultat['graine']})")
+        print("-" * 80)
+        print(f" Chemin trouvé: {resultat['chemin']}")
+        print(f" Distance initiale: {resultat['historique'][0]:.2f}")
+        print(f" Distance finale: {resultat['distance']:.2f}")
+        print(f" Temps: {resultat['duree']:.2f} s")
 
-    # Recuit simulé (normaliser X)
-    x_rs = [i * (200 / len(hist_rs)) for i in range(len(hist_rs))]
-    plt.plot(x_rs, hist_rs, label="Recuit Simulé", linewidth=2, linestyle='--')
+    resultats_portefeuille = executer_portefeuille(
+        matrice, configurations, range(nb_graines), nb_processus, callback=afficher_resultat)
 
-    plt.title("Comparaison des Algorithmes - TSP", fontsize=16, fontweight='bold')
-    plt.xlabel("Génération / Itération normalisée", fontsize=12)
-    plt.ylabel("Distance minimale", fontsize=12)
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+    # Historiques de la première graine pour le graphique
+    resultats = [(nom, liste[0]["distance"], liste[0]["historique"])
+                 for nom, liste in resultats_portefeuille.items()]
+
+    # 🔹 Graphique comparatif
+    from affichage import tracer_comparaison
+    tracer_comparaison(resultats)
 
     # 🔹 Tableau récapitulatif
     print("\n" + "=" * 80)
-    print("TABLEAU RÉCAPITULATIF")
+    print(f"TABLEAU RÉCAPITULATIF ({nb_graines} graine(s))")
     print("=" * 80)
-    resultats_table = [(nom, dist) for nom, dist, _ in resultats]
-    resultats_table.sort(key=lambda x: x[1])
-    print(f"\n{'Rang':<5} {'Algorithme':<30} {'Distance':<10}")
+    resume = resumer_portefeuille(resultats_portefeuille)
+    print(f"\n{'Rang':<5} {'Algorithme':<30} {'Moyenne':<10} {'Médiane':<10} {'Meilleure':<10} {'Temps (s)':<10}")
     print("-" * 80)
-    for i, (nom, distance) in enumerate(resultats_table, 1):
-        print(f"{i:<5} {nom:<30} {distance:<10.2f}")
+    for i, ligne in enumerate(resume, 1):
+        print(f"{i:<5} {ligne['nom']:<30} {ligne['moyenne']:<10.2f} {ligne['mediane']:<10.2f} "
+              f"{ligne['meilleure']:<10.2f} {ligne['duree_moyenne']:<10.2f}")
 
 if __name__ == "__main__":
     # Matrice de distances exemple (10 villes)
@@ -0,0 +1,110 @@
+import random
+
+# Évaluation incrémentale des mouvements : seules les arêtes touchées sont
+# recalculées, le chemin n'est jamais copié.
+# Les deltas 2-opt et or-opt supposent une matrice symétrique.
+
+
+def delta_swap(chemin, matrice, i, j):
+    """Variation de distance si l'on échange les villes aux positions i et j."""
+    n = len(chemin)
+    if i == j or n < 3:
+        return 0
+    if i > j:
+        i, j = j, i
+    a_prec, a, a_suiv = chemin[i - 1], chemin[i], chemin[(i + 1) % n]
+    b_prec, b, b_suiv = chemin[j - 1], chemin[j], chemin[(j + 1) % n]
+
+    if j - i == 1:
+        # ... a_prec, a, b, b_suiv ... -> ... a_prec, b, a, b_suiv ...
+        return (matrice[a_prec][b] + matrice[b][a] + matrice[a][b_suiv]
+                - matrice[a_prec][a] - matrice[a][b] - matrice[b][b_suiv])
+    if i == 0 and j == n - 1:
+        # Villes voisines par le retour au départ : ... b_prec, b | a, a_suiv ...
+        return (matrice[b_prec][a] + matrice[a][b] + matrice[b][a_suiv]
+                - matrice[b_prec][b] - matrice[b][a] - matrice[a][a_suiv])
+    return (matrice[a_prec][b] + matrice[b][a_suiv] + matrice[b_prec][a] + matrice[a][b_suiv]
+            - matrice[a_prec][a] - matrice[a][a_suiv] - matrice[b_prec][b] - matrice[b][b_suiv])
+
+
+def aretes_creees_swap(chemin, i, j):
+    """Arêtes (a, b) avec a < b que l'échange des positions i et j fait apparaître."""
+    n = len(chemin)
+    if i > j:
+        i, j = j, i
+    a_prec, a, a_suiv = chemin[i - 1], chemin[i], chemin[(i + 1) % n]
+    b_prec, b, b_suiv = chemin[j - 1], chemin[j], chemin[(j + 1) % n]
+    if j - i == 1:
+        aretes = ((a_prec, b), (a, b_suiv))
+    elif i == 0 and j == n - 1:
+        aretes = ((b_prec, a), (b, a_suiv))
+    else:
+        aretes = ((a_prec, b), (b, a_suiv), (b_prec, a), (a, b_suiv))
+    return [(u, v) if u < v else (v, u) for u, v in aretes]
+
+
+def appliquer_swap(chemin, i, j):
+    chemin[i], chemin[j] = chemin[j], chemin[i]
+
+
+def delta_2opt(chemin, matrice, i, j):
+    """Variation de distance si l'on inverse le segment chemin[i+1..j] (i < j)."""
+    n = len(chemin)
+    a, b = chemin[i], chemin[i + 1]
+    c, d = chemin[j], chemin[(j + 1) % n]
+    return matrice[a][c] + matrice[b][d] - matrice[a][b] - matrice[c][d]
+
+
+def appliquer_2opt(chemin, i, j):
+    chemin[i + 1:j + 1] = chemin[i + 1:j + 1][::-1]
+
+
+def delta_or_opt(chemin, matrice, i, longueur, j):
+    """Variation de distance si l'on déplace chemin[i:i+longueur] entre les positions j et j+1."""
+    n = len(chemin)
+    prec, suiv = chemin[i - 1], chemin[(i + longueur) % n]
+    premier, dernier = chemin[i], chemin[i + longueur - 1]
+    c, d = chemin[j], chemin[(j + 1) % n]
+    return (matrice[prec][suiv] + matrice[c][premier] + matrice[dernier][d]
+            - matrice[prec][premier] - matrice[dernier][suiv] - matrice[c][d])
+
+
+def appliquer_or_opt(chemin, i, longueur, j):
+    segment = chemin[i:i + longueur]
+    del chemin[i:i + longueur]
+    if j > i:
+        j -= longueur
+    chemin[j + 1:j + 1] = segment
+
+
+def appliquer_double_pont(chemin):
+    """Perturbation « double pont » (4-opt non séquentiel) : A B C D -> A C B D.
+
+    Impossible à défaire par un seul 2-opt ou or-opt ; nécessite au moins 8 villes.
+    """
+    a, b, c = sorted(random.sample(range(1, len(chemin)), 3))
+    chemin[a:c] = chemin[b:c] + chemin[a:b]
+
+
+# Tirages aléatoires d'un mouvement valide
+def tirer_swap(n):
+    return random.sample(range(n), 2)
+
+
+def tirer_2opt(n):
+    return sorted(random.sample(range(n), 2))
+
+
+def tirer_or_opt(n):
+    longueur = random.randint(1, min(3, n - 2))
+    i = random.randrange(n - longueur + 1)
+    # j parcourt toutes les positions sauf celles des arêtes qui touchent le segment
+    j = (i + longueur + random.randrange(n - longueur - 1)) % n
+    return i, longueur, j
+
+
+MOUVEMENTS = {
+    "swap": (tirer_swap, delta_swap, appliquer_swap),
+    "2opt": (tirer_2opt, delta_2opt, appliquer_2opt),
+    "oropt": (tirer_or_opt, delta_or_opt, appliquer_or_opt),
+}
@@ -0,0 +1,164 @@
+import math
+import types
+
+# Noyaux des boucles internes (longueur d'un chemin, deltas swap / 2-opt,
+# palier complet du recuit simulé), écrits dans le sous-ensemble de Python que
+# Numba sait compiler : tableaux NumPy, scalaires, aucune allocation.
+#
+# Sans Numba, ces fonctions restent du Python ordinaire (correctes mais lentes
+# sur des tableaux NumPy). Les tirages aléatoires sont faits à l'avance, hors
+# du noyau, pour que la version compilée et la version Python donnent
+# exactement le même résultat : une graine donne le même chemin avec ou sans
+# Numba.
+
+NOYAUX = ("auto", "numba", "python")
+
+_compiles = None
+
+
+def longueur_chemin(chemin, matrice):
+    n = len(chemin)
+    total = 0.0
+    for k in range(n - 1):
+        total += matrice[chemin[k], chemin[k + 1]]
+    return total + matrice[chemin[n - 1], chemin[0]]
+
+
+def delta_swap(chemin, matrice, i, j):
+    """Même calcul que mouvements.delta_swap, sur tableaux."""
+    n = len(chemin)
+    if i == j or n < 3:
+        return 0.0
+    if i > j:
+        i, j = j, i
+    a_prec, a, a_suiv = chemin[i - 1], chemin[i], chemin[(i + 1) % n]
+    b_prec, b, b_suiv = chemin[j - 1], chemin[j], chemin[(j + 1) % n]
+    if j - i == 1:
+        return (matrice[a_prec, b] + matrice[b, a] + matrice[a, b_suiv]
+                - matrice[a_prec, a] - matrice[a, b] - matrice[b, b_suiv])
+    if i == 0 and j == n - 1:
+        return (matrice[b_prec, a] + matrice[a, b] + matrice[b, a_suiv]
+                - matrice[b_prec, b] - matrice[b, a] - matrice[a, a_suiv])
+    return (matrice[a_prec, b] + matrice[b, a_suiv] + matrice[b_prec, a] + matrice[a, b_suiv]
+            - matrice[a_prec, a] - matrice[a, a_suiv] - matrice[b_prec, b] - matrice[b, b_suiv])
+
+
+def delta_2opt(chemin, matrice, i, j):
+    """Même calcul que mouvements.delta_2opt (i < j), sur tableaux."""
+    n = len(chemin)
+    a, b = chemin[i], chemin[i + 1]
+    c, d = chemin[j], chemin[(j + 1) % n]
+    return matrice[a, c] + matrice[b, d] - matrice[a, b] - matrice[c, d]
+
+
+def palier_recuit(chemin, meilleur, matrice, distance, meilleure_distance, temperature,
+                  premiers, seconds, uniformes, deux_opt, acceptations_max, distances):
+    """Un palier du recuit à température fixe, sur les tirages fournis.
+
+    Mouvement k : swap (ou 2-opt si deux_opt) des positions premiers[k] et
+    seconds[k], accepté si delta < 0 ou uniformes[k] < exp(-delta / T).
+    chemin est modifié sur place, meilleur y est recopié à chaque amélioration ;
+    distances[k] reçoit la distance courante après le mouvement k. Le palier
+    s'arrête après acceptations_max acceptations (0 : jamais).
+    Renvoie (distance, meilleure_distance, acceptations, nb_iterations, ameliore).
+    """
+    n = len(chemin)
+    acceptations = 0
+    ameliore = False
+    nb_iterations = 0
+    for k in range(len(premiers)):
+        i, j = premiers[k], seconds[k]
+        if deux_opt:
+            delta = delta_2opt(chemin, matrice, i, j)
+        else:
+            delta = delta_swap(chemin, matrice, i, j)
+
+        if delta < 0 or uniformes[k] < math.exp(-delta / temperature):
+            if deux_opt:
+                gauche, droite = i + 1, j
+                while gauche < droite:
+                    chemin[gauche], chemin[droite] = chemin[droite], chemin[gauche]
+                    gauche += 1
+                    droite -= 1
+            else:
+                chemin[i], chemin[j] = chemin[j], chemin[i]
+            distance += delta
+            acceptations += 1
+            if distance < meilleure_distance:
+                meilleure_distance = distance
+                for v in range(n):
+                    meilleur[v] = chemin[v]
+                ameliore = True
+
+        distances[k] = distance
+        nb_iterations += 1
+        if acceptations_max and acceptations >= acceptations_max:
+            break
+    return distance, meilleure_distance, acceptations, nb_iterations, ameliore
+
+
+def tirer_mouvements(graine, n, nb, deux_opt):
+    """Tirages d'un palier : positions (distinctes, triées pour le 2-opt) et uniformes."""
+    import numpy as np
+    generateur = np.random.default_rng(graine)
+    premiers = generateur.integers(0, n, nb)
+    seconds = generateur.integers(0, n - 1, nb)
+    seconds += seconds >= premiers
+    if deux_opt:
+        premiers, seconds = np.minimum(premiers, seconds), np.maximum(premiers, seconds)
+    return premiers, seconds, generateur.random(nb)
+
+
+def noyaux_compiles():
+    """Noyaux compilés par Numba (dictionnaire nom -> fonction), ou None si Numba est absent.
+
+    La compilation n'a lieu qu'au premier appel ; le cache disque de Numba
+    évite de la refaire d'un processus à l'autre.
+    """
+    global _compiles
+    if _compiles is None:
+        try:
+            import numba
+        except ImportError:
+            _compiles = {}
+        else:
+            compiler = numba.njit(cache=True, nogil=True)
+            # Copies des fonctions dont les globales désignent les versions
+            # compilées : palier_recuit compilé appelle les deltas compilés,
+            # et les fonctions du module restent la référence en Python pur
+            espace = dict(globals())
+            for nom in ("longueur_chemin", "delta_swap", "delta_2opt", "palier_recuit"):
+                fonction = globals()[nom]
+                espace[nom] = compiler(types.FunctionType(fonction.__code__, espace, nom))
+            _compiles = {nom: espace[nom] for nom in
+                         ("longueur_chemin", "delta_swap", "delta_2opt", "palier_recuit")}
+    return _compiles or None
+
+
+def noyaux_python():
+    return {"longueur_chemin": longueur_chemin, "delta_swap": delta_swap,
+            "delta_2opt": delta_2opt, "palier_recuit": palier_recuit}
+
+
+def choisir_noyaux(noyau):
+    """Noyaux à utiliser, ou None pour garder la boucle Python du solveur.
+
+    None     : boucle Python du solveur (autre suite de tirages) ;
+    "auto"   : noyaux compilés si Numba est installé, sinon noyaux Python ;
+    "numba"  : noyaux compilés (ImportError sans Numba) ;
+    "python" : noyaux non compilés.
+    Avec "auto", "numba" et "python", une même graine donne le même résultat.
+    """
+    if noyau is None:
+        return None
+    if noyau not in NOYAUX:
+        raise ValueError(f"Noyau inconnu : {noyau}")
+    if noyau == "python":
+        return noyaux_python()
+    compiles = noyaux_compiles()
+    if compiles is None:
+        if noyau == "numba":
+            raise ImportError("Le noyau numba nécessite le paquet numba")
+        return noyaux_python()
+    return compiles
+
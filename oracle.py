@@ -0,0 +1,114 @@
+import heapq
+import math
+from collections import OrderedDict, defaultdict
+from utils import MatriceParesseuse, calculer_distance_euclidienne
+
+
+class OracleDistances(MatriceParesseuse):
+    """Distances calculées à la demande pour les instances trop grandes pour une matrice n².
+
+    S'utilise partout à la place de la matrice (oracle[i][j], len(oracle)).
+    Les paires demandées sont gardées dans un cache LRU borné, et une table des
+    k plus proches voisins (géométriques) peut être précalculée pour les
+    listes de candidats des solveurs.
+    """
+
+    def __init__(self, coords, distance=calculer_distance_euclidienne,
+                 taille_cache=100_000, k_voisins=0):
+        super().__init__(coords, distance)
+        self.taille_cache = taille_cache
+        self._cache = OrderedDict()
+        self._voisins = self._calculer_voisins(k_voisins) if k_voisins else None
+
+    def __getitem__(self, i):
+        return _LigneOracle(self, i)
+
+    def __getstate__(self):
+        # Le cache n'est pas transmis aux processus workers
+        etat = self.__dict__.copy()
+        etat["_cache"] = OrderedDict()
+        return etat
+
+    def distance_paire(self, i, j):
+        if i == j:
+            # Comme la matrice complète (certaines distances TSPLIB, GEO, ne sont pas nulles en (i, i))
+            return 0
+        if not self.taille_cache:
+            return self.distance(self.coords[i], self.coords[j])
+        cle = i * len(self.coords) + j if i < j else j * len(self.coords) + i
+        cache = self._cache
+        distance = cache.get(cle)
+        if distance is None:
+            distance = self.distance(self.coords[i], self.coords[j])
+            cache[cle] = distance
+            if len(cache) > self.taille_cache:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(cle)
+        return distance
+
+    def voisins_proches(self, k):
+        """k plus proches voisins de chaque ville (table précalculée si assez large)."""
+        if self._voisins is not None and k <= len(self._voisins[0]):
+            return [voisins[:k] for voisins in self._voisins]
+        return self._calculer_voisins(k)
+
+    def _calculer_voisins(self, k):
+        # Grille uniforme (~2 villes par case) parcourue en anneaux croissants autour
+        # de chaque ville : on s'arrête dès que les cases non vues ne peuvent plus
+        # contenir de voisin plus proche que le k-ième trouvé. Jamais de parcours n².
+        points = self.coords
+        n = len(points)
+        k = min(k, n - 1)
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        x_min, y_min = min(xs), min(ys)
+        largeur, hauteur = max(xs) - x_min, max(ys) - y_min
+        aire = largeur * hauteur if largeur and hauteur else max(largeur, hauteur, 1.0) ** 2 / n
+        taille = math.sqrt(2 * aire / n) or 1.0
+        nb_cases = int(max(largeur, hauteur) / taille) + 1
+
+        grille = defaultdict(list)
+        cases = []
+        for i in range(n):
+            case = (int((xs[i] - x_min) / taille), int((ys[i] - y_min) / taille))
+            grille[case].append(i)
+            cases.append(case)
+
+        voisins = []
+        for i in range(n):
+            x, y = xs[i], ys[i]
+            cx, cy = cases[i]
+            candidats = []
+            for r in range(nb_cases + 1):
+                if r == 0:
+                    anneau = [(cx, cy)]
+                else:
+                    anneau = [(cx + d, cy - r) for d in range(-r, r + 1)]
+                    anneau += [(cx + d, cy + r) for d in range(-r, r + 1)]
+                    anneau += [(cx - r, cy + d) for d in range(-r + 1, r)]
+                    anneau += [(cx + r, cy + d) for d in range(-r + 1, r)]
+                for case in anneau:
+                    for j in grille.get(case, ()):
+                        if j != i:
+                            candidats.append(((xs[j] - x) ** 2 + (ys[j] - y) ** 2, j))
+                if len(candidats) >= k:
+                    candidats = heapq.nsmallest(k, candidats)
+                    if candidats[-1][0] <= (r * taille) ** 2:
+                        break
+            voisins.append([j for _, j in candidats])
+        return voisins
+
+
+class _LigneOracle:
+    __slots__ = ("oracle", "i")
+
+    def __init__(self, oracle, i):
+        self.oracle = oracle
+        self.i = i
+
+    def __len__(self):
+        return len(self.oracle)
+
+    def __getitem__(self, j):
+        return self.oracle.distance_paire(self.i, j)
@@ -0,0 +1,66 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+import numpy as np
+
+# Au-delà de ce nombre de villes, les workers indexent directement la mémoire
+# partagée au lieu d'en faire une copie en listes Python (plus rapides mais n² objets).
+SEUIL_LISTE = 2000
+
+# Matrice attachée une fois pour toutes dans chaque processus worker
+_matrice = None
+_memoire = None
+
+
+def partager_matrice(matrice):
+    """Copie la matrice en mémoire partagée ; renvoie (memoire, descripteur transmis aux workers)."""
+    if isinstance(matrice, np.memmap) and matrice.filename:
+        # Déjà sur disque : chaque worker réouvre le même fichier en mémoire mappée
+        return None, ("memmap", matrice.filename)
+    if isinstance(matrice, (list, np.ndarray)):
+        tableau = np.asarray(matrice, dtype=np.float64)
+        memoire = shared_memory.SharedMemory(create=True, size=max(tableau.nbytes, 1))
+        np.ndarray(tableau.shape, dtype=tableau.dtype, buffer=memoire.buf)[:] = tableau
+        return memoire, ("partagee", memoire.name, tableau.shape, tableau.dtype.str)
+    # Matrices calculées à la demande : compactes, transmises une seule fois par worker
+    return None, ("objet", matrice)
+
+
+def initialiser_worker(descripteur):
+    global _matrice, _memoire
+    if descripteur[0] == "objet":
+        _matrice = descripteur[1]
+        return
+    if descripteur[0] == "memmap":
+        tableau = np.load(descripteur[1], mmap_mode="r")
+        _matrice = tableau.tolist() if len(tableau) <= SEUIL_LISTE else tableau
+        return
+    _, nom, forme, dtype = descripteur
+    memoire = shared_memory.SharedMemory(name=nom)
+    tableau = np.ndarray(forme, dtype=dtype, buffer=memoire.buf)
+    if forme[0] <= SEUIL_LISTE:
+        _matrice = tableau.tolist()
+        memoire.close()
+    else:
+        _matrice = tableau
+        _memoire = memoire
+
+
+def matrice_worker():
+    """Matrice de distances du processus worker courant."""
+    return _matrice
+
+
+@contextmanager
+def pool_matrice_partagee(matrice, nb_processus=None):
+    """ProcessPoolExecutor dont les workers partagent la matrice sans la recevoir à chaque tâche."""
+    memoire, descripteur = partager_matrice(matrice)
+    try:
+        with ProcessPoolExecutor(max_workers=nb_processus,
+                                 initializer=initialiser_worker,
+                                 initargs=(descripteur,)) as pool:
+            yield pool
+    finally:
+        if memoire is not None:
+            memoire.close()
+            memoire.unlink()
@@ -0,0 +1,94 @@
+from array import array
+from itertools import chain
+from utils import SEUIL_NUMPY, est_tableau_numpy
+
+# Population compacte : tous les chemins d'une génération dans un tableau
+# NumPy int32 (taille x n), en double tampon. Les enfants sont écrits en place
+# dans les lignes du second tampon par les croisements vectorisés, puis les
+# deux tampons sont échangés : aucune liste d'entiers n'est allouée par enfant,
+# et toute la génération est évaluée en un seul appel NumPy.
+#
+# Réservée aux grandes instances (et aux matrices NumPy) : sur quelques
+# centaines de villes, les listes et les boucles Python restent plus rapides
+# que les appels NumPy par enfant. Les points de reprise stockent la
+# population en int32 dans les deux cas.
+
+
+def population_compacte_utile(matrice):
+    """Vrai si la population de l'algorithme génétique doit être compacte pour cette matrice."""
+    return est_tableau_numpy(matrice) or len(matrice) > SEUIL_NUMPY
+
+
+def octets_chemins(chemins):
+    """Chemins (listes de même longueur) en int32 contigus, format de en_octets()."""
+    return array('i', chain.from_iterable(chemins)).tobytes()
+
+
+def chemins_depuis_octets(donnees, taille, n):
+    """Inverse de octets_chemins : liste de taille chemins de n villes."""
+    valeurs = array('i')
+    valeurs.frombytes(donnees)
+    valeurs = valeurs.tolist()
+    return [valeurs[k * n:(k + 1) * n] for k in range(taille)]
+
+
+class PopulationCompacte:
+    """Population de taille individus de n villes, en double tampon.
+
+    population[k] est la ligne (vue NumPy) du k-ième chemin de la génération
+    courante ; emplacement(k) est la ligne où écrire le k-ième enfant.
+    """
+
+    def __init__(self, taille, n):
+        import numpy as np
+        self.taille = taille
+        self.n = n
+        self._tampons = [np.zeros((taille, n), dtype=np.int32), np.zeros((taille, n), dtype=np.int32)]
+
+    @classmethod
+    def depuis_listes(cls, chemins):
+        chemins = list(chemins)
+        population = cls(len(chemins), len(chemins[0]) if chemins else 0)
+        population._tampons[0][:] = chemins
+        return population
+
+    @classmethod
+    def depuis_octets(cls, donnees, taille, n):
+        """Population reconstruite à partir de en_octets() (points de reprise)."""
+        import numpy as np
+        population = cls(taille, n)
+        population._tampons[0][:] = np.frombuffer(donnees, dtype=np.int32).reshape(taille, n)
+        return population
+
+    def en_octets(self):
+        """Copie binaire (int32) de la génération courante."""
+        return self._tampons[0].tobytes()
+
+    def __len__(self):
+        return self.taille
+
+    def __getitem__(self, k):
+        return self._tampons[0][k]
+
+    def __iter__(self):
+        return iter(self._tampons[0])
+
+    def __array__(self, dtype=None, copy=None):
+        # Génération courante sans copie, pour l'évaluation vectorisée
+        tableau = self._tampons[0]
+        return tableau if dtype is None else tableau.astype(dtype)
+
+    def emplacement(self, k):
+        """Ligne en écriture du k-ième individu de la génération suivante."""
+        return self._tampons[1][k]
+
+    def copier(self, k, emplacement):
+        """Recopie l'individu courant k dans l'emplacement donné de la génération suivante."""
+        self._tampons[1][emplacement] = self._tampons[0][k]
+
+    def echanger_tampons(self):
+        """La génération suivante devient la génération courante."""
+        self._tampons.reverse()
+
+    def en_listes(self):
+        return self._tampons[0].tolist()
@@ -0,0 +1,57 @@
+import random
+import statistics
+import time
+from concurrent.futures import as_completed
+from parallele import matrice_worker, pool_matrice_partagee
+from solveurs import lancer_solveur
+
+
+def executer_tache(nom, algorithme, parametres, graine):
+    """Exécute une configuration dans un worker ; la matrice est celle du worker."""
+    random.seed(graine)
+    matrice = matrice_worker()
+    debut = time.perf_counter()
+    chemin, distance, historique = lancer_solveur(algorithme, matrice, parametres)
+    duree = time.perf_counter() - debut
+    return {"nom": nom, "graine": graine, "chemin": chemin, "distance": distance,
+            "historique": historique, "duree": duree}
+
+
+def executer_portefeuille(matrice, configurations, graines, nb_processus=None, callback=None):
+    """Lance chaque (configuration, graine) dans un pool de processus.
+
+    configurations : liste de (nom, algorithme, parametres) avec algorithme
+    parmi "ag", "recuit", "tabou". Les résultats sont collectés au fil de l'eau
+    (callback(resultat) appelé dès qu'une tâche se termine) et regroupés par nom.
+    """
+    resultats = {nom: [] for nom, _, _ in configurations}
+    with pool_matrice_partagee(matrice, nb_processus) as pool:
+        taches = [pool.submit(executer_tache, nom, algorithme, parametres, graine)
+                  for nom, algorithme, parametres in configurations
+                  for graine in graines]
+        for tache in as_completed(taches):
+            resultat = tache.result()
+            resultats[resultat["nom"]].append(resultat)
+            if callback:
+                callback(resultat)
+    for liste in resultats.values():
+        liste.sort(key=lambda r: r["graine"])
+    return resultats
+
+
+def resumer_portefeuille(resultats):
+    """Moyenne / médiane / meilleure distance et temps moyen par configuration."""
+    resume = []
+    for nom, liste in resultats.items():
+        distances = [r["distance"] for r in liste]
+        durees = [r["duree"] for r in liste]
+        resume.append({
+            "nom": nom,
+            "moyenne": statistics.mean(distances),
+            "mediane": statistics.median(distances),
+            "meilleure": min(distances),
+            "duree_moyenne": statistics.mean(durees),
+            "nb_graines": len(liste),
+        })
+    resume.sort(key=lambda r: r["moyenne"])
+    return resume
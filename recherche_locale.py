@@ -0,0 +1,204 @@
+from collections import deque
+from utils import calculer_distance, voisins_proches
+
+# Recherche locale par listes de voisins et bits "don't look" : seules les
+# villes dont l'entourage a changé sont réexaminées. Toutes les modifications
+# du chemin sont des échanges 2-opt (deux arêtes retirées, deux ajoutées)
+# appliqués en place avec un tableau des positions ; l'inversion porte
+# toujours sur le plus court des deux côtés du cycle.
+# Les gains supposent une matrice symétrique.
+
+EPSILON = 1e-9
+
+METHODES = ("2opt", "oropt", "or3opt", "lk")
+
+
+def _inverser(chemin, positions, i, j):
+    """Inverse le segment cyclique chemin[i..j] (ou son complément, équivalent et plus court)."""
+    n = len(chemin)
+    longueur = (j - i) % n + 1
+    if 2 * longueur > n:
+        i, j = (j + 1) % n, (i - 1) % n
+        longueur = n - longueur
+    for _ in range(longueur // 2):
+        a, b = chemin[i], chemin[j]
+        chemin[i], chemin[j] = b, a
+        positions[b], positions[a] = i, j
+        i = (i + 1) % n
+        j = (j - 1) % n
+
+
+def _echanger(chemin, positions, a, b, c, d):
+    """Remplace les arêtes (a, b) et (c, d) par (a, c) et (b, d).
+
+    b et d doivent être du même côté de a et c : b = succ(a) et d = succ(c),
+    ou b = pred(a) et d = pred(c). Le sens de parcours final n'importe pas.
+    """
+    n = len(chemin)
+    if chemin[(positions[a] + 1) % n] == b:
+        _inverser(chemin, positions, positions[b], positions[c])
+    else:
+        _inverser(chemin, positions, positions[a], positions[d])
+
+
+class _Etat:
+    """Chemin, positions, matrice et file des villes actives (bits don't look)."""
+
+    def __init__(self, chemin, matrice, voisins):
+        self.chemin = list(chemin)
+        self.n = len(chemin)
+        self.positions = [0] * self.n
+        for position, ville in enumerate(self.chemin):
+            self.positions[ville] = position
+        self.matrice = matrice
+        self.voisins = voisins
+        self.actives = deque(self.chemin)
+        self.active = bytearray([1]) * self.n
+        self.delta = 0
+
+    def succ(self, ville):
+        return self.chemin[(self.positions[ville] + 1) % self.n]
+
+    def pred(self, ville):
+        return self.chemin[self.positions[ville] - 1]
+
+    def activer(self, *villes):
+        for ville in villes:
+            if not self.active[ville]:
+                self.active[ville] = 1
+                self.actives.append(ville)
+
+    def echanger(self, a, b, c, d):
+        m = self.matrice
+        self.delta += m[a][c] + m[b][d] - m[a][b] - m[c][d]
+        _echanger(self.chemin, self.positions, a, b, c, d)
+
+
+def _deux_opt(etat, a):
+    """Premier échange 2-opt améliorant autour de a, parmi ses plus proches voisins."""
+    m = etat.matrice
+    for voisin_de in (etat.succ, etat.pred):
+        b = voisin_de(a)
+        d_ab = m[a][b]
+        for c in etat.voisins[a]:
+            d_ac = m[a][c]
+            if d_ac >= d_ab:
+                break
+            d = voisin_de(c)
+            if c == b or d == a:
+                continue
+            if d_ac + m[b][d] - d_ab - m[c][d] < -EPSILON:
+                etat.echanger(a, b, c, d)
+                etat.activer(a, b, c, d)
+                return True
+    return False
+
+
+def _or_opt(etat, a, longueur_max=3):
+    """Premier déplacement améliorant d'un segment de 1 à 3 villes commençant ou finissant en a."""
+    m = etat.matrice
+    n = etat.n
+    for longueur in range(1, longueur_max + 1):
+        if n < longueur + 3:
+            break
+        for debut in (a, etat.chemin[(etat.positions[a] - longueur + 1) % n]):
+            s1 = debut
+            s2 = etat.chemin[(etat.positions[s1] + longueur - 1) % n]
+            p, nx = etat.pred(s1), etat.succ(s2)
+            gain_retrait = m[p][s1] + m[s2][nx] - m[p][nx]
+            segment = {etat.chemin[(etat.positions[s1] + k) % n] for k in range(longueur)}
+            for extremite in (s1, s2):
+                for c in etat.voisins[extremite]:
+                    if m[extremite][c] >= gain_retrait:
+                        break
+                    if c in segment:
+                        continue
+                    for x, y in ((c, etat.succ(c)), (etat.pred(c), c)):
+                        if x in segment or y in segment or x == nx or y == p:
+                            continue
+                        direct = m[x][s1] + m[s2][y]
+                        inverse = m[x][s2] + m[s1][y]
+                        if min(direct, inverse) - m[x][y] - gain_retrait < -EPSILON:
+                            # p s1..s2 nx ... x y  ->  p nx ... x [s1..s2 ou s2..s1] y
+                            etat.echanger(p, s1, x, y)
+                            etat.echanger(p, x, nx, s2)
+                            if direct < inverse:
+                                etat.echanger(x, s2, s1, y)
+                            etat.activer(p, nx, s1, s2, x, y)
+                            return True
+            if longueur == 1:
+                break
+    return False
+
+
+def _lin_kernighan(etat, t1, profondeur_max=5):
+    """Chaîne d'échanges 2-opt à la Lin-Kernighan, bornée en profondeur, à partir de t1.
+
+    La chaîne est annulée si aucun de ses préfixes n'améliore le chemin.
+    """
+    m = etat.matrice
+    for cote in (etat.succ, etat.pred):
+        t2 = cote(t1)
+        gain = m[t1][t2]
+        delta_depart = etat.delta
+        appliques = []
+        ajoutees = set()
+        for _ in range(profondeur_max):
+            # Le côté peut s'être inversé après une inversion du complément
+            oppose = etat.pred if etat.succ(t1) == t2 else etat.succ
+            meilleur = None
+            for t3 in etat.voisins[t2]:
+                g1 = gain - m[t2][t3]
+                if g1 <= EPSILON:
+                    break
+                if t3 == t1 or t3 == etat.succ(t2) or t3 == etat.pred(t2):
+                    continue
+                t4 = oppose(t3)
+                if t4 == t1 or frozenset((t3, t4)) in ajoutees:
+                    continue
+                valeur = g1 + m[t3][t4]
+                if meilleur is None or valeur > meilleur[0]:
+                    meilleur = (valeur, t3, t4)
+            if meilleur is None:
+                break
+            gain, t3, t4 = meilleur
+            etat.echanger(t1, t2, t4, t3)
+            appliques.append((t1, t2, t4, t3))
+            ajoutees.add(frozenset((t2, t3)))
+            t2 = t4
+            if etat.delta - delta_depart < -EPSILON:
+                for a, b, c, d in appliques:
+                    etat.activer(a, b, c, d)
+                return True
+        # Aucun gain : on défait la chaîne dans l'ordre inverse
+        for a, b, c, d in reversed(appliques):
+            etat.echanger(a, c, b, d)
+    return False
+
+
+def ameliorer_chemin(chemin, matrice, methode="or3opt", k_voisins=10, voisins=None,
+                     profondeur_lk=5):
+    """Optimise localement un chemin jusqu'à un optimum local ; renvoie (chemin, distance).
+
+    methode : "2opt", "oropt", "or3opt" (2-opt + Or-opt) ou "lk" (chaînes
+    Lin-Kernighan bornées + Or-opt). Le chemin d'origine n'est pas modifié.
+    """
+    if methode not in METHODES:
+        raise ValueError(f"Méthode de recherche locale inconnue : {methode}")
+    if len(chemin) < 5:
+        return list(chemin), calculer_distance(chemin, matrice)
+    if voisins is None:
+        voisins = voisins_proches(matrice, k_voisins)
+    etat = _Etat(chemin, matrice, voisins)
+
+    while etat.actives:
+        a = etat.actives.popleft()
+        etat.active[a] = 0
+        if methode in ("2opt", "or3opt") and _deux_opt(etat, a):
+            continue
+        if methode == "lk" and _lin_kernighan(etat, a, profondeur_lk):
+            continue
+        if methode in ("oropt", "or3opt", "lk") and _or_opt(etat, a):
+            continue
+
+    return etat.chemin, calculer_distance(etat.chemin, matrice)
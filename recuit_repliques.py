@@ -0,0 +1,168 @@
+import math
+import random
+from utils import calculer_distance
+from mouvements import MOUVEMENTS
+from recherche_locale import ameliorer_chemin
+from initialisation import chemin_initial
+from parallele import matrice_worker, pool_matrice_partagee
+from historique import Historique
+from refroidissement import calibrer_temperatures
+
+# Taux d'échange visé entre températures voisines et vitesse d'adaptation de l'échelle
+TAUX_ECHANGE_CIBLE = 0.23
+PAS_ADAPTATION = 0.5
+
+
+def marcher_replique(chemin, distance, temperature, nb_iterations, type_mouvement, graine):
+    """Chaîne de Metropolis à température fixe dans un worker, entre deux échanges."""
+    random.seed(graine)
+    matrice = matrice_worker()
+    tirer_mouvement, calculer_delta, appliquer_mouvement = MOUVEMENTS[type_mouvement]
+    n_villes = len(chemin)
+    meilleur_chemin, meilleure_distance = chemin[:], distance
+    acceptations = 0
+    for _ in range(nb_iterations):
+        mouvement = tirer_mouvement(n_villes)
+        delta = calculer_delta(chemin, matrice, *mouvement)
+        if delta < 0 or random.random() < math.exp(-delta / temperature):
+            appliquer_mouvement(chemin, *mouvement)
+            distance += delta
+            acceptations += 1
+            if distance < meilleure_distance:
+                meilleur_chemin, meilleure_distance = chemin[:], distance
+    return chemin, distance, meilleur_chemin, meilleure_distance, acceptations
+
+
+def echelle_temperatures(temperature_min, temperature_max, nb_repliques):
+    """Températures en progression géométrique, de la plus froide à la plus chaude."""
+    if nb_repliques == 1:
+        return [temperature_min]
+    rapport = (temperature_max / temperature_min) ** (1 / (nb_repliques - 1))
+    return [temperature_min * rapport ** k for k in range(nb_repliques)]
+
+
+def echanger_repliques(chemins, distances, temperatures, parite, rng):
+    """Tente l'échange des états de températures voisines (paires paires ou impaires).
+
+    Critère de Metropolis : accepté avec la probabilité
+    min(1, exp((1/Ti - 1/Tj) (Ei - Ej))). Renvoie les essais (i, accepté) de la paire (i, i+1).
+    """
+    essais = []
+    for i in range(parite, len(temperatures) - 1, 2):
+        j = i + 1
+        exposant = (1 / temperatures[i] - 1 / temperatures[j]) * (distances[i] - distances[j])
+        accepte = exposant >= 0 or rng.random() < math.exp(exposant)
+        if accepte:
+            chemins[i], chemins[j] = chemins[j], chemins[i]
+            distances[i], distances[j] = distances[j], distances[i]
+        essais.append((i, accepte))
+    return essais
+
+
+def ajuster_echelle(temperatures, essais, taux_cible, pas=PAS_ADAPTATION):
+    """Adapte l'écart logarithmique entre températures voisines : il s'élargit
+    après un échange accepté et se resserre après un refus, de sorte que chaque
+    paire tende vers taux_cible. La température la plus froide reste fixe."""
+    ecarts = [math.log(temperatures[k + 1] / temperatures[k]) for k in range(len(temperatures) - 1)]
+    for i, accepte in essais:
+        ecarts[i] *= math.exp(pas * (accepte - taux_cible))
+    temperatures[1:] = []
+    for ecart in ecarts:
+        temperatures.append(temperatures[-1] * math.exp(ecart))
+
+
+def recuit_echange_repliques(
+    matrice,
+    nb_repliques=8,
+    temperature_min="auto",
+    temperature_max="auto",
+    nb_echanges=200,
+    iterations_par_echange=500,
+    taux_echange_cible=TAUX_ECHANGE_CIBLE,
+    type_mouvement="2opt",
+    initialisation="aleatoire",
+    recherche_locale=None,
+    nb_processus=None,
+    graine=None,
+    arret=None,
+    historique=None,
+    stats=None,
+    coords=None
+):
+    """Recuit à échange de répliques (parallel tempering) : nb_repliques chaînes
+    de Metropolis à températures fixes, une par processus, qui tentent toutes les
+    iterations_par_echange itérations d'échanger leurs états entre températures
+    voisines (paires paires et impaires en alternance).
+
+    temperature_min / temperature_max : bornes de l'échelle géométrique ou
+    "auto" (calibrées comme temperature_finale / temperature_initiale du recuit).
+    taux_echange_cible : l'échelle est ensuite adaptée au fil des échanges pour
+    que chaque paire voisine atteigne ce taux d'échanges acceptés, à partir de
+    la température la plus froide (None : échelle fixe).
+    Renvoie (meilleur_chemin, meilleure_distance, distance_initiale, historique)
+    comme recuit_simule, l'historique étant le meilleur global à chaque échange.
+    stats reçoit les mouvements proposés / acceptés de toutes les chaînes et les
+    échanges proposés / acceptés. coords : cf. initialisation.chemin_initial.
+    """
+    rng = random.Random(graine)
+    n_villes = len(matrice)
+    tirer_mouvement, calculer_delta, _ = MOUVEMENTS[type_mouvement]
+    # Initialisation et calibration tirent dans random : graine dérivée de rng,
+    # état du générateur de l'appelant rétabli ensuite
+    etat_aleatoire = random.getstate()
+    random.seed(rng.getrandbits(64))
+    try:
+        chemins = [chemin_initial(matrice, initialisation, coords) for _ in range(nb_repliques)]
+        temperature_max, temperature_min = calibrer_temperatures(
+            chemins[0], matrice, tirer_mouvement, calculer_delta, temperature_max, temperature_min)
+    finally:
+        random.setstate(etat_aleatoire)
+    distances = [calculer_distance(chemin, matrice) for chemin in chemins]
+    distance_initiale = min(distances)
+
+    temperatures = echelle_temperatures(temperature_min, temperature_max, nb_repliques)
+
+    i_meilleur = min(range(nb_repliques), key=distances.__getitem__)
+    meilleur_chemin, meilleure_distance = chemins[i_meilleur][:], distances[i_meilleur]
+    historique = historique if historique is not None else Historique()
+    historique.ajouter(meilleure_distance)
+    if arret is not None:
+        arret.demarrer()
+
+    with pool_matrice_partagee(matrice, nb_processus or nb_repliques) as pool:
+        for echange in range(nb_echanges):
+            taches = [pool.submit(marcher_replique, chemin, distance, temperature,
+                                  iterations_par_echange, type_mouvement, rng.getrandbits(64))
+                      for chemin, distance, temperature in zip(chemins, distances, temperatures)]
+            resultats = [tache.result() for tache in taches]
+            chemins = [chemin for chemin, _, _, _, _ in resultats]
+            distances = [distance for _, distance, _, _, _ in resultats]
+            for _, _, chemin, distance, _ in resultats:
+                if distance < meilleure_distance:
+                    meilleur_chemin, meilleure_distance = chemin, distance
+            historique.ajouter(meilleure_distance)
+
+            essais = echanger_repliques(chemins, distances, temperatures, echange % 2, rng)
+            if taux_echange_cible is not None:
+                ajuster_echelle(temperatures, essais, taux_echange_cible)
+            if stats is not None:
+                nb_iterations = nb_repliques * iterations_par_echange
+                stats.evaluations += nb_iterations
+                stats.propositions += nb_iterations
+                stats.iterations += nb_iterations
+                stats.acceptations += sum(resultat[4] for resultat in resultats)
+                stats.echanges_proposes += len(essais)
+                stats.echanges_acceptes += sum(accepte for _, accepte in essais)
+                stats.point_controle()
+
+            if arret is not None and arret.verifier(meilleure_distance,
+                                                    nb_repliques * iterations_par_echange):
+                break
+
+    if recherche_locale:
+        meilleur_chemin, meilleure_distance = ameliorer_chemin(meilleur_chemin, matrice, recherche_locale)
+    else:
+        # Recalcul exact (les distances des chaînes cumulent des deltas)
+        meilleure_distance = calculer_distance(meilleur_chemin, matrice)
+
+    return meilleur_chemin, meilleure_distance, distance_initiale, historique
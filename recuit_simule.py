@@ -1,8 +1,19 @@
-
-
 import random
 import math
-from utils import calculer_distance
+from time import perf_counter_ns
+from utils import calculer_distance, en_matrice_numpy, est_tableau_numpy
+from mouvements import MOUVEMENTS
+from recherche_locale import ameliorer_chemin
+from initialisation import chemin_initial
+from reprise import EcrivainReprise, charger_reprise
+from historique import Historique
+from noyaux import choisir_noyaux, tirer_mouvements
+from refroidissement import (PROGRAMMES, beta_lundy_mees, calibrer_temperatures,
+                             nombre_paliers, temperature_suivante)
+
+# Nombre de paliers consécutifs sans aucune acceptation au-delà duquel le
+# système est considéré comme gelé (avec equilibre=True)
+PALIERS_GEL = 3
 
 def recuit_simule(matrice_distances,
                   temperature_initiale=1000,
@@ -10,48 +21,213 @@ def recuit_simule(matrice_distances,
                   alpha=0.95,
                   iterations_par_temperature=100,
                   afficher_graphique=False,
-                  callback=None):
+                  callback=None,
+                  type_mouvement="swap",
+                  recherche_locale=None,
+                  initialisation="aleatoire",
+                  sauvegarde=None,
+                  intervalle_sauvegarde=10,
+                  reprendre_depuis=None,
+                  arret=None,
+                  historique=None,
+                  programme="geometrique",
+                  rechauffage=None,
+                  nb_rechauffages=3,
+                  equilibre=False,
+                  stats=None,
+                  noyau=None,
+                  coords=None):
+    """historique : enregistreur Historique de la distance courante à chaque itération
+    (par défaut, toutes les valeurs sont conservées ; cf. ses modes bornés).
+
+    temperature_initiale / temperature_finale : valeurs ou "auto" (calibrées sur
+    les deltas de mouvements tirés depuis le chemin initial).
+    programme : "geometrique", "lundy_mees" ou "acceptation" (cf. refroidissement).
+    rechauffage : nombre de paliers sans amélioration du meilleur après lequel la
+    température remonte au double de celle du dernier progrès (au plus
+    nb_rechauffages fois).
+    equilibre : un palier s'arrête dès iterations_par_temperature // 10
+    acceptations, et la résolution quand le système est gelé.
+    noyau : None (boucle Python), "auto" (paliers compilés par Numba s'il est
+    installé, non compilés sinon), "numba" ou "python" ; ces trois derniers
+    tirent les mouvements de la même façon et donnent le même résultat pour une
+    même graine, avec ou sans Numba. Les noyaux couvrent les mouvements swap et 2opt sur
+    une matrice complète, sans callback ; l'échéance d'arrêt est alors vérifiée
+    entre les paliers. Exposé par solveurs.lancer_solveur (option --noyau de
+    resoudre.py et benchmark.py, clé "noyau" des requêtes du service).
+    coords : coordonnées des villes pour les initialisations heuristiques
+    (cf. initialisation.chemin_initial).
+    """
+    if arret is not None:
+        arret.demarrer()
 
     n_villes = len(matrice_distances)
-    # Chemin initial aléatoire
-    chemin = list(range(n_villes))
-    random.shuffle(chemin)
-    distance_actuelle = calculer_distance(chemin, matrice_distances)
-    distance_initiale = distance_actuelle
-
-    meilleur_chemin = chemin.copy()
-    meilleure_distance = distance_actuelle
-
-    temperature = temperature_initiale
-    historique = [distance_actuelle]
-    iteration_totale = 0
-
-    while temperature > temperature_finale:
-        for _ in range(iterations_par_temperature):
-            # Générer voisin par swap de 2 villes
-            i, j = random.sample(range(n_villes), 2)
-            voisin = chemin.copy()
-            voisin[i], voisin[j] = voisin[j], voisin[i]
-            distance_voisin = calculer_distance(voisin, matrice_distances)
-
-            delta = distance_voisin - distance_actuelle
-
-            if delta < 0 or random.random() < math.exp(-delta / temperature):
-                chemin = voisin
-                distance_actuelle = distance_voisin
-
-                # Mise à jour du meilleur
-                if distance_actuelle < meilleure_distance:
-                    meilleur_chemin = chemin.copy()
-                    meilleure_distance = distance_actuelle
-
-            historique.append(distance_actuelle)
-            iteration_totale += 1
-
-            # Appel du callback pour la simulation interactive
-            if callback:
-                callback(iteration_totale, chemin, distance_actuelle, historique, temperature)
-
-        temperature *= alpha
+    tirer_mouvement, calculer_delta, appliquer_mouvement = MOUVEMENTS[type_mouvement]
+    if programme not in PROGRAMMES:
+        raise ValueError(f"Programme de température inconnu : {programme}")
+    if programme != "geometrique":
+        # Nombre de paliers fixé à l'avance : il faut une décroissance géométrique de référence
+        if temperature_finale != "auto" and not temperature_finale > 0:
+            raise ValueError(f"Le programme {programme} nécessite temperature_finale > 0")
+        if not 0 < alpha < 1:
+            raise ValueError(f"Le programme {programme} nécessite 0 < alpha < 1")
+    acceptations_equilibre = max(1, iterations_par_temperature // 10)
+
+    if reprendre_depuis is not None:
+        # Reprise à l'identique au début d'un palier de température
+        etat = charger_reprise(reprendre_depuis, "recuit")
+        chemin, distance_actuelle = etat["chemin"], etat["distance_actuelle"]
+        meilleur_chemin, meilleure_distance = etat["meilleur_chemin"], etat["meilleure_distance"]
+        distance_initiale, temperature = etat["distance_initiale"], etat["temperature"]
+        historique, iteration_totale = etat["historique"], etat["iteration_totale"]
+        palier = etat["palier"]
+        temperature_finale, nb_paliers, beta = etat["temperature_finale"], etat["nb_paliers"], etat["beta"]
+        temperature_progres, palier_progres = etat["temperature_progres"], etat["palier_progres"]
+        rechauffages, paliers_geles = etat["rechauffages"], etat["paliers_geles"]
+        random.setstate(etat["aleatoire"])
+    else:
+        # Chemin initial : aléatoire, heuristique constructive ou fourni
+        chemin = chemin_initial(matrice_distances, initialisation, coords)
+        distance_actuelle = calculer_distance(chemin, matrice_distances)
+        distance_initiale = distance_actuelle
+
+        meilleur_chemin = chemin.copy()
+        meilleure_distance = distance_actuelle
+
+        temperature, temperature_finale = calibrer_temperatures(
+            chemin, matrice_distances, tirer_mouvement, calculer_delta,
+            temperature_initiale, temperature_finale)
+        nb_paliers = nombre_paliers(temperature, temperature_finale, alpha) \
+            if programme != "geometrique" else None
+        beta = beta_lundy_mees(temperature, temperature_finale, nb_paliers) \
+            if programme == "lundy_mees" else None
+        historique = historique if historique is not None else Historique()
+        historique.ajouter(distance_actuelle)
+        iteration_totale = 0
+        palier = 0
+        # Dernier progrès du meilleur (pour le réchauffage) et paliers gelés consécutifs
+        temperature_progres, palier_progres = temperature, 0
+        rechauffages = paliers_geles = 0
+    noyaux = None
+    if callback is None and type_mouvement in ("swap", "2opt") and n_villes > 3 \
+            and (isinstance(matrice_distances, list) or est_tableau_numpy(matrice_distances)):
+        noyaux = choisir_noyaux(noyau)
+    if noyaux is not None:
+        # Les paliers tournent sur des tableaux ; tirages faits à l'avance par palier
+        import numpy as np
+        deux_opt = type_mouvement == "2opt"
+        matrice_noyau = en_matrice_numpy(matrice_distances)
+        chemin, meilleur_chemin = np.array(chemin, dtype=np.int64), np.array(meilleur_chemin, dtype=np.int64)
+        distances_palier = np.empty(iterations_par_temperature)
+    ecrivain = EcrivainReprise(sauvegarde, "recuit") if sauvegarde else None
+
+    try:
+        while (palier < nb_paliers if programme == "acceptation"
+               else temperature > temperature_finale):
+            acceptations = 0
+            nb_iterations = 0
+            if stats is not None:
+                debut = perf_counter_ns()
+            if noyaux is not None:
+                # Palier entier dans le noyau ; la graine de ses tirages vient de random
+                premiers, seconds, uniformes = tirer_mouvements(
+                    random.getrandbits(63), n_villes, iterations_par_temperature, deux_opt)
+                distance_actuelle, meilleure_distance, acceptations, nb_iterations, ameliore = \
+                    noyaux["palier_recuit"](chemin, meilleur_chemin, matrice_noyau,
+                                            float(distance_actuelle), float(meilleure_distance),
+                                            temperature, premiers, seconds, uniformes, deux_opt,
+                                            acceptations_equilibre if equilibre else 0,
+                                            distances_palier)
+                if ameliore:
+                    temperature_progres, palier_progres = temperature, palier
+                historique.etendre(distances_palier[:nb_iterations].tolist())
+                iteration_totale += nb_iterations
+            else:
+                for _ in range(iterations_par_temperature):
+                    # Générer un mouvement voisin et l'évaluer sur les seules arêtes touchées
+                    mouvement = tirer_mouvement(n_villes)
+                    delta = calculer_delta(chemin, matrice_distances, *mouvement)
+
+                    if delta < 0 or random.random() < math.exp(-delta / temperature):
+                        appliquer_mouvement(chemin, *mouvement)
+                        distance_actuelle += delta
+                        acceptations += 1
+
+                        # Mise à jour du meilleur
+                        if distance_actuelle < meilleure_distance:
+                            meilleur_chemin = chemin.copy()
+                            meilleure_distance = distance_actuelle
+                            temperature_progres, palier_progres = temperature, palier
+
+                    historique.ajouter(distance_actuelle)
+                    iteration_totale += 1
+                    nb_iterations += 1
+
+                    # Appel du callback pour la simulation interactive
+                    if callback:
+                        callback(iteration_totale, chemin, distance_actuelle, historique, temperature)
+
+                    # Échéance vérifiée aussi dans le palier, toutes les 128 itérations
+                    if arret is not None and not iteration_totale & 127 and arret.echeance_depassee():
+                        break
+                    # Équilibre atteint : inutile de prolonger le palier
+                    if equilibre and acceptations >= acceptations_equilibre:
+                        break
+
+            # Statistiques agrégées par palier : rien n'est mesuré dans la boucle interne
+            if stats is not None:
+                stats.ajouter_temps("palier", debut)
+                stats.evaluations += nb_iterations
+                stats.propositions += nb_iterations
+                stats.acceptations += acceptations
+                stats.iterations += nb_iterations
+                stats.point_controle()
+
+            temperature = temperature_suivante(programme, temperature, alpha, beta,
+                                               acceptations / max(1, nb_iterations),
+                                               palier / nb_paliers if nb_paliers else None)
+            palier += 1
+
+            paliers_geles = 0 if acceptations else paliers_geles + 1
+            gele = equilibre and paliers_geles >= PALIERS_GEL
+            if rechauffage and rechauffages < nb_rechauffages \
+                    and (gele or palier - palier_progres >= rechauffage):
+                # Réchauffage : on repart de la température du dernier progrès, doublée
+                temperature = 2 * temperature_progres
+                palier_progres, paliers_geles = palier, 0
+                rechauffages += 1
+            elif gele:
+                break
+
+            if ecrivain and palier % intervalle_sauvegarde == 0:
+                ecrivain.soumettre(palier=palier, chemin=list(chemin), distance_actuelle=distance_actuelle,
+                                   meilleur_chemin=list(meilleur_chemin),
+                                   meilleure_distance=meilleure_distance,
+                                   distance_initiale=distance_initiale, temperature=temperature,
+                                   historique=historique.copie(), iteration_totale=iteration_totale,
+                                   temperature_finale=temperature_finale, nb_paliers=nb_paliers, beta=beta,
+                                   temperature_progres=temperature_progres,
+                                   palier_progres=palier_progres, rechauffages=rechauffages,
+                                   paliers_geles=paliers_geles, aleatoire=random.getstate())
+
+            if arret is not None and arret.verifier(meilleure_distance, nb_iterations):
+                break
+    finally:
+        if ecrivain:
+            ecrivain.fermer()
+
+    if recherche_locale:
+        # Polissage final du meilleur chemin (la distance renvoyée est exacte)
+        if noyaux is not None:
+            meilleur_chemin = meilleur_chemin.tolist()
+        meilleur_chemin, meilleure_distance = ameliorer_chemin(meilleur_chemin, matrice_distances,
+                                                               recherche_locale)
+    elif noyaux is not None:
+        # Recalcul exact, par le noyau, sur les tableaux des paliers
+        meilleure_distance = float(noyaux["longueur_chemin"](meilleur_chemin, matrice_noyau))
+        meilleur_chemin = meilleur_chemin.tolist()
+    else:
+        # Recalcul exact pour éliminer l'accumulation d'erreurs d'arrondi des deltas
+        meilleure_distance = calculer_distance(meilleur_chemin, matrice_distances)
 
     return meilleur_chemin, meilleure_distance, distance_initiale, historique
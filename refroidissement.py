@@ -0,0 +1,76 @@
+import math
+
+# Programmes de température du recuit simulé.
+#   "geometrique" : T <- alpha T ;
+#   "lundy_mees"  : T <- T / (1 + beta T), beta réglé pour atteindre la
+#                   température finale en autant de paliers que le géométrique ;
+#   "acceptation" : T est ajustée à chaque palier pour suivre un taux
+#                   d'acceptation cible (schéma de Lam modifié), sur un nombre
+#                   de paliers fixé.
+
+PROGRAMMES = ("geometrique", "lundy_mees", "acceptation")
+
+# Taux d'acceptation visés par la calibration automatique des températures
+ACCEPTATION_INITIALE = 0.8
+ACCEPTATION_FINALE = 1e-8
+
+
+def delta_moyen_positif(chemin, matrice, tirer_mouvement, calculer_delta, nb_echantillons=200):
+    """Moyenne des dégradations (deltas > 0) de mouvements tirés au hasard depuis chemin."""
+    n = len(chemin)
+    total, nb = 0.0, 0
+    for _ in range(nb_echantillons):
+        delta = calculer_delta(chemin, matrice, *tirer_mouvement(n))
+        if delta > 0:
+            total += delta
+            nb += 1
+    return total / nb if nb else 1.0
+
+
+def temperature_pour_acceptation(delta_moyen, taux):
+    """Température à laquelle une dégradation moyenne est acceptée avec la probabilité taux."""
+    return -delta_moyen / math.log(taux)
+
+
+def nombre_paliers(temperature_initiale, temperature_finale, alpha):
+    """Nombre de paliers du programme géométrique entre les deux températures."""
+    return max(1, math.ceil(math.log(temperature_finale / temperature_initiale) / math.log(alpha)))
+
+
+def beta_lundy_mees(temperature_initiale, temperature_finale, nb_paliers):
+    return (temperature_initiale - temperature_finale) / (nb_paliers * temperature_initiale * temperature_finale)
+
+
+def taux_cible(avancement):
+    """Taux d'acceptation visé à la fraction avancement de la résolution (Lam modifié)."""
+    if avancement < 0.15:
+        return 0.44 + 0.56 * 560 ** (-avancement / 0.15)
+    if avancement < 0.65:
+        return 0.44
+    return 0.44 * 440 ** (-(avancement - 0.65) / 0.35)
+
+
+def temperature_suivante(programme, temperature, alpha, beta=None, taux_observe=None, avancement=None):
+    """Température du palier suivant selon le programme."""
+    if programme == "lundy_mees":
+        return temperature / (1 + beta * temperature)
+    if programme == "acceptation":
+        # Correction proportionnelle à l'écart relatif au taux visé, bornée à
+        # alpha^4 par palier dans un sens comme dans l'autre
+        rapport = max(taux_observe, 1e-3) / taux_cible(avancement)
+        return temperature * min(max(alpha ** (4 * math.log(rapport)), alpha ** 4), alpha ** -4)
+    return temperature * alpha
+
+
+def calibrer_temperatures(chemin, matrice, tirer_mouvement, calculer_delta,
+                          temperature_initiale="auto", temperature_finale="auto"):
+    """Remplace les températures "auto" par celles qui donnent ACCEPTATION_INITIALE
+    et ACCEPTATION_FINALE pour la dégradation moyenne mesurée sur l'instance."""
+    if temperature_initiale != "auto" and temperature_finale != "auto":
+        return temperature_initiale, temperature_finale
+    delta_moyen = delta_moyen_positif(chemin, matrice, tirer_mouvement, calculer_delta)
+    if temperature_initiale == "auto":
+        temperature_initiale = temperature_pour_acceptation(delta_moyen, ACCEPTATION_INITIALE)
+    if temperature_finale == "auto":
+        temperature_finale = temperature_pour_acceptation(delta_moyen, ACCEPTATION_FINALE)
+    return temperature_initiale, temperature_finale
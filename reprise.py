@@ -0,0 +1,76 @@
+import os
+import pickle
+import threading
+
+# Points de reprise des solveurs. L'état (chemins, température, liste tabou,
+# historique, état du générateur aléatoire...) est copié dans la boucle
+# principale, puis sérialisé et écrit sur disque par un thread dédié : la
+# boucle n'attend jamais le disque. L'écriture passe par un fichier temporaire
+# renommé, si bien que le fichier de reprise est toujours complet.
+
+FORMAT_REPRISE = 1
+
+
+def ecrire_reprise(fichier, etat):
+    """Écrit l'état en binaire (pickle), de façon atomique."""
+    temporaire = f"{fichier}.tmp"
+    with open(temporaire, "wb") as f:
+        pickle.dump(etat, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporaire, fichier)
+
+
+def charger_reprise(source, algorithme):
+    """État sauvegardé par algorithme, depuis un fichier ou un dictionnaire déjà chargé."""
+    if isinstance(source, dict):
+        etat = source
+    else:
+        with open(source, "rb") as f:
+            etat = pickle.load(f)
+    if etat.get("format") != FORMAT_REPRISE or etat.get("algorithme") != algorithme:
+        raise ValueError(f"Point de reprise incompatible avec {algorithme} : {source}")
+    return etat
+
+
+class EcrivainReprise:
+    """Thread d'écriture des points de reprise.
+
+    Si un point arrive pendant une écriture, seul le plus récent en attente est conservé.
+    """
+
+    def __init__(self, fichier, algorithme):
+        self.fichier = fichier
+        self.algorithme = algorithme
+        self.ecritures = 0
+        self._en_attente = None
+        self._fin = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._boucle, name="reprise", daemon=True)
+        self._thread.start()
+
+    def soumettre(self, **etat):
+        """Programme l'écriture de l'état ; les valeurs doivent déjà être des copies."""
+        etat["format"] = FORMAT_REPRISE
+        etat["algorithme"] = self.algorithme
+        with self._condition:
+            self._en_attente = etat
+            self._condition.notify()
+
+    def _boucle(self):
+        while True:
+            with self._condition:
+                while self._en_attente is None and not self._fin:
+                    self._condition.wait()
+                etat, self._en_attente = self._en_attente, None
+            if etat is None:
+                return
+            ecrire_reprise(self.fichier, etat)
+            self.ecritures += 1
+
+    def fermer(self):
+        """Termine l'écriture en attente puis arrête le thread."""
+        with self._condition:
+            self._fin = True
+            self._condition.notify()
+        self._thread.join()
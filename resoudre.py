@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Résolution d'une instance en ligne de commande, résultat en JSON sur la sortie
+standard (sans graphique ; NumPy et Matplotlib ne sont pas importés pour les
+instances JSON ou texte).
+
+    python resoudre.py villes.txt --algo recuit --graine 0
+    python resoudre.py instance.json --algo ag --param generations=300
+    python resoudre.py berlin52.tsp --algo tabou --param nombre_iterations=2000
+    python resoudre.py villes.txt --algo recuit --noyau auto
+
+--noyau (recuit seulement) fait tourner chaque palier dans les noyaux de
+noyaux.py, compilés par Numba s'il est installé ; une graine donne alors le
+même résultat avec ou sans Numba (mais pas le même que la boucle Python par
+défaut).
+
+Formats d'instance :
+  .tsp   TSPLIB ;
+  .json  objet avec "coords" (liste de [x, y]) ou "matrice" ;
+  autre  une ville par ligne, « x y » (les lignes vides ou commençant par # sont ignorées).
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from noyaux import NOYAUX
+from solveurs import ALGORITHMES, lancer_solveur
+from utils import creer_matrice_depuis_coords
+
+
+def charger_instance(chemin):
+    """Renvoie (nom, matrice, coords) pour un fichier .tsp, .json ou texte (coords None si inconnues)."""
+    nom = os.path.splitext(os.path.basename(chemin))[0]
+    if chemin.endswith(".tsp"):
+        from tsplib import charger_tsplib
+        instance = charger_tsplib(chemin)
+        matrice = instance.matrice
+        coords = instance.coords.tolist() if instance.coords is not None else None
+        return instance.nom, matrice.tolist() if hasattr(matrice, "tolist") else matrice, coords
+    with open(chemin) as fichier:
+        if chemin.endswith(".json"):
+            donnees = json.load(fichier)
+            coords = donnees.get("coords")
+            if donnees.get("matrice") is not None:
+                return donnees.get("nom", nom), donnees["matrice"], coords
+            return donnees.get("nom", nom), creer_matrice_depuis_coords(coords), coords
+        coords = [tuple(float(v) for v in ligne.split()[:2]) for ligne in fichier
+                  if ligne.strip() and not ligne.lstrip().startswith("#")]
+    return nom, creer_matrice_depuis_coords(coords), coords
+
+
+def lire_parametre(texte):
+    """« cle=valeur », la valeur étant lue comme du JSON si possible (nombres, booléens...)."""
+    cle, _, valeur = texte.partition("=")
+    try:
+        return cle, json.loads(valeur)
+    except ValueError:
+        return cle, valeur
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Résout une instance TSP et affiche le résultat en JSON")
+    parser.add_argument("instance", help="fichier .tsp, .json ou texte (x y par ligne)")
+    parser.add_argument("--algo", choices=ALGORITHMES, default="recuit")
+    parser.add_argument("--graine", type=int, default=None)
+    parser.add_argument("--param", action="append", default=[], metavar="CLE=VALEUR",
+                        help="paramètre transmis au solveur (répétable)")
+    parser.add_argument("--noyau", choices=NOYAUX, default=None,
+                        help="noyaux des paliers du recuit (auto : Numba s'il est installé)")
+    parser.add_argument("--indent", type=int, default=None)
+    args = parser.parse_args(arguments)
+
+    random.seed(args.graine)
+    nom, matrice, coords = charger_instance(args.instance)
+    parametres = dict(lire_parametre(p) for p in args.param)
+    debut = time.perf_counter()
+    try:
+        chemin, distance, _ = lancer_solveur(args.algo, matrice, parametres, coords, args.noyau)
+    except (TypeError, ValueError, KeyError) as erreur:
+        # Paramètre inconnu ou valeur invalide : message d'usage et code de sortie 2
+        parser.error(f"--param invalide pour {args.algo} : {type(erreur).__name__}: {erreur}")
+    duree = time.perf_counter() - debut
+
+    json.dump({"instance": nom, "dimension": len(matrice), "algorithme": args.algo,
+               "graine": args.graine, "parametres": parametres, "noyau": args.noyau,
+               "distance": float(distance),
+               "chemin": [int(v) for v in chemin], "duree": duree},
+              sys.stdout, indent=args.indent)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
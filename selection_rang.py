@@ -1,10 +1,12 @@
 import random
 from utils import aptitude
 
-def selection_par_rang(population, matrice):
-    """Sélection par rang"""
+def selection_par_rang(population, matrice, aptitudes=None):
+    """Sélection par rang (aptitudes précalculées si fournies)"""
     # Calcul fitness
-    fitness = [(ind, aptitude(ind, matrice)) for ind in population]
+    if aptitudes is None:
+        aptitudes = [aptitude(ind, matrice) for ind in population]
+    fitness = list(zip(population, aptitudes))
     # Trier par fitness croissante (rang 1 = meilleur)
     fitness.sort(key=lambda x: x[1])
     population_triee = [ind for ind, _ in fitness]
@@ -21,3 +23,15 @@ def selection_par_rang(population, matrice):
         if cumul >= tirage:
             return individu
     return population_triee[-1]
+
+
+def selection_par_rang_lot(aptitudes, k):
+    """Tire k parents d'un coup ; renvoie leurs indices dans la population.
+
+    Le tri et le cumul des rangs sont faits une seule fois par génération.
+    """
+    n = len(aptitudes)
+    # Trier par fitness croissante : le meilleur reçoit le rang n
+    indices_tries = sorted(range(n), key=aptitudes.__getitem__)
+    cumul_rangs = [r * (r + 1) // 2 for r in range(1, n + 1)]
+    return random.choices(indices_tries, cum_weights=cumul_rangs, k=k)
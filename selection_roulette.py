@@ -1,13 +1,64 @@
 import random
+from itertools import accumulate
 from utils import aptitude
 
-def selection_par_roulette(population, matrice):
-    """Sélection par roulette """
-    total_aptitude = sum(aptitude(ind, matrice) for ind in population)
+METHODES = ("bisect", "alias")
+
+def selection_par_roulette(population, matrice, aptitudes=None):
+    """Sélection par roulette (aptitudes précalculées si fournies)"""
+    if aptitudes is None:
+        aptitudes = [aptitude(ind, matrice) for ind in population]
+    total_aptitude = sum(aptitudes)
     tirage = random.uniform(0, total_aptitude)
     cumul = 0
-    for individu in population:
-        cumul += aptitude(individu, matrice)
+    for individu, apt in zip(population, aptitudes):
+        cumul += apt
         if cumul >= tirage:
             return individu
     return population[-1]
+
+
+def selection_par_roulette_lot(aptitudes, k, methode="bisect"):
+    """Tire k parents d'un coup ; renvoie leurs indices dans la population.
+
+    "bisect" : cumul des aptitudes construit une fois, puis recherche dichotomique par tirage.
+    "alias"  : table d'alias de Walker construite une fois, puis tirage en O(1).
+    """
+    if methode not in METHODES:
+        raise ValueError(f"Méthode de roulette inconnue : {methode}")
+    if methode == "alias":
+        return tirer_alias(construire_table_alias(aptitudes), k)
+    cumul = list(accumulate(aptitudes))
+    return random.choices(range(len(aptitudes)), cum_weights=cumul, k=k)
+
+
+def construire_table_alias(poids):
+    """Table d'alias de Walker (méthode de Vose) en O(n)."""
+    n = len(poids)
+    total = sum(poids)
+    probas = [p * n / total for p in poids]
+    alias = [0] * n
+    petits = [i for i, p in enumerate(probas) if p < 1]
+    grands = [i for i, p in enumerate(probas) if p >= 1]
+    while petits and grands:
+        petit, grand = petits.pop(), grands.pop()
+        alias[petit] = grand
+        probas[grand] -= 1 - probas[petit]
+        if probas[grand] < 1:
+            petits.append(grand)
+        else:
+            grands.append(grand)
+    # Résidus d'arrondi : ces cases sont pleines
+    for i in petits + grands:
+        probas[i] = 1
+    return probas, alias
+
+
+def tirer_alias(table, k):
+    probas, alias = table
+    n = len(probas)
+    indices = []
+    for _ in range(k):
+        i = random.randrange(n)
+        indices.append(i if random.random() < probas[i] else alias[i])
+    return indices
@@ -0,0 +1,19 @@
+import random
+
+
+def selection_sus(aptitudes, k):
+    """Échantillonnage stochastique universel : k pointeurs équidistants sur la roulette, un seul tirage"""
+    pas = sum(aptitudes) / k
+    pointeur = random.uniform(0, pas)
+    indices = []
+    cumul = 0
+    i = -1
+    for _ in range(k):
+        while cumul <= pointeur and i < len(aptitudes) - 1:
+            i += 1
+            cumul += aptitudes[i]
+        indices.append(i)
+        pointeur += pas
+    # Les indices sortent triés : on les mélange pour former des couples variés
+    random.shuffle(indices)
+    return indices
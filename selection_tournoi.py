@@ -0,0 +1,8 @@
+import random
+
+
+def selection_par_tournoi(aptitudes, k, taille_tournoi=3):
+    """Sélection par tournoi : k indices, chacun le meilleur de taille_tournoi candidats tirés au hasard"""
+    candidats = range(len(aptitudes))
+    return [max(random.choices(candidats, k=taille_tournoi), key=aptitudes.__getitem__)
+            for _ in range(k)]
@@ -0,0 +1,142 @@
+import asyncio
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from oracle import OracleDistances
+from parallele import SEUIL_LISTE
+from solveurs import lancer_solveur
+from utils import creer_matrice_depuis_coords
+
+# Service de résolution par lots : un pool de processus créé et préchauffé une
+# fois (modules des solveurs importés dans chaque worker), auquel on soumet des
+# requêtes indépendantes. Chaque requête porte ses coordonnées ou sa matrice ;
+# la matrice est construite dans le worker, en parallèle.
+#
+# Requête : dictionnaire avec "id", "coords" ou "matrice", et facultativement
+# "algorithme" ("ag", "recuit" ou "tabou", recuit par défaut), "parametres",
+# "graine" et "noyau" (noyaux des paliers du recuit : "auto", "numba" ou
+# "python", cf. noyaux.choisir_noyaux ; boucle Python par défaut).
+# Résultat : "id", "algorithme", "chemin", "distance", "latence_file" (attente
+# avant le début de la résolution, en s), "duree" (résolution, en s) ; en cas
+# d'échec, "erreur" remplace chemin et distance.
+
+
+def preparer_matrice_requete(requete):
+    """Matrice de la requête : fournie, ou construite depuis ses coordonnées
+    (oracle de distances à la demande au-delà de SEUIL_LISTE villes)."""
+    if requete.get("matrice") is not None:
+        return requete["matrice"]
+    coords = requete["coords"]
+    if len(coords) > SEUIL_LISTE:
+        return OracleDistances(coords)
+    return creer_matrice_depuis_coords(coords)
+
+
+def resoudre_requete(requete, soumission):
+    """Exécutée dans un worker : résout une requête et mesure son attente en file."""
+    debut = time.time()
+    resultat = {"id": requete.get("id"), "algorithme": requete.get("algorithme", "recuit"),
+                "latence_file": debut - soumission}
+    try:
+        random.seed(requete.get("graine"))
+        matrice = preparer_matrice_requete(requete)
+        chemin, distance, _ = lancer_solveur(resultat["algorithme"], matrice,
+                                             requete.get("parametres", {}), requete.get("coords"),
+                                             requete.get("noyau"))
+        resultat["chemin"] = [int(v) for v in chemin]
+        resultat["distance"] = float(distance)
+    except Exception as erreur:
+        # Une requête invalide ne doit pas interrompre le lot
+        resultat["erreur"] = f"{type(erreur).__name__}: {erreur}"
+    resultat["duree"] = time.time() - debut
+    return resultat
+
+
+def _prechauffer():
+    return None
+
+
+class ServiceResolution:
+    """Pool de workers préchauffés pour résoudre des requêtes au fil de l'eau.
+
+    soumettre() renvoie un Future ; resoudre_lot() (synchrone) et
+    resoudre_lot_async() (asyncio) produisent les résultats dans l'ordre où ils
+    se terminent. statistiques() donne latences de file et débit.
+    """
+
+    def __init__(self, nb_processus=None):
+        self.pool = ProcessPoolExecutor(max_workers=nb_processus)
+        # Démarre tous les workers maintenant plutôt qu'à la première requête
+        nb_workers = nb_processus or os.cpu_count() or 1
+        for tache in [self.pool.submit(_prechauffer) for _ in range(nb_workers)]:
+            tache.result()
+        self.debut = time.perf_counter()
+        self.latences = []
+        self.durees = []
+        self.nb_erreurs = 0
+
+    def soumettre(self, requete):
+        tache = self.pool.submit(resoudre_requete, requete, time.time())
+        tache.add_done_callback(self._enregistrer)
+        return tache
+
+    def _enregistrer(self, tache):
+        if tache.cancelled() or tache.exception() is not None:
+            self.nb_erreurs += 1
+            return
+        resultat = tache.result()
+        self.latences.append(resultat["latence_file"])
+        self.durees.append(resultat["duree"])
+        if "erreur" in resultat:
+            self.nb_erreurs += 1
+
+    def resoudre_lot(self, requetes):
+        """Soumet tout le lot puis renvoie les résultats au fur et à mesure qu'ils arrivent."""
+        taches = [self.soumettre(requete) for requete in requetes]
+        for tache in as_completed(taches):
+            yield tache.result()
+
+    async def resoudre_lot_async(self, requetes):
+        """Version asyncio de resoudre_lot (générateur asynchrone)."""
+        taches = [asyncio.wrap_future(self.soumettre(requete)) for requete in requetes]
+        for tache in asyncio.as_completed(taches):
+            yield await tache
+
+    def statistiques(self):
+        """Débit (requêtes terminées par seconde depuis le démarrage) et latences."""
+        nb = len(self.latences)
+        duree = time.perf_counter() - self.debut
+        stats = {"terminees": nb, "erreurs": self.nb_erreurs, "duree": duree,
+                 "debit": nb / duree if duree else 0.0}
+        if nb:
+            stats["latence_file_moyenne"] = statistics.mean(self.latences)
+            stats["latence_file_max"] = max(self.latences)
+            stats["duree_moyenne"] = statistics.mean(self.durees)
+        if nb >= 2:
+            stats["latence_file_p95"] = statistics.quantiles(self.latences, n=20)[-1]
+        return stats
+
+    def fermer(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+if __name__ == "__main__":
+    # Démonstration : un lot de petites instances aléatoires
+    rng = random.Random(0)
+    requetes = [{"id": k, "algorithme": ("recuit", "tabou", "ag")[k % 3], "graine": k,
+                 "coords": [(rng.random() * 100, rng.random() * 100) for _ in range(30)],
+                 "parametres": {"generations": 50} if k % 3 == 2 else {}}
+                for k in range(30)]
+    with ServiceResolution() as service:
+        for resultat in service.resoudre_lot(requetes):
+            print(f"Requête {resultat['id']:>3} ({resultat['algorithme']}) : "
+                  f"{resultat.get('distance', resultat.get('erreur'))}")
+        print(service.statistiques())
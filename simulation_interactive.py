@@ -2,34 +2,55 @@
 """
 Simulation interactive du TSP avec interface graphique Matplotlib
 Compatible avec : algo_genetique.py, recuit_simule.py, tabou.py, utils.py
+
+Le solveur tourne dans un thread de fond et publie des instantanés dans une
+file ; l'interface les lit sur un timer et ne redessine que les artistes
+animés (blitting), à une cadence indépendante du nombre d'itérations.
+La courbe d'évolution est sous-échantillonnée (min/max par seau) : son coût
+de tracé est borné quelle que soit la durée de la résolution.
 """
 
-import random
-import numpy as np
+import queue
+import threading
+import time
+from array import array
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Button, RadioButtons
 from utils import creer_matrice_depuis_coords
 from algo_genetique import algorithme_genetique_tsp
 from recuit_simule import recuit_simule
 from tabou import tabu_search
+from historique import Historique
+
+# Nombre de seaux de la courbe d'évolution
+TAILLE_COURBE = 500
 
 
 class SimulationTSP:
-    def __init__(self):
+    def __init__(self, images_par_seconde=30):
         self.coords_villes = []
         self.matrice_distances = None
         self.meilleur_chemin = None
-        self.historique = []
+        self.historique = Historique("seaux", taille=TAILLE_COURBE)
         self.en_cours = False
         self.iteration_actuelle = 0
+        self.temperature = None
 
         # Algorithme sélectionné
         self.algo_choisi = "AG - Roulette"
         self.methode_croisement = "2points"
 
+        # Échanges solveur -> interface
+        self.file_instantanes = queue.Queue()
+        self.periode_affichage = 1 / images_par_seconde
+        self.prochaine_publication = 0
+        self.nouvelles_valeurs = array('d')
+        self.fonds = None
+
         # Création figure
         self.fig = plt.figure(figsize=(16, 9))
         self.fig.suptitle(" Simulation TSP - Voyageur de Commerce", fontsize=16, fontweight='bold')
+        self.blitting = self.fig.canvas.supports_blit
 
         # Disposition
         gs = self.fig.add_gridspec(3, 3, hspace=0.4, wspace=0.3)
@@ -41,6 +62,8 @@ class SimulationTSP:
         self.ax_carte.set_ylim(0, 100)
         self.ax_carte.grid(True, alpha=0.3)
         self.ax_carte.set_aspect('equal')
+        self.points_villes, = self.ax_carte.plot([], [], 'ro', markersize=10)
+        self.etiquettes_villes = []
 
         # 2. Évolution
         self.ax_evolution = self.fig.add_subplot(gs[0, 2])
@@ -53,7 +76,13 @@ class SimulationTSP:
         self.ax_stats = self.fig.add_subplot(gs[1, 2])
         self.ax_stats.axis('off')
         self.text_stats = self.ax_stats.text(0.1, 0.5, "", fontsize=10, family='monospace',
-                                             verticalalignment='center')
+                                             verticalalignment='center', animated=self.blitting)
+
+        # Artistes persistants mis à jour par set_data (jamais de clear + replot)
+        self.ligne_chemin, = self.ax_carte.plot([], [], 'b-', linewidth=2, alpha=0.6,
+                                                animated=self.blitting)
+        self.ligne_evolution, = self.ax_evolution.plot([], [], linewidth=2, color='blue',
+                                                       animated=self.blitting)
 
         # 4. Contrôles
         self.ax_controles = self.fig.add_subplot(gs[2, 2])
@@ -61,6 +90,9 @@ class SimulationTSP:
 
         self.creer_widgets()
         self.fig.canvas.mpl_connect('button_press_event', self.ajouter_ville)
+        self.fig.canvas.mpl_connect('draw_event', self.capturer_fonds)
+        self.timer = self.fig.canvas.new_timer(interval=int(1000 * self.periode_affichage))
+        self.timer.add_callback(self.rafraichir)
         plt.show()
 
     def creer_widgets(self):
@@ -97,11 +129,12 @@ class SimulationTSP:
             x, y = event.xdata, event.ydata
             if x is not None and y is not None:
                 self.coords_villes.append((x, y))
-                self.ax_carte.plot(x, y, 'ro', markersize=10)
-                self.ax_carte.text(x, y + 2, str(len(self.coords_villes) - 1),
-                                   ha='center', fontsize=9, fontweight='bold')
-                self.fig.canvas.draw()
+                self.points_villes.set_data(*zip(*self.coords_villes))
+                self.etiquettes_villes.append(
+                    self.ax_carte.text(x, y + 2, str(len(self.coords_villes) - 1),
+                                       ha='center', fontsize=9, fontweight='bold'))
                 self.afficher_stats()
+                self.fig.canvas.draw_idle()
 
     def changer_algorithme(self, label):
         self.algo_choisi = label
@@ -127,28 +160,65 @@ class SimulationTSP:
         print(f"\n🚀 Démarrage de la simulation avec {self.algo_choisi}")
 
         self.matrice_distances = creer_matrice_depuis_coords(self.coords_villes)
-        self.historique = []
+        self.historique = Historique("seaux", taille=TAILLE_COURBE)
         self.iteration_actuelle = 0
+        self.temperature = None
+        self.prochaine_publication = 0
+        self.nouvelles_valeurs = array('d')
+        self.ax_carte.set_title("Meilleur chemin trouvé", fontsize=12, fontweight='bold')
+        self.ax_evolution.set_xlim(0, 10)
+        self.fig.canvas.draw_idle()
 
         if "Recuit" in self.algo_choisi:
-            self.lancer_recuit_simule()
+            lancer = self.lancer_recuit_simule
         elif "Tabou" in self.algo_choisi:
-            self.lancer_tabou()
+            lancer = self.lancer_tabou
         else:
-            self.lancer_algo_genetique()
+            lancer = self.lancer_algo_genetique
+        threading.Thread(target=self.executer_solveur, args=(lancer,), daemon=True).start()
+        self.timer.start()
+
+    # --- Côté solveur (thread de fond) ---
+
+    def executer_solveur(self, lancer):
+        """Cible du thread : lance le solveur et publie toujours un instantané
+        final (avec l'erreur éventuelle), qui arrête le timer côté interface."""
+        iteration = chemin = distance = erreur = None
+        try:
+            iteration, chemin, distance = lancer()
+        except Exception as exception:
+            erreur = f"{type(exception).__name__}: {exception}"
+            print(f"⚠️ Erreur du solveur : {erreur}")
+        finally:
+            self.publier(iteration, chemin, distance, fin=True, erreur=erreur)
+
+    def publier(self, iteration, chemin, distance, temperature=None, fin=False, erreur=None):
+        """Note la distance et poste un instantané dans la file, au plus une fois
+        par période d'affichage. L'instantané final (fin=True) peut ne porter
+        qu'une erreur, sans chemin."""
+        if not fin:
+            self.nouvelles_valeurs.append(distance)
+        maintenant = time.perf_counter()
+        if not fin and maintenant < self.prochaine_publication:
+            return
+        self.prochaine_publication = maintenant + self.periode_affichage
+        # Seules les valeurs notées depuis le dernier instantané sont transmises
+        nouvelles_valeurs, self.nouvelles_valeurs = self.nouvelles_valeurs, array('d')
+        self.file_instantanes.put({
+            "iteration": iteration,
+            "chemin": list(chemin) if chemin is not None else None,
+            "distance": distance,
+            "historique": nouvelles_valeurs,
+            "temperature": temperature,
+            "fin": fin,
+            "erreur": erreur,
+        })
 
     def lancer_algo_genetique(self):
         methode_selection = "roulette" if "Roulette" in self.algo_choisi else "rang"
 
         def callback(gen, chemin, distance, historique):
-            self.iteration_actuelle = gen
-            self.meilleur_chemin = chemin
-            self.historique = historique
-            if gen % 5 == 0:
-                self.afficher_chemin()
-                self.afficher_evolution()
-                self.afficher_stats()
-                plt.pause(0.01)
+            self.publier(gen, chemin, distance)
 
         chemin, distance, _, hist = algorithme_genetique_tsp(
             self.matrice_distances,
@@ -159,27 +229,17 @@ class SimulationTSP:
             proba_croisement=0.8,
             proba_mutation=0.05,
             afficher_graphique=False,
-            callback=callback
+            callback=callback,
+            historique=Historique("aucun"),
+            coords=self.coords_villes
         )
 
-        self.meilleur_chemin = chemin
-        self.historique = hist
-        self.afficher_chemin()
-        self.afficher_evolution()
-        self.afficher_stats()
-        self.en_cours = False
         print(f"Simulation terminée ! Distance finale: {distance:.2f}")
+        return hist.nb_valeurs, chemin, distance
 
     def lancer_recuit_simule(self):
         def callback(iteration, chemin, distance, historique, temperature):
-            self.iteration_actuelle = iteration
-            self.meilleur_chemin = chemin
-            self.historique = historique
-            if iteration % 50 == 0:
-                self.afficher_chemin()
-                self.afficher_evolution()
-                self.afficher_stats(temperature=temperature)
-                plt.pause(0.01)
+            self.publier(iteration, chemin, distance, temperature)
 
         chemin, distance, _, hist = recuit_simule(
             self.matrice_distances,
@@ -188,73 +248,115 @@ class SimulationTSP:
             alpha=0.95,
             iterations_par_temperature=100,
             afficher_graphique=False,
-            callback=callback
+            callback=callback,
+            historique=Historique("aucun"),
+            coords=self.coords_villes
         )
 
-        self.meilleur_chemin = chemin
-        self.historique = hist
-        self.afficher_chemin()
-        self.afficher_evolution()
-        self.afficher_stats()
-        self.en_cours = False
         print(f" Recuit terminé ! Distance finale: {distance:.2f}")
+        return hist.nb_valeurs - 1, chemin, distance
 
     def lancer_tabou(self):
         """Exécute la recherche tabou"""
+        hist = Historique("aucun")
+
         def callback(iteration, chemin, distance, historique):
-            self.iteration_actuelle = iteration
-            self.meilleur_chemin = chemin
-            self.historique = historique
-            if iteration % 10 == 0:
-                self.afficher_chemin()
-                self.afficher_evolution()
-                self.afficher_stats()
-                plt.pause(0.01)
+            self.publier(iteration, chemin, distance)
 
         chemin, distance = tabu_search(
             self.matrice_distances,
             nombre_iterations=300,
-            taille_tabu=20
+            taille_tabu=20,
+            callback=callback,
+            historique=hist,
+            coords=self.coords_villes
         )
-        self.meilleur_chemin = chemin
-        self.historique = [distance]
-        self.afficher_chemin()
-        self.afficher_evolution()
-        self.afficher_stats()
-        self.en_cours = False
         print(f"Recherche Tabou terminée ! Distance finale: {distance:.2f}")
-
-    def afficher_chemin(self):
-        if self.meilleur_chemin is None:
+        return hist.nb_valeurs - 1, chemin, distance
+
+    # --- Côté interface (timer Matplotlib) ---
+
+    def rafraichir(self):
+        """Vide la file d'instantanés et met à jour les artistes animés."""
+        dernier = None
+        while True:
+            try:
+                instantane = self.file_instantanes.get_nowait()
+            except queue.Empty:
+                break
+            self.historique.etendre(instantane["historique"])
+            dernier = instantane
+        if dernier is None:
             return
 
-        self.ax_carte.clear()
-        self.ax_carte.set_title("Meilleur chemin trouvé", fontsize=12, fontweight='bold')
-        self.ax_carte.set_xlim(0, 100)
-        self.ax_carte.set_ylim(0, 100)
-        self.ax_carte.grid(True, alpha=0.3)
-        self.ax_carte.set_aspect('equal')
-
-        for i, (x, y) in enumerate(self.coords_villes):
-            self.ax_carte.plot(x, y, 'ro', markersize=10)
-            self.ax_carte.text(x, y + 2, str(i), ha='center', fontsize=9, fontweight='bold')
+        if dernier["chemin"] is not None:
+            self.iteration_actuelle = dernier["iteration"]
+            self.meilleur_chemin = dernier["chemin"]
+            self.temperature = dernier["temperature"]
+        self.afficher_chemin()
+        axes_modifies = self.afficher_evolution()
+        self.afficher_stats(self.temperature)
+
+        if dernier["fin"]:
+            self.timer.stop()
+            self.en_cours = False
+        if dernier["erreur"]:
+            # Titre modifié : redessin complet
+            self.ax_carte.set_title(f"Erreur : {dernier['erreur']}", fontsize=12,
+                                    fontweight='bold')
+            axes_modifies = True
+        if axes_modifies or not self.blitting:
+            # Changement d'échelle : redessin complet, les fonds seront recapturés
+            self.fig.canvas.draw_idle()
+        else:
+            self.dessiner_artistes()
 
-        for i in range(len(self.meilleur_chemin)):
-            a, b = self.meilleur_chemin[i], self.meilleur_chemin[(i + 1) % len(self.meilleur_chemin)]
-            x1, y1 = self.coords_villes[a]
-            x2, y2 = self.coords_villes[b]
-            self.ax_carte.plot([x1, x2], [y1, y2], 'b-', linewidth=2, alpha=0.6)
+    def capturer_fonds(self, event):
+        """Après chaque redessin complet : mémorise les fonds pour le blitting."""
+        if not self.blitting:
+            return
+        canvas = self.fig.canvas
+        self.fonds = [(canvas.copy_from_bbox(ax.bbox), ax, artiste)
+                      for ax, artiste in ((self.ax_carte, self.ligne_chemin),
+                                          (self.ax_evolution, self.ligne_evolution),
+                                          (self.ax_stats, self.text_stats))]
+        self.dessiner_artistes()
+
+    def dessiner_artistes(self):
+        if not self.fonds:
+            return
+        canvas = self.fig.canvas
+        for fond, ax, artiste in self.fonds:
+            canvas.restore_region(fond)
+            ax.draw_artist(artiste)
+            canvas.blit(ax.bbox)
 
-        self.fig.canvas.draw()
+    def afficher_chemin(self):
+        if self.meilleur_chemin is None:
+            self.ligne_chemin.set_data([], [])
+            return
+        boucle = list(self.meilleur_chemin) + [self.meilleur_chemin[0]]
+        self.ligne_chemin.set_data([self.coords_villes[v][0] for v in boucle],
+                                   [self.coords_villes[v][1] for v in boucle])
 
     def afficher_evolution(self):
+        """Met à jour la courbe ; renvoie True si les axes ont dû être agrandis."""
         if not self.historique:
-            return
-        self.ax_evolution.clear()
-        self.ax_evolution.set_title("Évolution de la distance", fontsize=10, fontweight='bold')
-        self.ax_evolution.plot(self.historique, linewidth=2, color='blue')
-        self.ax_evolution.grid(True, alpha=0.3)
-        self.fig.canvas.draw()
+            self.ligne_evolution.set_data([], [])
+            return False
+        valeurs = self.historique.valeurs()
+        self.ligne_evolution.set_data(self.historique.abscisses(), valeurs)
+        bas, haut = min(valeurs), max(valeurs)
+        nb_valeurs = self.historique.nb_valeurs
+        x_max = self.ax_evolution.get_xlim()[1]
+        y_bas, y_haut = self.ax_evolution.get_ylim()
+        if nb_valeurs <= x_max and y_bas <= bas and haut <= y_haut:
+            return False
+        # Agrandissement par doublement pour limiter les redessins complets
+        self.ax_evolution.set_xlim(0, max(10, 2 * nb_valeurs))
+        marge = 0.05 * (haut - bas) or 1
+        self.ax_evolution.set_ylim(bas - marge, haut + marge)
+        return True
 
     def afficher_stats(self, temperature=None):
         nb_villes = len(self.coords_villes)
@@ -263,41 +365,44 @@ class SimulationTSP:
             txt += f"Croisement: {self.methode_croisement}\n"
         if self.historique:
             txt += f"Iteration: {self.iteration_actuelle}\n"
-            txt += f"Distance: {self.historique[-1]:.2f}\n"
-            txt += f"Meilleure: {min(self.historique):.2f}\n"
+            txt += f"Distance: {self.historique.derniere:.2f}\n"
+            txt += f"Meilleure: {min(self.historique.valeurs()):.2f}\n"
         if temperature:
             txt += f"Température: {temperature:.2f}\n"
         self.text_stats.set_text(txt)
-        self.fig.canvas.draw()
+        if not self.en_cours:
+            if self.blitting:
+                self.dessiner_artistes()
+            else:
+                self.fig.canvas.draw_idle()
 
     def reset_simulation(self, event):
         if not self.en_cours:
             self.meilleur_chemin = None
-            self.historique = []
+            self.historique = Historique("seaux", taille=TAILLE_COURBE)
             self.iteration_actuelle = 0
-            self.ax_carte.clear()
-            self.ax_carte.set_xlim(0, 100)
-            self.ax_carte.set_ylim(0, 100)
-            self.ax_carte.grid(True, alpha=0.3)
-            for i, (x, y) in enumerate(self.coords_villes):
-                self.ax_carte.plot(x, y, 'ro', markersize=10)
-                self.ax_carte.text(x, y + 2, str(i), ha='center', fontsize=9, fontweight='bold')
+            self.afficher_chemin()
+            self.afficher_evolution()
+            self.ax_carte.set_title("Cliquez pour placer des villes", fontsize=12, fontweight='bold')
             self.afficher_stats()
-            self.fig.canvas.draw()
+            self.fig.canvas.draw_idle()
             print(" Simulation réinitialisée")
 
     def clear_villes(self, event):
         if not self.en_cours:
             self.coords_villes = []
             self.meilleur_chemin = None
-            self.historique = []
+            self.historique = Historique("seaux", taille=TAILLE_COURBE)
             self.iteration_actuelle = 0
-            self.ax_carte.clear()
-            self.ax_carte.set_xlim(0, 100)
-            self.ax_carte.set_ylim(0, 100)
-            self.ax_carte.grid(True, alpha=0.3)
+            self.points_villes.set_data([], [])
+            for etiquette in self.etiquettes_villes:
+                etiquette.remove()
+            self.etiquettes_villes = []
+            self.afficher_chemin()
+            self.afficher_evolution()
+            self.ax_carte.set_title("Cliquez pour placer des villes", fontsize=12, fontweight='bold')
             self.afficher_stats()
-            self.fig.canvas.draw()
+            self.fig.canvas.draw_idle()
             print(" Toutes les villes ont été effacées")
 
 
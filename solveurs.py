@@ -0,0 +1,32 @@
+from algo_genetique import algorithme_genetique_tsp
+from recuit_simule import recuit_simule
+from tabou import tabu_search
+
+# Point d'entrée commun des solveurs, sans dépendance au pool de processus ni
+# au graphique (utilisé par le portefeuille, le service et la ligne de commande).
+
+ALGORITHMES = ("ag", "recuit", "tabou")
+
+
+def lancer_solveur(algorithme, matrice, parametres, coords=None, noyau=None):
+    """Exécute "ag", "recuit" ou "tabou" sans affichage ; renvoie (chemin, distance, historique).
+
+    coords : coordonnées des villes, transmises au solveur pour les
+    initialisations heuristiques.
+    noyau : noyaux des paliers du recuit, "auto" (compilés par Numba s'il est
+    installé), "numba" ou "python" (cf. noyaux.choisir_noyaux) ; None garde la
+    boucle Python. Sans effet sur "ag" et "tabou".
+    """
+    if algorithme == "ag":
+        chemin, distance, _, historique = algorithme_genetique_tsp(
+            matrice, afficher_graphique=False, verbeux=False, coords=coords, **parametres)
+    elif algorithme == "recuit":
+        if noyau is not None:
+            parametres = dict(parametres, noyau=noyau)
+        chemin, distance, _, historique = recuit_simule(matrice, coords=coords, **parametres)
+    elif algorithme == "tabou":
+        chemin, distance = tabu_search(matrice, coords=coords, **parametres)
+        historique = [distance]
+    else:
+        raise ValueError(f"Algorithme inconnu : {algorithme}")
+    return chemin, distance, historique
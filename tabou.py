@@ -1,43 +1,221 @@
-from collections import deque
 import random
+from time import perf_counter_ns
+from utils import calculer_distance, voisins_proches
+from mouvements import appliquer_double_pont, aretes_creees_swap, delta_swap
+from recherche_locale import ameliorer_chemin
+from initialisation import chemin_initial
+from reprise import EcrivainReprise, charger_reprise
+from historique import Historique
 
 
 def calculer_distance_totale(solution, matrice_distances):
-    distance_totale = 0
-    for i in range(len(solution) - 1):
-        distance_totale += matrice_distances[solution[i]][solution[i + 1]]
-    distance_totale += matrice_distances[solution[-1]][solution[0]]
-    return distance_totale
+    return calculer_distance(solution, matrice_distances)
 
 
-def generer_voisins(solution):
-    voisins = []
+def generer_voisins(solution, candidats=None, positions=None):
+    """Mouvements voisins sous forme de couples de positions (i, j) à échanger.
+
+    Avec des listes de candidats, on ne propose que de placer chaque ville
+    à côté de l'un de ses plus proches voisins.
+    """
     n = len(solution)
-    for i in range(n):
-        for j in range(i + 1, n):
-            v = solution[:]
-            v[i], v[j] = v[j], v[i]
-            voisins.append(v)
-    return voisins
+    if candidats is None:
+        for i in range(n):
+            for j in range(i + 1, n):
+                yield i, j
+        return
+    for a in range(n):
+        i = positions[a]
+        for b in candidats[a]:
+            for j in ((positions[b] - 1) % n, (positions[b] + 1) % n):
+                if i != j:
+                    yield i, j
+
+
+def redemarrer(elite, matrice_distances):
+    """Nouveau point de départ : une solution élite tirée au hasard, perturbée par un double pont."""
+    solution = random.choice(elite)[1][:]
+    appliquer_double_pont(solution)
+    return solution, calculer_distance_totale(solution, matrice_distances)
+
+
+def ajouter_elite(elite, solution, distance, taille_elite):
+    """Insère (distance, solution) dans l'élite triée, sans doublon de distance."""
+    if any(d == distance for d, _ in elite):
+        return
+    elite.append((distance, solution[:]))
+    elite.sort(key=lambda element: element[0])
+    del elite[taille_elite:]
 
 
-def tabu_search(matrice_distances, nombre_iterations=1000, taille_tabu=10):
+def tabu_search(matrice_distances, nombre_iterations=1000, taille_tabu=10,
+                aspiration=True, k_voisins=None, stats=None, callback=None,
+                recherche_locale=None, initialisation="aleatoire",
+                sauvegarde=None, intervalle_sauvegarde=100, reprendre_depuis=None,
+                arret=None, historique=None, penalite_frequence=0.0,
+                redemarrage=None, taille_elite=5, coords=None):
+    """Recherche tabou par échanges de villes ; renvoie (meilleure_solution, meilleure_distance).
+
+    penalite_frequence : poids de la mémoire à long terme. Chaque arête créée
+    par un mouvement est comptée ; un mouvement non améliorant est pénalisé de
+    penalite_frequence x (longueur moyenne d'arête) x (fréquences de ses arêtes
+    créées, rapportées à la plus grande), ce qui pousse vers des arêtes peu
+    explorées.
+    redemarrage : nombre d'itérations sans amélioration de l'épisode courant
+    (ou absence de mouvement permis) après lequel la recherche repart d'une des
+    taille_elite meilleures solutions d'épisode, perturbée par un double pont ;
+    la liste tabou est vidée, la mémoire de fréquence conservée.
+    coords : coordonnées des villes pour les initialisations heuristiques
+    (cf. initialisation.chemin_initial).
+    """
+    if arret is not None:
+        arret.demarrer()
     nb_villes = len(matrice_distances)
-    solution_actuelle = list(range(nb_villes))
-    random.shuffle(solution_actuelle)
-    meilleure_solution = solution_actuelle[:]
-    meilleure_distance = calculer_distance_totale(solution_actuelle, matrice_distances)
-    tabu_list = deque(maxlen=taille_tabu)
-
-    for _ in range(nombre_iterations):
-        voisins = [v for v in generer_voisins(solution_actuelle) if v not in tabu_list]
-        if not voisins:
-            break
-        solution_actuelle = min(voisins, key=lambda x: calculer_distance_totale(x, matrice_distances))
+    redemarrage = redemarrage if nb_villes >= 8 else None
+    if reprendre_depuis is not None:
+        # Reprise à l'identique : chemins, liste tabou, historique et générateur aléatoire
+        etat = charger_reprise(reprendre_depuis, "tabou")
+        solution_actuelle, distance_actuelle = etat["solution_actuelle"], etat["distance_actuelle"]
+        meilleure_solution, meilleure_distance = etat["meilleure_solution"], etat["meilleure_distance"]
+        tabous, historique = etat["tabous"], etat["historique"]
+        premiere_iteration = etat["iteration"]
+        frequences, elite = etat.get("frequences"), etat.get("elite", [])
+        solution_episode, distance_episode, derniere_amelioration = etat.get(
+            "episode", (meilleure_solution[:], meilleure_distance, premiere_iteration))
+        random.setstate(etat["aleatoire"])
+    else:
+        solution_actuelle = chemin_initial(matrice_distances, initialisation, coords)
         distance_actuelle = calculer_distance_totale(solution_actuelle, matrice_distances)
-        tabu_list.append(solution_actuelle[:])
-        if distance_actuelle < meilleure_distance:
-            meilleure_solution = solution_actuelle[:]
-            meilleure_distance = distance_actuelle
+        meilleure_solution = solution_actuelle[:]
+        meilleure_distance = distance_actuelle
+        # Attributs tabous : paire de villes échangées -> dernière itération où elle reste tabou
+        tabous = {}
+        historique = historique if historique is not None else Historique()
+        historique.ajouter(distance_actuelle)
+        premiere_iteration = 0
+        # Mémoire à long terme : arête -> nombre de fois où un mouvement l'a créée
+        frequences = {} if penalite_frequence else None
+        # Meilleures solutions d'épisode (distance, solution), points de redémarrage
+        elite = []
+        solution_episode, distance_episode, derniere_amelioration = solution_actuelle[:], distance_actuelle, 0
+
+    frequence_max = max(frequences.values(), default=0) if frequences is not None else 0
+    candidats = voisins_proches(matrice_distances, k_voisins) if k_voisins else None
+    positions = [0] * nb_villes
+    # Évaluations comptées pour les statistiques et le critère evaluations_max
+    compter = stats is not None or arret is not None
+    ecrivain = EcrivainReprise(sauvegarde, "tabou") if sauvegarde else None
+
+    try:
+        for iteration in range(premiere_iteration, nombre_iterations):
+            if stats is not None:
+                debut = perf_counter_ns()
+            if candidats is not None:
+                for position, ville in enumerate(solution_actuelle):
+                    positions[ville] = position
+
+            meilleur_mouvement = None
+            meilleur_delta = meilleure_valeur = float("inf")
+            nb_evalues = tabous_rencontres = aspirations = 0
+            if frequences:
+                facteur = penalite_frequence * distance_actuelle / (nb_villes * frequence_max)
+            for i, j in generer_voisins(solution_actuelle, candidats, positions):
+                if compter:
+                    nb_evalues += 1
+                    # Échéance vérifiée aussi pendant le parcours du voisinage, toutes les
+                    # 1024 évaluations : sur une grande instance il dure longtemps
+                    if arret is not None and not nb_evalues & 1023 and arret.echeance_depassee():
+                        break
+                delta = valeur = delta_swap(solution_actuelle, matrice_distances, i, j)
+                if delta >= meilleure_valeur:
+                    continue
+                if frequences and delta >= 0:
+                    valeur += facteur * sum(frequences.get(arete, 0) for arete
+                                            in aretes_creees_swap(solution_actuelle, i, j))
+                    if valeur >= meilleure_valeur:
+                        continue
+                a, b = solution_actuelle[i], solution_actuelle[j]
+                if tabous.get((a, b) if a < b else (b, a), -1) >= iteration:
+                    if stats is not None:
+                        tabous_rencontres += 1
+                    # Critère d'aspiration : un mouvement tabou est permis s'il bat le meilleur connu
+                    if not (aspiration and distance_actuelle + delta < meilleure_distance):
+                        continue
+                    if stats is not None:
+                        aspirations += 1
+                meilleur_mouvement = (i, j)
+                meilleur_delta, meilleure_valeur = delta, valeur
+
+            if stats is not None:
+                stats.ajouter_temps("voisinage", debut)
+                stats.evaluations += nb_evalues
+                stats.tabous_rencontres += tabous_rencontres
+                stats.aspirations += aspirations
+                stats.iterations += 1
+                debut = perf_counter_ns()
+
+            if meilleur_mouvement is None and not redemarrage:
+                break
+
+            if meilleur_mouvement is not None:
+                i, j = meilleur_mouvement
+                if frequences is not None:
+                    for arete in aretes_creees_swap(solution_actuelle, i, j):
+                        frequences[arete] = frequence = frequences.get(arete, 0) + 1
+                        frequence_max = max(frequence_max, frequence)
+                a, b = solution_actuelle[i], solution_actuelle[j]
+                solution_actuelle[i], solution_actuelle[j] = b, a
+                distance_actuelle += meilleur_delta
+                tabous[(a, b) if a < b else (b, a)] = iteration + taille_tabu
+                if len(tabous) > 2 * taille_tabu:
+                    tabous = {attribut: fin for attribut, fin in tabous.items() if fin >= iteration}
+
+                if distance_actuelle < meilleure_distance:
+                    meilleure_solution = solution_actuelle[:]
+                    meilleure_distance = distance_actuelle
+                if distance_actuelle < distance_episode:
+                    solution_episode, distance_episode = solution_actuelle[:], distance_actuelle
+                    derniere_amelioration = iteration
+
+            if redemarrage and (meilleur_mouvement is None
+                                or iteration - derniere_amelioration >= redemarrage):
+                # Diversification : l'épisode rejoint l'élite, on repart d'une élite perturbée
+                ajouter_elite(elite, solution_episode, distance_episode, taille_elite)
+                solution_actuelle, distance_actuelle = redemarrer(elite, matrice_distances)
+                solution_episode, distance_episode = solution_actuelle[:], distance_actuelle
+                derniere_amelioration = iteration
+                tabous = {}
+
+            if stats is not None:
+                stats.ajouter_temps("mouvement", debut)
+                stats.point_controle()
+
+            historique.ajouter(distance_actuelle)
+            # Appel du callback pour la simulation interactive
+            if callback:
+                callback(iteration + 1, solution_actuelle, distance_actuelle, historique)
+
+            if ecrivain and (iteration + 1) % intervalle_sauvegarde == 0:
+                ecrivain.soumettre(iteration=iteration + 1, solution_actuelle=solution_actuelle[:],
+                                   distance_actuelle=distance_actuelle,
+                                   meilleure_solution=meilleure_solution[:],
+                                   meilleure_distance=meilleure_distance, tabous=dict(tabous),
+                                   historique=historique.copie(),
+                                   frequences=dict(frequences) if frequences is not None else None,
+                                   elite=[(d, s[:]) for d, s in elite],
+                                   episode=(solution_episode[:], distance_episode, derniere_amelioration),
+                                   aleatoire=random.getstate())
+
+            if arret is not None and arret.verifier(meilleure_distance, nb_evalues):
+                break
+    finally:
+        if ecrivain:
+            ecrivain.fermer()
 
+    if recherche_locale:
+        # Polissage final du meilleur chemin (la distance renvoyée est exacte)
+        return ameliorer_chemin(meilleure_solution, matrice_distances, recherche_locale,
+                                voisins=candidats)
+    # Recalcul exact pour éliminer l'accumulation d'erreurs d'arrondi des deltas
+    meilleure_distance = calculer_distance_totale(meilleure_solution, matrice_distances)
     return meilleure_solution, meilleure_distance
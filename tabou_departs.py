@@ -0,0 +1,34 @@
+import random
+from concurrent.futures import as_completed
+from parallele import matrice_worker, pool_matrice_partagee
+from tabou import tabu_search
+
+
+def rechercher_depart(graine, parametres):
+    """Une recherche tabou indépendante dans un worker."""
+    random.seed(graine)
+    return tabu_search(matrice_worker(), **parametres)
+
+
+def tabu_multi_departs(matrice, nb_departs=4, nb_processus=None, graine=None, callback=None,
+                       **parametres):
+    """Lance nb_departs recherches tabou indépendantes en parallèle (une par tâche,
+    chacune avec sa propre graine) et renvoie la meilleure (solution, distance).
+
+    Les autres paramètres sont ceux de tabu_search (nombre_iterations,
+    penalite_frequence, redemarrage...). callback(depart, solution, distance)
+    est appelé dès qu'un départ se termine.
+    """
+    rng = random.Random(graine)
+    resultats = {}
+    with pool_matrice_partagee(matrice, nb_processus or nb_departs) as pool:
+        taches = {pool.submit(rechercher_depart, rng.getrandbits(64), parametres): depart
+                  for depart in range(nb_departs)}
+        for tache in as_completed(taches):
+            depart = taches[tache]
+            solution, distance = resultats[depart] = tache.result()
+            if callback:
+                callback(depart, solution, distance)
+    # À distance égale, le premier départ l'emporte : résultat indépendant de l'ordre de fin
+    depart = min(resultats, key=lambda d: (resultats[d][1], d))
+    return resultats[depart]
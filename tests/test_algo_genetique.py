@@ -0,0 +1,34 @@
+import random
+import pytest
+from algo_genetique import algorithme_genetique_tsp
+
+
+def test_roulette_alias(matrice_aleatoire):
+    matrice = matrice_aleatoire(20, 0)
+    random.seed(0)
+    chemin, distance, _, _ = algorithme_genetique_tsp(matrice, generations=10, taille_population=20,
+                                                      methode_roulette="alias",
+                                                      afficher_graphique=False, verbeux=False)
+    assert sorted(chemin) == list(range(20))
+    assert distance > 0
+
+
+def test_roulette_inconnue(matrice_aleatoire):
+    with pytest.raises(ValueError, match="roulette inconnue"):
+        algorithme_genetique_tsp(matrice_aleatoire(10, 0), generations=2, methode_roulette="aleas",
+                                 afficher_graphique=False, verbeux=False)
+
+
+@pytest.mark.parametrize("methode", ["1point", "2points", "uniforme", "ox", "pmx", "erx"])
+def test_population_compacte_meme_evolution(matrice_aleatoire, methode):
+    # Une matrice NumPy fait passer par la population compacte et les croisements vectorisés
+    np = pytest.importorskip("numpy")
+    matrice = matrice_aleatoire(40, 2)
+    resultats = []
+    for m in (matrice, np.array(matrice)):
+        random.seed(0)
+        resultats.append(algorithme_genetique_tsp(m, generations=30, methode_croisement=methode,
+                                                  afficher_graphique=False, verbeux=False))
+    (chemin, distance, _, _), (chemin_compact, distance_compacte, _, _) = resultats
+    assert chemin_compact == chemin
+    assert distance_compacte == pytest.approx(distance)
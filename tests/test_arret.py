@@ -0,0 +1,15 @@
+import random
+from arret import CritereArret
+from tabou import tabu_search
+
+
+def test_tabou_echeance_dans_le_voisinage(matrice_aleatoire):
+    # 4950 échanges par itération : l'échéance (déjà dépassée) coupe le premier parcours
+    matrice = matrice_aleatoire(100, 0)
+    arret = CritereArret(duree_max=0)
+    random.seed(0)
+    chemin, distance = tabu_search(matrice, nombre_iterations=50, arret=arret)
+    assert arret.raison == "duree"
+    assert arret.etapes == 1
+    assert arret.evaluations == 1024
+    assert sorted(chemin) == list(range(100))
@@ -0,0 +1,54 @@
+import random
+import numpy as np
+import pytest
+from initialisation import HEURISTIQUES, chemin_initial, plus_proche_voisin, population_initiale
+from recuit_simule import recuit_simule
+from tabou import tabu_search
+from utils import creer_matrice_depuis_coords
+
+
+def instance(n, graine=0):
+    rng = random.Random(graine)
+    coords = [(rng.random() * 100, rng.random() * 100) for _ in range(n)]
+    return creer_matrice_depuis_coords(coords), coords
+
+
+@pytest.mark.parametrize("heuristique", HEURISTIQUES)
+def test_heuristiques_avec_coordonnees(heuristique):
+    matrice, coords = instance(80)
+    chemin = chemin_initial(matrice, heuristique, coords)
+    assert sorted(chemin) == list(range(80))
+
+
+def test_hilbert_sans_coordonnees():
+    matrice, _ = instance(10)
+    with pytest.raises(ValueError):
+        chemin_initial(matrice, "hilbert")
+
+
+def test_plus_proche_arbre_kd_identique_au_balayage():
+    matrice, coords = instance(200)
+    assert plus_proche_voisin(matrice, 7, coords) == plus_proche_voisin(matrice, 7)
+
+
+def test_coordonnees_de_mauvaise_taille():
+    matrice, coords = instance(10)
+    with pytest.raises(ValueError):
+        chemin_initial(matrice, "hilbert", coords[:5])
+
+
+def test_chemin_fourni_en_tableau_numpy():
+    matrice, _ = instance(12)
+    chemin = np.arange(12)[::-1]
+    assert chemin_initial(matrice, chemin) == list(range(11, -1, -1))
+    assert len(population_initiale(matrice, 6, chemin)) == 6
+
+
+def test_solveurs_transmettent_les_coordonnees():
+    matrice, coords = instance(40)
+    random.seed(0)
+    chemin, _, _, _ = recuit_simule(matrice, initialisation="hilbert", coords=coords,
+                                    temperature_initiale=10, iterations_par_temperature=10)
+    assert sorted(chemin) == list(range(40))
+    chemin, _ = tabu_search(matrice, 5, initialisation="hilbert", coords=coords)
+    assert sorted(chemin) == list(range(40))
@@ -0,0 +1,24 @@
+import random
+from algo_genetique import algorithme_genetique_tsp
+from instrumentation import Statistiques
+from recuit_simule import recuit_simule
+from tabou import tabu_search
+
+
+def test_temps_par_phase(matrice_aleatoire):
+    matrice = matrice_aleatoire(20)
+    phases = {}
+    for nom, resoudre in [
+        ("ag", lambda stats: algorithme_genetique_tsp(matrice, generations=5, afficher_graphique=False,
+                                                      verbeux=False, stats=stats)),
+        ("recuit", lambda stats: recuit_simule(matrice, temperature_finale=100, stats=stats)),
+        ("tabou", lambda stats: tabu_search(matrice, nombre_iterations=20, stats=stats)),
+    ]:
+        random.seed(0)
+        stats = Statistiques()
+        resoudre(stats)
+        assert stats.evaluations > 0
+        phases[nom] = set(stats.temps_phases_ns)
+    assert {"selection", "croisement", "evaluation"} <= phases["ag"]
+    assert phases["recuit"] == {"palier"}
+    assert phases["tabou"] == {"voisinage", "mouvement"}
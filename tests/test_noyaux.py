@@ -0,0 +1,57 @@
+import random
+import pytest
+import mouvements
+import noyaux
+from recuit_simule import recuit_simule
+from solveurs import lancer_solveur
+from utils import calculer_distance, en_matrice_numpy
+
+
+def recuit(matrice, **parametres):
+    random.seed(1)
+    chemin, distance, _, historique = recuit_simule(matrice, **parametres)
+    return chemin, distance, list(historique)
+
+
+def test_deltas_identiques_a_mouvements(matrice_aleatoire):
+    matrice = matrice_aleatoire(40)
+    tableau = en_matrice_numpy(matrice)
+    rng = random.Random(2)
+    chemin = rng.sample(range(40), 40)
+    assert noyaux.longueur_chemin(chemin, tableau) == pytest.approx(calculer_distance(chemin, matrice))
+    for _ in range(500):
+        i, j = sorted(rng.sample(range(40), 2))
+        assert noyaux.delta_swap(chemin, tableau, i, j) == mouvements.delta_swap(chemin, matrice, i, j)
+        assert noyaux.delta_2opt(chemin, tableau, i, j) == mouvements.delta_2opt(chemin, matrice, i, j)
+
+
+@pytest.mark.parametrize("type_mouvement", ["swap", "2opt"])
+def test_auto_identique_a_python(type_mouvement, matrice_aleatoire):
+    # Avec ou sans Numba, "auto" doit suivre les mêmes tirages que la référence Python
+    matrice = matrice_aleatoire(30)
+    reference = recuit(matrice, type_mouvement=type_mouvement, noyau="python")
+    assert recuit(matrice, type_mouvement=type_mouvement, noyau="auto") == reference
+    chemin, distance, _ = reference
+    assert sorted(chemin) == list(range(30))
+    assert distance == pytest.approx(calculer_distance(chemin, matrice))
+
+
+@pytest.mark.parametrize("type_mouvement", ["swap", "2opt"])
+def test_numba_identique_a_python(type_mouvement, matrice_aleatoire):
+    pytest.importorskip("numba")
+    matrice = matrice_aleatoire(30)
+    assert (recuit(matrice, type_mouvement=type_mouvement, noyau="numba")
+            == recuit(matrice, type_mouvement=type_mouvement, noyau="python"))
+
+
+def test_noyau_inconnu():
+    with pytest.raises(ValueError):
+        noyaux.choisir_noyaux("fortran")
+
+
+def test_lancer_solveur_transmet_le_noyau(matrice_aleatoire):
+    matrice = matrice_aleatoire(30)
+    random.seed(1)
+    chemin, distance, historique = lancer_solveur("recuit", matrice, {}, noyau="python")
+    assert (chemin, distance, list(historique)) == recuit(matrice, noyau="python")
+    assert distance == noyaux.longueur_chemin(chemin, en_matrice_numpy(matrice))
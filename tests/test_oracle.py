@@ -0,0 +1,15 @@
+import pytest
+from oracle import OracleDistances
+
+
+def distance_decalee(a, b):
+    # Distance non nulle entre un point et lui-même (comme GEO en TSPLIB)
+    return 1 + abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+@pytest.mark.parametrize("taille_cache", [0, 10])
+def test_diagonale_nulle(taille_cache):
+    oracle = OracleDistances([(0, 0), (3, 4), (6, 8)], distance_decalee, taille_cache=taille_cache)
+    for i in range(3):
+        assert oracle[i][i] == 0
+    assert oracle[0][1] == oracle[1][0] == 8
@@ -0,0 +1,46 @@
+import random
+import pytest
+from population import PopulationCompacte, chemins_depuis_octets, octets_chemins
+
+np = pytest.importorskip("numpy")
+
+import algo_genetique
+
+
+def test_enfants_ecrits_dans_le_second_tampon():
+    population = PopulationCompacte.depuis_listes([[0, 1, 2, 3], [3, 2, 1, 0]])
+    population.copier(1, 0)
+    population.emplacement(1)[:] = [1, 0, 3, 2]
+    assert population.en_listes() == [[0, 1, 2, 3], [3, 2, 1, 0]]
+    population.echanger_tampons()
+    assert [ligne.tolist() for ligne in population] == [[3, 2, 1, 0], [1, 0, 3, 2]]
+
+
+def test_reprise_depuis_octets():
+    chemins = [[1, 2, 0], [0, 2, 1]]
+    copie = PopulationCompacte.depuis_octets(octets_chemins(chemins), 2, 3)
+    assert copie.en_listes() == chemins
+    assert chemins_depuis_octets(copie.en_octets(), 2, 3) == chemins
+
+
+@pytest.mark.parametrize("methode", ["1point", "2points", "uniforme", "ox", "pmx"])
+def test_croisements_tableau_identiques_aux_listes(methode):
+    croisement_liste = {
+        "1point": algo_genetique.croisement_un_point,
+        "2points": algo_genetique.croisement_deux_points,
+        "uniforme": algo_genetique.croisement_uniforme,
+        "ox": algo_genetique.croisement_ox,
+        "pmx": algo_genetique.croisement_pmx,
+    }[methode]
+    rng = random.Random(3)
+    for essai in range(50):
+        parent1, parent2 = list(range(30)), list(range(30))
+        rng.shuffle(parent1)
+        rng.shuffle(parent2)
+        random.seed(essai)
+        attendu = croisement_liste(parent1, parent2)
+        enfant = np.zeros(30, dtype=np.int32)
+        random.seed(essai)
+        algo_genetique.CROISEMENTS_TABLEAU[methode](np.array(parent1, dtype=np.int32),
+                                                    np.array(parent2, dtype=np.int32), enfant)
+        assert enfant.tolist() == attendu
@@ -0,0 +1,20 @@
+import random
+import pytest
+from recherche_locale import METHODES, ameliorer_chemin
+from utils import calculer_distance
+
+
+@pytest.mark.parametrize("methode", METHODES)
+def test_ameliore_le_chemin(methode, matrice_aleatoire):
+    matrice = matrice_aleatoire(60)
+    chemin = random.Random(1).sample(range(60), 60)
+    resultat, distance = ameliorer_chemin(chemin, matrice, methode)
+    assert sorted(resultat) == list(range(60))
+    assert distance == pytest.approx(calculer_distance(resultat, matrice))
+    assert distance < calculer_distance(chemin, matrice)
+
+
+@pytest.mark.parametrize("methode", ["foo", True])
+def test_methode_inconnue(methode, matrice_aleatoire):
+    with pytest.raises(ValueError, match="Méthode de recherche locale inconnue"):
+        ameliorer_chemin(list(range(10)), matrice_aleatoire(10), methode)
@@ -0,0 +1,21 @@
+import random
+from instrumentation import Statistiques
+from recuit_repliques import recuit_echange_repliques
+
+
+def test_taux_echange_utilisable(matrice_aleatoire):
+    matrice = matrice_aleatoire(60, 0)
+    stats = Statistiques()
+    recuit_echange_repliques(matrice, nb_repliques=4, nb_echanges=120, iterations_par_echange=200,
+                             nb_processus=1, graine=0, stats=stats)
+    assert stats.echanges_acceptes / stats.echanges_proposes > 0.05
+
+
+def test_etat_aleatoire_preserve(matrice_aleatoire):
+    matrice = matrice_aleatoire(20, 1)
+    random.seed(42)
+    attendu = random.random()
+    random.seed(42)
+    recuit_echange_repliques(matrice, nb_repliques=2, nb_echanges=3, iterations_par_echange=20,
+                             nb_processus=1, graine=0)
+    assert random.random() == attendu
@@ -0,0 +1,20 @@
+import random
+import pytest
+from recuit_simule import recuit_simule
+from utils import calculer_distance
+
+
+def test_geometrique_accepte_temperature_finale_nulle(matrice_aleatoire):
+    matrice = matrice_aleatoire(20)
+    random.seed(0)
+    chemin, distance, _, _ = recuit_simule(matrice, temperature_initiale=10, temperature_finale=0,
+                                           alpha=0.5, iterations_par_temperature=10)
+    assert sorted(chemin) == list(range(20))
+    assert distance == pytest.approx(calculer_distance(chemin, matrice))
+
+
+@pytest.mark.parametrize("programme", ["lundy_mees", "acceptation"])
+@pytest.mark.parametrize("parametres", [{"temperature_finale": 0}, {"alpha": 1}])
+def test_programmes_a_paliers_valident_leurs_parametres(programme, parametres, matrice_aleatoire):
+    with pytest.raises(ValueError):
+        recuit_simule(matrice_aleatoire(10), programme=programme, **parametres)
@@ -0,0 +1,77 @@
+import random
+import pytest
+from algo_genetique import algorithme_genetique_tsp
+from arret import CritereArret
+from reprise import charger_reprise
+from recuit_simule import recuit_simule
+from tabou import tabu_search
+
+# Pour chaque solveur : une exécution interrompue par evaluations_max après un
+# point de reprise intermédiaire, puis reprise jusqu'au bout, doit redonner
+# exactement l'exécution ininterrompue de même graine.
+
+
+@pytest.mark.parametrize("en_numpy", [False, True])
+def test_reprise_algo_genetique(matrice_aleatoire, tmp_path, en_numpy):
+    matrice = matrice_aleatoire(30, 4)
+    if en_numpy:
+        # Population compacte (cf. population.py)
+        matrice = pytest.importorskip("numpy").array(matrice)
+    fichier = tmp_path / "ag.pkl"
+    parametres = dict(generations=12, taille_population=16, methode_croisement="ox",
+                      afficher_graphique=False, verbeux=False)
+    random.seed(0)
+    chemin, distance, _, historique = algorithme_genetique_tsp(matrice, **parametres)
+
+    random.seed(0)
+    algorithme_genetique_tsp(matrice, sauvegarde=fichier, intervalle_sauvegarde=3,
+                             arret=CritereArret(evaluations_max=7 * 16), **parametres)
+    assert charger_reprise(fichier, "ag")["generation"] == 6
+    random.seed(1)
+    repris = algorithme_genetique_tsp(matrice, reprendre_depuis=fichier, **parametres)
+
+    assert repris[0] == chemin
+    assert repris[1] == distance
+    assert list(repris[3]) == list(historique)
+
+
+def test_reprise_recuit_simule(matrice_aleatoire, tmp_path):
+    matrice = matrice_aleatoire(30, 5)
+    fichier = tmp_path / "recuit.pkl"
+    parametres = dict(temperature_initiale=100, temperature_finale=1, alpha=0.8,
+                      iterations_par_temperature=50, type_mouvement="2opt")
+    random.seed(0)
+    chemin, distance, _, historique = recuit_simule(matrice, **parametres)
+
+    random.seed(0)
+    recuit_simule(matrice, sauvegarde=fichier, intervalle_sauvegarde=3,
+                  arret=CritereArret(evaluations_max=8 * 50), **parametres)
+    assert charger_reprise(fichier, "recuit")["palier"] == 6
+    random.seed(1)
+    repris = recuit_simule(matrice, reprendre_depuis=fichier, **parametres)
+
+    assert repris[0] == chemin
+    assert repris[1] == distance
+    assert list(repris[3]) == list(historique)
+
+
+def test_reprise_tabou(matrice_aleatoire, tmp_path):
+    matrice = matrice_aleatoire(20, 6)
+    fichier = tmp_path / "tabou.pkl"
+    parametres = dict(nombre_iterations=60, taille_tabu=7)
+    historiques = []
+    enregistrer = lambda iteration, solution, distance, historique: historiques.append(historique)
+
+    random.seed(0)
+    chemin, distance = tabu_search(matrice, callback=enregistrer, **parametres)
+    historique = list(historiques[-1])
+
+    random.seed(0)
+    tabu_search(matrice, sauvegarde=fichier, intervalle_sauvegarde=10,
+                arret=CritereArret(evaluations_max=25 * 190), **parametres)
+    assert charger_reprise(fichier, "tabou")["iteration"] == 20
+    random.seed(1)
+    repris = tabu_search(matrice, reprendre_depuis=fichier, callback=enregistrer, **parametres)
+
+    assert repris == (chemin, distance)
+    assert list(historiques[-1]) == historique
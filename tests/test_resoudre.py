@@ -0,0 +1,31 @@
+import json
+import pytest
+from resoudre import main
+
+
+@pytest.fixture
+def instance(tmp_path):
+    fichier = tmp_path / "villes.txt"
+    fichier.write_text("0 0\n1 0\n1 1\n0 1\n2 2\n")
+    return str(fichier)
+
+
+def test_resultat_json(instance, capsys):
+    main([instance, "--algo", "tabou", "--graine", "0", "--param", "nombre_iterations=20"])
+    resultat = json.loads(capsys.readouterr().out)
+    assert sorted(resultat["chemin"]) == list(range(5))
+
+
+@pytest.mark.parametrize("parametre", ["bogus=1", "type_mouvement=bidon"])
+def test_parametre_invalide(instance, capsys, parametre):
+    with pytest.raises(SystemExit) as sortie:
+        main([instance, "--algo", "recuit", "--param", parametre])
+    assert sortie.value.code == 2
+    assert "--param invalide pour recuit" in capsys.readouterr().err
+
+
+def test_option_noyau(instance, capsys):
+    main([instance, "--algo", "recuit", "--graine", "0", "--noyau", "python"])
+    resultat = json.loads(capsys.readouterr().out)
+    assert resultat["noyau"] == "python"
+    assert sorted(resultat["chemin"]) == list(range(5))
@@ -0,0 +1,34 @@
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+from simulation_interactive import SimulationTSP
+
+
+@pytest.fixture
+def simulation():
+    simulation = SimulationTSP()
+    simulation.coords_villes = [(10, 10), (50, 80), (90, 20), (40, 40)]
+    simulation.en_cours = True
+    simulation.timer.start()
+    return simulation
+
+
+def test_erreur_du_solveur_libere_l_interface(simulation):
+    def lancer():
+        raise ValueError("paramètre invalide")
+
+    simulation.executer_solveur(lancer)
+    simulation.rafraichir()
+    assert not simulation.en_cours
+    assert "paramètre invalide" in simulation.ax_carte.get_title()
+
+
+def test_fin_normale(simulation):
+    simulation.matrice_distances = [[0] * 4 for _ in range(4)]
+    simulation.executer_solveur(lambda: (5, [0, 1, 2, 3], 0.0))
+    simulation.rafraichir()
+    assert not simulation.en_cours
+    assert simulation.meilleur_chemin == [0, 1, 2, 3]
+    assert simulation.iteration_actuelle == 5
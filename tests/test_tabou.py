@@ -0,0 +1,100 @@
+import random
+import pytest
+import tabou
+import tabou_departs
+from arret import CritereArret
+from reprise import charger_reprise
+from tabou import tabu_search
+from tabou_departs import tabu_multi_departs
+
+
+@pytest.mark.parametrize("parametres, attendu", [
+    ({}, ([4, 23, 1, 22, 21, 7, 2, 10, 18, 20, 5, 13, 6, 11, 9, 8, 14, 15, 24, 17, 16, 3, 0, 19, 12],
+          452.4694127941302)),
+    ({"aspiration": False, "taille_tabu": 3},
+     ([19, 0, 23, 22, 21, 7, 2, 10, 18, 20, 5, 13, 6, 11, 16, 3, 17, 24, 15, 14, 8, 9, 1, 4, 12],
+      491.2633858417201)),
+])
+def test_parametres_par_defaut_inchanges(matrice_aleatoire, parametres, attendu):
+    # Résultats de la recherche tabou d'avant la mémoire de fréquence et les redémarrages
+    random.seed(0)
+    chemin, distance = tabu_search(matrice_aleatoire(25, 3), nombre_iterations=100, **parametres)
+    assert chemin == attendu[0]
+    assert distance == pytest.approx(attendu[1])
+
+
+def test_redemarrage_vide_les_tabous_et_garde_les_frequences(matrice_aleatoire, monkeypatch):
+    # États soumis au point de reprise à chaque itération, relevés sans fichier
+    etats, redemarrages = [], []
+
+    class Enregistreur:
+        def __init__(self, fichier, algorithme):
+            pass
+
+        def soumettre(self, **etat):
+            etats.append(etat)
+
+        def fermer(self):
+            pass
+
+    redemarrer = tabou.redemarrer
+
+    def redemarrer_releve(elite, matrice):
+        redemarrages.append(len(etats))
+        return redemarrer(elite, matrice)
+
+    monkeypatch.setattr(tabou, "EcrivainReprise", Enregistreur)
+    monkeypatch.setattr(tabou, "redemarrer", redemarrer_releve)
+    random.seed(0)
+    tabu_search(matrice_aleatoire(20, 1), nombre_iterations=150, taille_tabu=7, redemarrage=10,
+                penalite_frequence=0.5, sauvegarde="inutilise", intervalle_sauvegarde=1)
+
+    assert redemarrages
+    for k in redemarrages:
+        avant, apres = etats[k - 1], etats[k]
+        assert avant["tabous"] and apres["tabous"] == {}
+        assert apres["elite"]
+        assert all(apres["frequences"].get(arete, 0) >= frequence
+                   for arete, frequence in avant["frequences"].items())
+        assert sum(apres["frequences"].values()) >= sum(avant["frequences"].values()) > 0
+
+
+def test_reprise_avec_frequences_et_elite(matrice_aleatoire, tmp_path):
+    matrice = matrice_aleatoire(20, 2)
+    fichier = tmp_path / "tabou.pkl"
+    parametres = dict(nombre_iterations=120, taille_tabu=7, redemarrage=8, penalite_frequence=0.5)
+    random.seed(0)
+    attendu = tabu_search(matrice, **parametres)
+
+    random.seed(0)
+    tabu_search(matrice, sauvegarde=fichier, intervalle_sauvegarde=20,
+                arret=CritereArret(evaluations_max=70 * 190), **parametres)
+    etat = charger_reprise(fichier, "tabou")
+    assert etat["iteration"] == 60
+    assert etat["elite"] and etat["frequences"]
+    random.seed(1)
+    assert tabu_search(matrice, reprendre_depuis=fichier, **parametres) == attendu
+
+
+def test_multi_departs_independant_de_l_ordre_de_fin(matrice_aleatoire, monkeypatch):
+    matrice = matrice_aleatoire(10, 4)
+    parametres = dict(nombre_iterations=30, taille_tabu=5)
+    # Référence : les mêmes départs, un par un dans ce processus
+    rng = random.Random(7)
+    resultats = []
+    for _ in range(4):
+        random.seed(rng.getrandbits(64))
+        resultats.append(tabu_search(matrice, **parametres))
+    attendu = min(resultats, key=lambda resultat: resultat[1])
+
+    ordres = []
+    for inverser in (False, True):
+        if inverser:
+            monkeypatch.setattr(tabou_departs, "as_completed", lambda taches: reversed(list(taches)))
+        departs = []
+        resultat = tabu_multi_departs(matrice, nb_departs=4, nb_processus=2, graine=7,
+                                      callback=lambda depart, *_: departs.append(depart),
+                                      **parametres)
+        assert resultat == attendu
+        ordres.append(departs)
+    assert ordres[1] == [3, 2, 1, 0]
@@ -0,0 +1,39 @@
+import pytest
+from tsplib import charger_tsplib
+
+INSTANCE_GEO = """NAME: geo5
+TYPE: TSP
+DIMENSION: 5
+EDGE_WEIGHT_TYPE: GEO
+NODE_COORD_SECTION
+1 38.24 20.42
+2 39.57 26.15
+3 40.56 25.32
+4 36.26 23.12
+5 33.48 10.54
+EOF
+"""
+
+
+@pytest.fixture
+def fichier_geo(tmp_path):
+    chemin = tmp_path / "geo5.tsp"
+    chemin.write_text(INSTANCE_GEO)
+    return str(chemin)
+
+
+def test_oracle_geo_identique_a_la_matrice(fichier_geo):
+    complete = charger_tsplib(fichier_geo).matrice
+    paresseuse = charger_tsplib(fichier_geo, paresseux=True).matrice
+    for i in range(5):
+        assert paresseuse[i][i] == 0
+        for j in range(5):
+            assert paresseuse[i][j] == complete[i][j]
+
+
+def test_cache_npy_sans_extension(fichier_geo, tmp_path):
+    cache = str(tmp_path / "cache")
+    premiere = charger_tsplib(fichier_geo, cache_npy=cache).matrice
+    seconde = charger_tsplib(fichier_geo, cache_npy=cache).matrice
+    assert (tmp_path / "cache.npy").exists()
+    assert (premiere == seconde).all()
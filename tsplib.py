@@ -0,0 +1,179 @@
+import math
+import os
+from collections import namedtuple
+import numpy as np
+from oracle import OracleDistances
+
+# Lecture des instances TSPLIB (.tsp) en un seul passage sur le fichier :
+# les sections sont consommées ligne par ligne, sans charger le fichier en mémoire.
+
+InstanceTSPLIB = namedtuple("InstanceTSPLIB", "nom dimension type_poids coords matrice")
+
+RAYON_TERRE = 6378.388
+PI_TSPLIB = 3.141592
+
+
+# Distances TSPLIB entre deux points (versions scalaires, pour le calcul à la demande)
+def distance_euc_2d(p, q):
+    return int(math.sqrt((p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2) + 0.5)
+
+def distance_ceil_2d(p, q):
+    return math.ceil(math.sqrt((p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2))
+
+def distance_att(p, q):
+    r = math.sqrt(((p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2) / 10)
+    t = int(r + 0.5)
+    return t + 1 if t < r else t
+
+def distance_geo(p, q):
+    """p et q en (latitude, longitude) déjà converties en radians (voir coords_geo)."""
+    q1 = math.cos(p[1] - q[1])
+    q2 = math.cos(p[0] - q[0])
+    q3 = math.cos(p[0] + q[0])
+    return int(RAYON_TERRE * math.acos(0.5 * ((1 + q1) * q2 - (1 - q1) * q3)) + 1)
+
+DISTANCES = {
+    "EUC_2D": distance_euc_2d,
+    "CEIL_2D": distance_ceil_2d,
+    "ATT": distance_att,
+    "GEO": distance_geo,
+}
+
+
+def coords_geo(coords):
+    """Conversion TSPLIB des coordonnées DDD.MM en radians."""
+    coords = np.asarray(coords, dtype=np.float64)
+    degres = np.trunc(coords)
+    return PI_TSPLIB * (degres + 5.0 * (coords - degres) / 3.0) / 180.0
+
+
+# Mêmes distances, vectorisées sur un bloc de lignes
+def _bloc_distances(type_poids, bloc, points):
+    dx = bloc[:, None, 0] - points[None, :, 0]
+    dy = bloc[:, None, 1] - points[None, :, 1]
+    if type_poids == "GEO":
+        q1 = np.cos(bloc[:, None, 1] - points[None, :, 1])
+        q2 = np.cos(dx)
+        q3 = np.cos(bloc[:, None, 0] + points[None, :, 0])
+        cosinus = np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1, 1)
+        return np.floor(RAYON_TERRE * np.arccos(cosinus) + 1)
+    carres = dx * dx + dy * dy
+    if type_poids == "ATT":
+        r = np.sqrt(carres / 10)
+        t = np.floor(r + 0.5)
+        return np.where(t < r, t + 1, t)
+    euclidienne = np.sqrt(carres)
+    if type_poids == "CEIL_2D":
+        return np.ceil(euclidienne)
+    return np.floor(euclidienne + 0.5)
+
+
+def creer_matrice_tsplib(coords, type_poids="EUC_2D", dtype=np.float64, taille_bloc=1024):
+    """Matrice complète des distances TSPLIB, calculée par blocs de lignes."""
+    points = coords_geo(coords) if type_poids == "GEO" else np.asarray(coords, dtype=np.float64)
+    n = len(points)
+    matrice = np.empty((n, n), dtype=dtype)
+    for debut in range(0, n, taille_bloc):
+        fin = min(debut + taille_bloc, n)
+        matrice[debut:fin] = _bloc_distances(type_poids, points[debut:fin], points)
+    np.fill_diagonal(matrice, 0)
+    return matrice
+
+
+def chemin_npy(chemin):
+    """Chemin avec l'extension .npy, que np.save ajouterait de lui-même."""
+    return chemin if chemin.endswith(".npy") else chemin + ".npy"
+
+def sauvegarder_matrice_npy(matrice, chemin):
+    np.save(chemin_npy(chemin), np.asarray(matrice))
+
+def ouvrir_matrice_npy(chemin):
+    """Réouvre une matrice .npy en mémoire mappée : rien n'est lu avant d'être indexé."""
+    return np.load(chemin_npy(chemin), mmap_mode="r")
+
+
+def _nombres(lignes):
+    for ligne in lignes:
+        yield from ligne.split()
+
+def _lire_coords(lignes, n):
+    coords = np.empty((n, 2), dtype=np.float64)
+    for _ in range(n):
+        champs = next(lignes).split()
+        coords[int(champs[0]) - 1] = float(champs[1]), float(champs[2])
+    return coords
+
+def _lire_poids(lignes, n, format_poids, dtype):
+    nombres = map(float, _nombres(lignes))
+    if format_poids == "FULL_MATRIX":
+        return np.fromiter(nombres, dtype=dtype, count=n * n).reshape(n, n)
+    matrice = np.zeros((n, n), dtype=dtype)
+    for i in range(n):
+        if format_poids == "UPPER_ROW":
+            colonnes = slice(i + 1, n)
+        elif format_poids == "UPPER_DIAG_ROW":
+            colonnes = slice(i, n)
+        elif format_poids == "LOWER_ROW":
+            colonnes = slice(0, i)
+        elif format_poids == "LOWER_DIAG_ROW":
+            colonnes = slice(0, i + 1)
+        else:
+            raise ValueError(f"EDGE_WEIGHT_FORMAT non supporté : {format_poids}")
+        ligne = np.fromiter(nombres, dtype=dtype, count=len(range(n)[colonnes]))
+        matrice[i, colonnes] = ligne
+        matrice[colonnes, i] = ligne
+    return matrice
+
+
+def charger_tsplib(chemin, paresseux=False, dtype=np.float64, cache_npy=None):
+    """Charge une instance TSPLIB (.tsp).
+
+    paresseux : pour les instances à coordonnées, les distances sont calculées
+    à la demande (OracleDistances) au lieu de matérialiser n² valeurs.
+    cache_npy : fichier .npy où la matrice complète est sauvegardée au premier
+    chargement puis réouverte en mémoire mappée aux suivants (l'extension
+    .npy est ajoutée si besoin).
+    """
+    if cache_npy:
+        cache_npy = chemin_npy(cache_npy)
+    entete = {}
+    coords = None
+    matrice = None
+    with open(chemin) as fichier:
+        lignes = (ligne.strip() for ligne in fichier)
+        lignes = (ligne for ligne in lignes if ligne)
+        for ligne in lignes:
+            if ligne.startswith("EOF"):
+                break
+            if ":" in ligne:
+                cle, valeur = ligne.split(":", 1)
+                entete[cle.strip().upper()] = valeur.strip()
+                continue
+            section = ligne.upper()
+            n = int(entete["DIMENSION"])
+            if section in ("NODE_COORD_SECTION", "DISPLAY_DATA_SECTION"):
+                coords = _lire_coords(lignes, n)
+            elif section == "EDGE_WEIGHT_SECTION":
+                if cache_npy and os.path.exists(cache_npy):
+                    # Matrice déjà en cache : inutile de lire la suite du fichier
+                    break
+                matrice = _lire_poids(lignes, n, entete.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX"), dtype)
+
+    type_poids = entete.get("EDGE_WEIGHT_TYPE", "EXPLICIT")
+    if type_poids != "EXPLICIT" and type_poids not in DISTANCES:
+        raise ValueError(f"EDGE_WEIGHT_TYPE non supporté : {type_poids}")
+
+    if cache_npy and os.path.exists(cache_npy):
+        matrice = ouvrir_matrice_npy(cache_npy)
+    elif matrice is None:
+        if paresseux:
+            points = coords_geo(coords) if type_poids == "GEO" else coords
+            matrice = OracleDistances(points.tolist(), DISTANCES[type_poids])
+        else:
+            matrice = creer_matrice_tsplib(coords, type_poids, dtype)
+    if cache_npy and not os.path.exists(cache_npy) and isinstance(matrice, np.ndarray):
+        sauvegarder_matrice_npy(matrice, cache_npy)
+        matrice = ouvrir_matrice_npy(cache_npy)
+
+    return InstanceTSPLIB(entete.get("NAME", os.path.basename(chemin)), int(entete["DIMENSION"]),
+                          type_poids, coords, matrice)
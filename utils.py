@@ -1,28 +1,167 @@
-
+import heapq
 import math
+import sys
+from collections import OrderedDict
+
+# NumPy n'est importé que par les fonctions qui en ont besoin : un chemin ou une
+# matrice ne peut être un tableau NumPy que si le module est déjà chargé, ce qui
+# garde le démarrage des solveurs rapide pour les petites instances.
+
+# Jusqu'à ce nombre de villes, creer_matrice_depuis_coords calcule en Python pur
+SEUIL_NUMPY = 500
+
+
+def est_tableau_numpy(objet):
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(objet, np.ndarray)
 
 def calculer_distance(chemin, matrice):
-    """Calcule la distance totale d'un chemin (retour à la ville de départ)."""
+    """Calcule la distance totale d'un chemin (retour à la ville de départ).
+
+    Si le chemin ou la matrice est un tableau NumPy, le calcul est vectorisé ;
+    un tableau (population x n) de chemins renvoie alors un tableau de distances.
+    """
+    if est_tableau_numpy(chemin) or est_tableau_numpy(matrice):
+        return calculer_distance_numpy(chemin, matrice)
     distance = 0
     n = len(chemin)
     for i in range(n):
         distance += matrice[chemin[i]][chemin[(i + 1) % n]]
     return distance
 
+def calculer_distance_numpy(chemins, matrice):
+    """Distance(s) totale(s) par indexation avancée, en un seul appel pour toute une population."""
+    import numpy as np
+    chemins = np.asarray(chemins)
+    matrice = np.asarray(matrice)
+    suivants = np.roll(chemins, -1, axis=-1)
+    distances = matrice[chemins, suivants].sum(axis=-1)
+    if distances.ndim == 0:
+        return distances.item()
+    return distances
+
 def aptitude(chemin, matrice):
     """Fitness : inverse de la distance totale ."""
     return 1 / calculer_distance(chemin, matrice)
 
+class CacheDistances:
+    """Mémo LRU borné des distances, indexé par le chemin (évite de réévaluer les doublons)."""
+
+    def __init__(self, matrice, taille_max=1024):
+        self.matrice = matrice
+        self.taille_max = taille_max
+        self.succes = 0
+        self.echecs = 0
+        self._memo = OrderedDict()
+
+    def distance(self, chemin):
+        cle = tuple(chemin)
+        distance = self._memo.get(cle)
+        if distance is not None:
+            self._memo.move_to_end(cle)
+            self.succes += 1
+            return distance
+        self.echecs += 1
+        distance = calculer_distance(chemin, self.matrice)
+        self._memo[cle] = distance
+        if len(self._memo) > self.taille_max:
+            self._memo.popitem(last=False)
+        return distance
+
+def evaluer_population(population, matrice, cache=None):
+    """Distances de toute la population, calculées une seule fois par individu."""
+    if cache is not None:
+        return [cache.distance(individu) for individu in population]
+    if est_tableau_numpy(matrice):
+        import numpy as np
+        return calculer_distance(np.asarray(population), matrice).tolist()
+    return [calculer_distance(individu, matrice) for individu in population]
+
+def voisins_proches(matrice, k):
+    """Liste des k plus proches voisins de chaque ville (listes de candidats)."""
+    if hasattr(matrice, "voisins_proches"):
+        # Oracle de distances : table précalculée sans parcourir n² paires
+        return matrice.voisins_proches(k)
+    n = len(matrice)
+    k = min(k, n - 1)
+    if est_tableau_numpy(matrice):
+        import numpy as np
+        voisins = []
+        for i in range(n):
+            ligne = matrice[i].copy()
+            ligne[i] = np.inf
+            proches = np.argpartition(ligne, k - 1)[:k]
+            voisins.append(proches[np.argsort(ligne[proches])].tolist())
+        return voisins
+    return [heapq.nsmallest(k, (j for j in range(n) if j != i), key=matrice[i].__getitem__)
+            for i in range(n)]
+
 def calculer_distance_euclidienne(ville1, ville2):
     """Distance euclidienne entre deux villes."""
     return math.sqrt((ville1[0] - ville2[0])**2 + (ville1[1] - ville2[1])**2)
 
+def creer_matrice_numpy(coords, dtype="float64", taille_bloc=1024):
+    """Crée une matrice de distances NumPy contiguë (float32 ou float64) par broadcasting.
+
+    Les lignes sont calculées par blocs pour borner la mémoire temporaire
+    sur les grandes instances.
+    """
+    import numpy as np
+    points = np.asarray(coords, dtype=np.float64)
+    n = len(points)
+    matrice = np.empty((n, n), dtype=dtype)
+    x, y = points[:, 0], points[:, 1]
+    for debut in range(0, n, taille_bloc):
+        fin = min(debut + taille_bloc, n)
+        dx = x[debut:fin, None] - x[None, :]
+        dy = y[debut:fin, None] - y[None, :]
+        dx *= dx
+        dy *= dy
+        dx += dy
+        matrice[debut:fin] = np.sqrt(dx, out=dx)
+    return matrice
+
+def en_matrice_numpy(matrice, dtype="float64"):
+    """Convertit une matrice (liste de listes ou tableau) en tableau NumPy contigu."""
+    import numpy as np
+    return np.ascontiguousarray(matrice, dtype=dtype)
+
 def creer_matrice_depuis_coords(coords):
     """Crée une matrice de distances à partir d'une liste de coordonnées """
-    n = len(coords)
-    matrice = [[0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                matrice[i][j] = calculer_distance_euclidienne(coords[i], coords[j])
-    return matrice
+    if len(coords) > SEUIL_NUMPY:
+        return creer_matrice_numpy(coords).tolist()
+    # Mêmes opérations flottantes que creer_matrice_numpy : résultats identiques
+    points = [(float(x), float(y)) for x, y in coords]
+    return [[math.sqrt((xi - xj) * (xi - xj) + (yi - yj) * (yi - yj)) for xj, yj in points]
+            for xi, yi in points]
+
+class MatriceParesseuse:
+    """Matrice de distances calculée à la demande à partir des coordonnées.
+
+    S'indexe comme une liste de listes (matrice[i][j], len(matrice)) sans
+    jamais stocker les n² distances.
+    """
+
+    def __init__(self, coords, distance=calculer_distance_euclidienne):
+        self.coords = coords
+        self.distance = distance
+
+    def __len__(self):
+        return len(self.coords)
+
+    def __getitem__(self, i):
+        return _LigneParesseuse(self.coords, self.distance, self.coords[i])
+
+class _LigneParesseuse:
+    __slots__ = ("coords", "distance", "origine")
+
+    def __init__(self, coords, distance, origine):
+        self.coords = coords
+        self.distance = distance
+        self.origine = origine
+
+    def __len__(self):
+        return len(self.coords)
+
+    def __getitem__(self, j):
+        return self.distance(self.origine, self.coords[j])